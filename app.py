@@ -1,29 +1,38 @@
-import sys, os, subprocess, datetime, sqlite3
-from pathlib import Path
-from PyQt6 import QtWidgets, QtGui, QtCore
-
-APP_TITLE = "B4RT Mod Launcher"
+import sys, time
+_PROCESS_T0 = time.perf_counter()
 
-# ========= Portable paths (next to EXE/SCRIPT) =========
-def _app_dir() -> Path:
-    # folder of executable when frozen, else script folder
-    if getattr(sys, "frozen", False):
-        return Path(sys.executable).resolve().parent
-    return Path(__file__).resolve().parent
+if __name__ == "__main__" and len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
+    # headless commands (python app.py list|add|run|scan|export): never load Qt
+    import cli
+    sys.exit(cli.main(sys.argv[1:]))
 
-APP_DIR  = _app_dir()
-DATA_DIR = (APP_DIR / "data")
-DB_FILE  = DATA_DIR / "mods.db"
-SETTINGS_FILE = DATA_DIR / "settings.ini"
+import os, subprocess, datetime, struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from PyQt6 import QtWidgets, QtGui, QtCore
 
-def ensure_portable_paths():
-    """Make sure data dir exists and DB file is creatable, show clear error if not."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    try:
-        if not DB_FILE.exists():
-            DB_FILE.touch()
-    except Exception as e:
-        raise RuntimeError(f"Failed to create data folder or DB file.\n\n{DB_FILE}\n\n{e}")
+from launcher_core import (
+    APP_TITLE, APP_DIR, DATA_DIR, DB_FILE, SETTINGS_FILE, ensure_portable_paths,
+    db_init, db_close, db_fetch_all, db_fetch_one, db_distinct_categories, db_insert, db_update, db_delete,
+    db_latest_run, db_queue_list, db_queue_stats, db_queue_clear_finished, JOB_ACTIVE, JOB_CANCELLED,
+    db_thumb_get, db_thumb_put, db_thumb_touch, db_thumb_evict, db_thumb_clear, db_cover_paths,
+    db_cover_hash_get, db_cover_hash_put, cover_digest,
+    human_time, human_clock, human_duration, scan_base_folder, ModSearchIndex,
+    STATUS_RUNNING, STATUS_SUCCEEDED, STATUS_FAILED, RunHandle, ProcessSupervisor, RunScheduler,
+    estimate_queue_etas, status_text, METRICS, timed, cover_source, human_bytes, ResourceMonitor,
+    read_blend_info, db_blend_paths, db_blend_meta_put,
+    db_count_mods, db_fetch_page, db_page_anchor, db_mod_position, db_mod_ids_named,
+    db_data_version, db_change_rev, db_changes_since, db_changes_prune, db_fetch_many,
+    db_runs_recover, STATUS_INTERRUPTED, db_set_journal_mode,
+)
+from launcher_core import _row_get
+
+PIXMAP_CACHE_MAX_BYTES = 192 * 1024 * 1024  # in-memory banner budget (~1000 banners), settings.ini: pixmap_cache_mb
+PAGED_MODEL_THRESHOLD = 20000  # above this many mods the table pages from the DB instead of holding every row
+EXTERNAL_POLL_MS = 1500        # how often to look for other launchers' changes to a shared DB, settings.ini: external_poll_ms
+CHANGE_PATCH_MAX = 2000        # more externally changed mods than this: reload everything instead of patching
+RESOURCE_INTERVAL_MS = 1000    # CPU/RAM sampling of running conversions, settings.ini: resource_interval_ms
 
 # ------------------ Inline QSS ------------------
 INLINE_QSS = """
@@ -36,7 +45,7 @@ QLineEdit { background:#242a33; color:#e6e9ee; border:1px solid #2e3440; border-
 QLineEdit:focus { border:1px solid #3f8edc; }
 QComboBox { background:#242a33; color:#e6e9ee; border:1px solid #2e3440; border-radius:4px; padding:4px 6px; }
 QComboBox QAbstractItemView { background:#242a33; color:#e6e9ee; selection-background-color:#0b6fb8; }
-QTableWidget { background:#1f232b; color:#e6e9ee; gridline-color:#2f3541; alternate-background-color:#1b1f26; selection-background-color:#0b6fb8; selection-color:white; font-size:14px; }
+QTableView { background:#1f232b; color:#e6e9ee; gridline-color:#2f3541; alternate-background-color:#1b1f26; selection-background-color:#0b6fb8; selection-color:white; font-size:14px; }
 QHeaderView::section { background:#262b33; color:#b6beca; padding:6px 8px; border:none; border-right:1px solid #2e3440; }
 QTableCornerButton::section { background:#262b33; border:none; }
 QPushButton { background:#2a313c; color:#e6e9ee; border:1px solid #343b48; border-radius:4px; padding:6px 12px; }
@@ -49,133 +58,1190 @@ def toolbar_spacer(width: int = 8) -> QtWidgets.QWidget:
     w.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
     return w
 
-# ====================== DB LAYER ======================
-def db_connect():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-def _column_exists(con, table, col):
-    cur = con.execute(f"PRAGMA table_info({table})")
-    return any(row[1] == col for row in cur.fetchall())
-
-def db_init():
-    with db_connect() as con:
-        con.execute("""
-            CREATE TABLE IF NOT EXISTS mods (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                cover_path TEXT NOT NULL DEFAULT '',
-                bat_path TEXT NOT NULL DEFAULT '',
-                status TEXT NOT NULL DEFAULT 'Ready',
-                last_run INTEGER NOT NULL DEFAULT 0
-            )
-        """)
-        # migrations
-        if not _column_exists(con, "mods", "version"):
-            con.execute("ALTER TABLE mods ADD COLUMN version TEXT NOT NULL DEFAULT ''")
-        if not _column_exists(con, "mods", "category"):
-            con.execute("ALTER TABLE mods ADD COLUMN category TEXT NOT NULL DEFAULT ''")
-        if not _column_exists(con, "mods", "blend_path"):
-            con.execute("ALTER TABLE mods ADD COLUMN blend_path TEXT NOT NULL DEFAULT ''")
-        if not _column_exists(con, "mods", "work_path"):
-            con.execute("ALTER TABLE mods ADD COLUMN work_path TEXT NOT NULL DEFAULT ''")
-        con.commit()
-
-def db_fetch_all(name_filter: str | None = None, category_filter: str | None = None):
-    with db_connect() as con:
-        q = "SELECT * FROM mods WHERE 1=1"
-        args = []
-        if name_filter:
-            q += " AND LOWER(name) LIKE ?"
-            args.append(f"%{name_filter.lower()}%")
-        if category_filter and category_filter.lower() != "__all__":
-            q += " AND category = ?"
-            args.append(category_filter)
-        q += " ORDER BY name ASC"
-        return list(con.execute(q, args))
-
-def db_distinct_categories():
-    with db_connect() as con:
-        rows = con.execute(
-            "SELECT DISTINCT category FROM mods WHERE TRIM(category) <> '' ORDER BY category COLLATE NOCASE"
-        ).fetchall()
-        return [r[0] for r in rows if r[0]]
-
-def db_insert(mod: dict) -> int:
-    with db_connect() as con:
-        cur = con.execute("""
-            INSERT INTO mods (name, cover_path, bat_path, status, last_run, version, category, blend_path, work_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            mod.get("name",""),
-            mod.get("cover_path",""),
-            mod.get("bat_path",""),
-            mod.get("status","Ready"),
-            int(mod.get("last_run", 0)),
-            mod.get("version","").strip(),
-            mod.get("category","").strip(),
-            mod.get("blend_path","").strip(),
-            mod.get("work_path","").strip(),
-        ))
-        con.commit()
-        return cur.lastrowid
-
-def db_update(mod_id: int, mod: dict):
-    with db_connect() as con:
-        con.execute("""
-            UPDATE mods
-               SET name = ?, cover_path = ?, bat_path = ?, status = ?, last_run = ?, version = ?, category = ?, blend_path = ?, work_path = ?
-             WHERE id = ?
-        """, (
-            mod.get("name",""),
-            mod.get("cover_path",""),
-            mod.get("bat_path",""),
-            mod.get("status","Ready"),
-            int(mod.get("last_run", 0)),
-            mod.get("version","").strip(),
-            mod.get("category","").strip(),
-            mod.get("blend_path","").strip(),
-            mod.get("work_path","").strip(),
-            mod_id
-        ))
-        con.commit()
-
-def db_delete(mod_id: int):
-    with db_connect() as con:
-        con.execute("DELETE FROM mods WHERE id = ?", (mod_id,))
-        con.commit()
-
-def db_update_run(mod_id: int, status: str, last_run_ts: int):
-    with db_connect() as con:
-        con.execute("UPDATE mods SET status = ?, last_run = ? WHERE id = ?",
-                    (status, int(last_run_ts), mod_id))
-        con.commit()
-
 # ====================== UTIL ======================
-def human_time(ts: int | float):
-    try:
-        return datetime.datetime.fromtimestamp(int(ts)).strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return ""
+class StartupProfile:
+    """Phase timings for --profile-startup; mark() is a no-op unless enabled."""
+    def __init__(self):
+        self.enabled = False
+        self.marks: list[tuple[str, float]] = []
+
+    def start(self, name: str, t: float):
+        self.marks = [(name, t)]
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.marks.append((name, time.perf_counter()))
+
+    def report(self):
+        if not self.enabled or len(self.marks) < 2:
+            return
+        self.enabled = False
+        t0 = prev = self.marks[0][1]
+        print("[STARTUP] phase                          ms    total")
+        for name, t in self.marks[1:]:
+            print(f"[STARTUP] {name:<28} {(t - prev) * 1000:8.1f} {(t - t0) * 1000:8.1f}")
+            prev = t
+
+STARTUP = StartupProfile()
 
 def load_styles(app: QtWidgets.QApplication):
     QtWidgets.QApplication.setStyle("Fusion")
     app.setStyleSheet(INLINE_QSS)
 
-# ---------- Cover cell widget (image only) ----------
-class CoverCell(QtWidgets.QLabel):
-    def __init__(self, cover_path: str, w: int, h: int, parent=None):
+# ====================== TABLE MODEL ======================
+COLUMNS = ["ID", "Cover", "MOD NAME", "Version", "Category", "Last Run", "Status", "CPU / RAM", "Median / P95",
+           "Success", "Path", "Blend Path"]
+(COL_ID, COL_COVER, COL_NAME, COL_VERSION, COL_CATEGORY, COL_LAST_RUN, COL_STATUS, COL_RESOURCES, COL_DURATION,
+ COL_SUCCESS, COL_PATH, COL_BLEND) = range(len(COLUMNS))
+
+STATUS_COLORS = {
+    STATUS_RUNNING: QtGui.QColor("#e0b341"),
+    STATUS_SUCCEEDED: QtGui.QColor("#5cb85c"),
+    STATUS_FAILED: QtGui.QColor("#e05252"),
+    STATUS_INTERRUPTED: QtGui.QColor("#9a9a9a"),
+}
+
+MOD_ID_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
+COVER_PATH_ROLE = QtCore.Qt.ItemDataRole.UserRole + 2
+RESOURCE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 3   # ResourceMonitor samples of a running mod
+
+class _ModRowsModel(QtCore.QAbstractTableModel):
+    """Columns/formatting shared by both table models; subclasses provide rowCount() and row_at()."""
+    def __init__(self, parent=None, name_font: QtGui.QFont | None = None):
+        super().__init__(parent)
+        self._name_font = name_font
+        self.path_validator: "PathValidator | None" = None
+        self.path_icons: dict[str, QtGui.QIcon] = {}
+        self.resource_monitor: ResourceMonitor | None = None
+
+    # ----- Qt model API -----
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self.row_at(index.row())
+        if r is None:
+            return None
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == COL_ID: return str(r["id"])
+            if col == COL_NAME: return r["name"]
+            if col == COL_VERSION: return r["version"] or ""
+            if col == COL_CATEGORY: return r["category"] or ""
+            if col == COL_LAST_RUN:
+                last = r["last_run"] or 0
+                return human_time(last) if last else ""
+            if col == COL_STATUS: return status_text(r)
+            if col == COL_RESOURCES:
+                last = self.resource_monitor.latest(r["id"]) if self.resource_monitor else None
+                return f"{last[1]:.0f}%  {human_bytes(last[2])}" if last else ""
+            if col == COL_DURATION:
+                med = r["median_duration"]
+                return f"{human_duration(med)} / {human_duration(r['p95_duration'])}" if med is not None else ""
+            if col == COL_SUCCESS:
+                runs = r["run_count"]
+                return f"{(r['run_successes'] or 0) / runs:.0%} of {runs}" if runs else ""
+            if col == COL_PATH: return r["bat_path"] or ""
+            if col == COL_BLEND:
+                ver = r["blend_version"]
+                return f"{r['blend_path']}  (Blender {ver})" if ver else r["blend_path"]
+            return None
+        if role == QtCore.Qt.ItemDataRole.FontRole and col == COL_NAME:
+            return self._name_font
+        if col == COL_NAME and self.path_validator is not None and role in (
+                QtCore.Qt.ItemDataRole.DecorationRole, QtCore.Qt.ItemDataRole.ToolTipRole):
+            problems = self.path_validator.problems(r)
+            if not problems:
+                return None
+            if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+                return "\n".join(f"{label} {state}: {p}" for label, p, state in problems)
+            worst = PATH_MISSING if any(st == PATH_MISSING for _l, _p, st in problems) else PATH_UNREACHABLE
+            return self.path_icons.get(worst)
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and col == COL_BLEND and r["blend_version"]:
+            comp = r["blend_compression"]
+            return f"Saved with Blender {r['blend_version']}" + (f", {comp}-compressed" if comp else "")
+        if col == COL_RESOURCES and self.resource_monitor is not None:
+            if role == RESOURCE_ROLE:
+                return self.resource_monitor.samples(r["id"])
+            if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+                last, peaks = self.resource_monitor.latest(r["id"]), self.resource_monitor.peaks(r["id"])
+                if last is None:
+                    return None
+                return (f"CPU {last[1]:.0f}% (peak {peaks['peak_cpu']:.0f}%)\n"
+                        f"Memory {human_bytes(last[2])} (peak {human_bytes(peaks['peak_rss'])})\n"
+                        f"Disk read {human_bytes(last[3])}/s, write {human_bytes(last[4])}/s")
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole and col == COL_STATUS:
+            return STATUS_COLORS.get(r["status"])
+        if role == COVER_PATH_ROLE:
+            return cover_source(r)
+        if role == MOD_ID_ROLE:
+            return int(r["id"])
+        return None
+
+class ModTableModel(_ModRowsModel):
+    """Table model over the fetched mod rows.
+
+    set_rows() diffs the new result against the current one by mod id and
+    emits insert/remove/dataChanged for just the rows that differ, so views
+    keep their selection and scroll position and only repaint what changed.
+    When most of the table changes at once a plain reset is cheaper than
+    thousands of row signals, so it falls back to that.
+    """
+    RESET_THRESHOLD = 2000  # structural row changes above which set_rows() resets
+    def __init__(self, parent=None, name_font: QtGui.QFont | None = None):
+        super().__init__(parent, name_font)
+        self.rows = []
+        self._pos: dict[int, int] | None = None   # id -> row; rebuilt on first lookup after rows move
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def row_at(self, i: int):
+        return self.rows[i] if 0 <= i < len(self.rows) else None
+
+    # ----- lookups -----
+    def row_of_id(self, mod_id: int) -> int:
+        if self._pos is None:
+            self._pos = {r["id"]: i for i, r in enumerate(self.rows)}
+        return self._pos.get(mod_id, -1)
+
+    # ----- diffing -----
+    def update_row(self, row) -> bool:
+        """Swap in a fresh copy of one mod (same id) and repaint just that row."""
+        i = self.row_of_id(row["id"])
+        if i < 0:
+            return False
+        self.rows[i] = row
+        self.dataChanged.emit(self.index(i, 0), self.index(i, len(COLUMNS) - 1))
+        return True
+
+    def set_rows(self, new_rows):
+        new_rows = list(new_rows)
+        self._pos = None
+        new_ids = {r["id"] for r in new_rows}
+        kept = sum(1 for r in self.rows if r["id"] in new_ids)
+        if (len(self.rows) - kept) + (len(new_rows) - kept) > self.RESET_THRESHOLD:
+            self.beginResetModel()
+            self.rows = new_rows
+            self.endResetModel()
+            return
+
+        # 1) drop rows that are gone (contiguous runs, bottom-up)
+        i = len(self.rows) - 1
+        while i >= 0:
+            if self.rows[i]["id"] in new_ids:
+                i -= 1
+                continue
+            end = i
+            while i >= 0 and self.rows[i]["id"] not in new_ids:
+                i -= 1
+            self._remove(i + 1, end)
+
+        # 2) walk the new order; rows that moved are removed here and re-inserted later
+        present = {r["id"] for r in self.rows}
+        pos = 0
+        while pos < len(new_rows):
+            want = new_rows[pos]
+            if pos < len(self.rows) and self.rows[pos]["id"] == want["id"]:
+                if self.rows[pos] is not want and self.rows[pos] != want:
+                    self.rows[pos] = want
+                    self.dataChanged.emit(self.index(pos, 0), self.index(pos, len(COLUMNS) - 1))
+                pos += 1
+            elif want["id"] in present:
+                present.discard(self.rows[pos]["id"])
+                self._remove(pos, pos)
+            else:
+                end = pos
+                while end + 1 < len(new_rows) and new_rows[end + 1]["id"] not in present:
+                    end += 1
+                self.beginInsertRows(QtCore.QModelIndex(), pos, end)
+                self.rows[pos:pos] = new_rows[pos:end + 1]
+                self.endInsertRows()
+                pos = end + 1
+
+        # 3) anything left over at the tail was moved to an earlier position
+        if len(self.rows) > len(new_rows):
+            self._remove(len(new_rows), len(self.rows) - 1)
+
+    def _remove(self, first: int, last: int):
+        self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+        del self.rows[first:last + 1]
+        self.endRemoveRows()
+
+class PagedModTableModel(_ModRowsModel):
+    """Table model for very large libraries: rows are fetched from the DB a page at a time as the view asks.
+
+    rowCount() is the filtered total (one COUNT), so the scrollbar covers the
+    whole library, but only MAX_PAGES pages of PAGE_SIZE rows are held (LRU).
+    A page is read by keyset from a neighbouring cached page (after its last
+    or before its first (name, id) key); a jump far from any cached page
+    first looks up that position's key on the (name, id) index.
+    """
+    PAGE_SIZE = 200
+    MAX_PAGES = 20   # ~4000 rows in memory
+
+    def __init__(self, parent=None, name_font: QtGui.QFont | None = None):
+        super().__init__(parent, name_font)
+        self.query, self.category = "", None
+        self._count = 0
+        self._pages: OrderedDict[int, list] = OrderedDict()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def set_query(self, query: str, category: str | None):
+        """New search/category (or data changed underneath): recount and drop every cached page."""
+        self.beginResetModel()
+        self.query, self.category = query, category
+        self._pages.clear()
+        self._count = db_count_mods(query, category)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._pages.clear()
+        self._count = 0
+        self.endResetModel()
+
+    def row_at(self, i: int):
+        if not 0 <= i < self._count:
+            return None
+        p, off = divmod(i, self.PAGE_SIZE)
+        page = self._page(p)
+        return page[off] if off < len(page) else None
+
+    def _page(self, p: int) -> list:
+        page = self._pages.get(p)
+        if page is not None:
+            self._pages.move_to_end(p)
+            return page
+        with METRICS.timer("page.fetch"):
+            page = self._fetch(p)
+        self._pages[p] = page
+        while len(self._pages) > self.MAX_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def _fetch(self, p: int) -> list:
+        q, c, n = self.query, self.category, self.PAGE_SIZE
+        key = lambda r: (r["name"], r["id"])
+        if p == 0:
+            return db_fetch_page(q, c, limit=n)
+        prev, nxt = self._pages.get(p - 1), self._pages.get(p + 1)
+        if prev and len(prev) == n:
+            return db_fetch_page(q, c, after=key(prev[-1]), limit=n)
+        if nxt:
+            return db_fetch_page(q, c, before=key(nxt[0]), limit=n)
+        anchor = db_page_anchor(q, c, p * n)
+        return db_fetch_page(q, c, after=anchor, inclusive=True, limit=n) if anchor else []
+
+    def _cached(self):
+        for p, page in self._pages.items():
+            for off, r in enumerate(page):
+                yield p * self.PAGE_SIZE + off, r
+
+    def row_of_id(self, mod_id: int) -> int:
+        for i, r in self._cached():
+            if r["id"] == mod_id:
+                return i
+        return db_mod_position(mod_id, self.query, self.category)
+
+    def apply_changes(self, records, deleted_ids):
+        """Fold in mods changed elsewhere: patch cached rows when no row can have moved, else re-query.
+
+        Only cached rows are known to have stayed put. An uncached row may
+        have been renamed from before a cached page to after it (shifting
+        every row in between), and its old key is unknown, so any uncached
+        change means a re-query.
+        """
+        cached = {r["id"]: r for _i, r in self._cached()}
+        in_place = (not deleted_ids and db_count_mods(self.query, self.category) == self._count
+                    and all(r.id in cached and cached[r.id].name == r.name for r in records))
+        if not in_place:
+            self.set_query(self.query, self.category)
+            return
+        for r in records:
+            if r.id in cached:
+                self.update_row(r)
+
+    def update_row(self, row) -> bool:
+        """Patch a cached copy (status changes); uncached rows are read fresh when scrolled to."""
+        for i, r in self._cached():
+            if r["id"] == row["id"]:
+                page = self._pages[i // self.PAGE_SIZE]
+                page[i % self.PAGE_SIZE] = row
+                self.dataChanged.emit(self.index(i, 0), self.index(i, len(COLUMNS) - 1))
+                return True
+        return False
+
+# ====================== PATH VALIDATION ======================
+PATH_OK, PATH_MISSING, PATH_UNREACHABLE = "ok", "missing", "unreachable"
+MOD_PATH_FIELDS = (("bat_path", "BAT/CMD"), ("blend_path", "Blend file"), ("cover_path", "Cover"),
+                   ("work_path", "Project folder"))
+
+class PathValidator(QtCore.QObject):
+    """Existence checks for mod paths, off the GUI thread, cached.
+
+    check() queues the paths it has no fresh answer for; they are probed
+    per directory on a worker pool (one stat of the directory, then its
+    files), so a dead share ties up one worker per directory, not per file.
+    A directory whose probe has been running for TIMEOUT seconds has its
+    paths marked unreachable until the stat comes back; time spent waiting
+    for a free worker doesn't count. Directories that answered
+    are put on a QFileSystemWatcher; a change there re-probes the paths in
+    it. Answers for unwatched directories go stale after STALE_AFTER.
+    state() only reads the cache, so the UI never waits on a stat.
+    """
+    changed = QtCore.pyqtSignal(object)         # set of paths whose state changed
+    _probed = QtCore.pyqtSignal(str, object, bool)   # dir, {path: state}, dir exists; emitted from workers
+    TIMEOUT = 3.0
+    STALE_AFTER = 300.0
+    MAX_WORKERS = 16
+    MAX_WATCHED_DIRS = 4000   # OS watch handles are finite; beyond this rely on STALE_AFTER
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._states: dict[str, tuple[str, float]] = {}     # path -> (state, checked at)
+        self._by_dir: dict[str, set[str]] = {}
+        self._pending: dict[str, list] = {}                 # dir -> [paths, timed out]
+        self._started: dict[str, float] = {}                # dir -> when a worker began probing it (set by workers)
+        self._queued: dict[str, set[str]] = {}              # paths asked for while their dir was pending
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="pathcheck")
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._dir_changed)
+        self._probed.connect(self._on_probed)
+        self._sweep = QtCore.QTimer(self, interval=500)
+        self._sweep.timeout.connect(self._expire)
+
+    def state(self, path: str) -> str | None:
+        entry = self._states.get(path)
+        return entry[0] if entry else None
+
+    def problems(self, row) -> list[tuple[str, str, str]]:
+        """(label, path, state) for each of the row's paths that is missing or unreachable; queues unknown ones."""
+        out, unknown = [], []
+        for key, label in MOD_PATH_FIELDS:
+            p = (_row_get(row, key) or "").strip()
+            if not p:
+                continue
+            st = self.state(p)
+            if st is None:
+                unknown.append(p)
+            elif st != PATH_OK:
+                out.append((label, p, st))
+        if unknown:
+            self.check(unknown)
+        return out
+
+    def check_rows(self, rows):
+        self.check((_row_get(r, key) or "").strip() for r in rows for key, _label in MOD_PATH_FIELDS)
+
+    def check(self, paths, force: bool = False):
+        if self._closed:
+            return
+        now = time.time()
+        watched = set(self._watcher.directories())
+        by_dir: dict[str, set[str]] = {}
+        for p in paths:
+            if not p:
+                continue
+            d = os.path.dirname(p)
+            entry = self._states.get(p)
+            if not force and entry is not None and (d in watched or now - entry[1] < self.STALE_AFTER):
+                continue
+            by_dir.setdefault(d, set()).add(p)
+        for d, ps in by_dir.items():
+            self._by_dir.setdefault(d, set()).update(ps)
+            if d in self._pending:
+                self._queued.setdefault(d, set()).update(ps)
+                continue
+            self._pending[d] = [ps, False]
+            self._executor.submit(self._probe, d, ps)
+        if self._pending and not self._sweep.isActive():
+            self._sweep.start()
+
+    def _probe(self, d: str, paths: set[str]):
+        # worker thread: plain stats, no Qt objects touched
+        self._started[d] = time.time()
+        try:
+            if d:
+                os.stat(d)
+        except OSError:
+            result, dir_ok = {p: PATH_MISSING for p in paths}, False
+        else:
+            result, dir_ok = {p: PATH_OK if os.path.exists(p) else PATH_MISSING for p in paths}, True
+        if not self._closed:
+            self._probed.emit(d, result, dir_ok)
+
+    def _on_probed(self, d: str, result: dict, dir_ok: bool):
+        self._pending.pop(d, None)
+        self._started.pop(d, None)
+        now = time.time()
+        changed = {p for p, st in result.items() if self.state(p) != st}
+        for p, st in result.items():
+            self._states[p] = (st, now)
+        if d and dir_ok and len(self._watcher.directories()) < self.MAX_WATCHED_DIRS:
+            self._watcher.addPath(d)
+        if changed:
+            self.changed.emit(changed)
+        queued = self._queued.pop(d, None)
+        if queued:
+            self.check(queued, force=True)
+
+    def _expire(self):
+        now = time.time()
+        changed = set()
+        for d, entry in self._pending.items():
+            paths, timed_out = entry
+            started = self._started.get(d)
+            if not timed_out and started is not None and now - started > self.TIMEOUT:
+                entry[1] = True
+                for p in paths:
+                    if self.state(p) != PATH_UNREACHABLE:
+                        changed.add(p)
+                    self._states[p] = (PATH_UNREACHABLE, now)
+        if not self._pending:
+            self._sweep.stop()
+        if changed:
+            self.changed.emit(changed)
+
+    def _dir_changed(self, d: str):
+        self.check(self._by_dir.get(d, ()), force=True)
+
+    def shutdown(self):
+        self._closed = True
+        self._sweep.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# ====================== COVER LOADING ======================
+@timed("cover.decode")
+def decode_cover(path: str, w: int, h: int) -> QtGui.QImage:
+    """Decode a cover straight at banner size (JPEG decodes at reduced scale, others scale in the reader).
+
+    A .blend gives its embedded preview (see read_blend_info), scaled up to the banner.
+    """
+    if path.lower().endswith(".blend"):
+        return decode_blend_thumb(path, w, h)
+    reader = QtGui.QImageReader(path)
+    reader.setAutoTransform(True)
+    if not reader.canRead():
+        return QtGui.QImage()
+    reader.setScaledSize(QtCore.QSize(w, h))
+    img = reader.read()
+    if img.isNull():
+        return img
+    if img.width() != w or img.height() != h:
+        img = img.scaled(w, h, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                         QtCore.Qt.TransformationMode.SmoothTransformation)
+    return img
+
+def decode_blend_thumb(path: str, w: int, h: int) -> QtGui.QImage:
+    try:
+        info = read_blend_info(path)
+    except (OSError, ValueError, EOFError, struct.error):
+        return QtGui.QImage()
+    if info is None or info["thumb"] is None:
+        return QtGui.QImage()
+    img = QtGui.QImage(info["thumb"], info["thumb_w"], info["thumb_h"], info["thumb_w"] * 4,
+                       QtGui.QImage.Format.Format_RGBA8888)
+    # previews are square; crop to the banner's aspect instead of stretching
+    tw, th = img.width(), img.width() * h // w
+    if th > img.height():
+        tw, th = img.height() * w // h, img.height()
+    img = img.copy((img.width() - tw) // 2, (img.height() - th) // 2, tw, th)
+    return img.scaled(w, h, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                      QtCore.Qt.TransformationMode.SmoothTransformation)
+
+def encode_thumb(img: QtGui.QImage) -> bytes:
+    """Serialize a banner for thumb_cache: JPEG when opaque, PNG when it has alpha."""
+    buf = QtCore.QBuffer()
+    buf.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    if img.hasAlphaChannel():
+        img.save(buf, "PNG")
+    else:
+        img.save(buf, "JPG", 88)
+    return bytes(buf.data())
+
+def _cover_hash(path: str, st: os.stat_result, known) -> str:
+    """Digest of `path`: the recorded one while mtime/size match, otherwise hashed again and recorded."""
+    if known is not None and known["src_mtime"] == st.st_mtime_ns and known["src_size"] == st.st_size:
+        return known["digest"]
+    digest = cover_digest(path)
+    db_cover_hash_put(path, st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+def load_thumb(path: str, w: int, h: int, on_image=None, is_cancelled=lambda: False,
+               have=lambda digest: False) -> QtGui.QImage:
+    """Banner for `path` through the persistent, content-addressed thumb_cache.
+
+    Covers are identified by a hash of their content (see cover_digest), so
+    copies of one image at different paths are decoded and stored once.
+    The digest last recorded for the path is used to hand a cached banner
+    to on_image(img, digest) before the source is looked at, so a cold
+    start paints from the DB alone. The source is then only stat'ed; it is
+    hashed again just when its mtime/size changed, and decoded just when
+    that new content has no banner yet. If the source can't be stat'ed
+    (offline share) the cached banner is kept. When have(digest) says the
+    caller already holds that content, on_image gets a null image instead.
+    """
+    known = db_cover_hash_get(path)
+    cached_img = QtGui.QImage()
+    if known is not None and known["digest"]:
+        cached_img = _cached_banner(known["digest"], w, h, on_image, have)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return cached_img
+    if is_cancelled():
+        return cached_img
+    try:
+        digest = _cover_hash(path, st, known)
+    except (OSError, ValueError, EOFError, struct.error):
+        return cached_img
+    if not digest:
+        return QtGui.QImage()
+    if known is not None and digest == known["digest"]:
+        if have(digest) or not cached_img.isNull():
+            METRICS.count("thumb_cache.hit")
+            return cached_img
+    else:
+        img = _cached_banner(digest, w, h, on_image, have)
+        if have(digest) or not img.isNull():
+            METRICS.count("thumb_cache.shared")   # same content already cached under another path
+            return img
+    if is_cancelled():
+        return cached_img
+    METRICS.count("thumb_cache.miss" if known is None else "thumb_cache.stale")
+    img = decode_cover(path, w, h)
+    if not img.isNull():
+        db_thumb_put(digest, w, h, encode_thumb(img))
+        if on_image:
+            on_image(img, digest)
+    return img
+
+def _cached_banner(digest: str, w: int, h: int, on_image, have) -> QtGui.QImage:
+    if have(digest):
+        if on_image:
+            on_image(QtGui.QImage(), digest)
+        return QtGui.QImage()
+    cached = db_thumb_get(digest, w, h)
+    if cached is None:
+        return QtGui.QImage()
+    img = QtGui.QImage.fromData(cached["data"])
+    if img.isNull():
+        return img
+    if on_image:
+        on_image(img, digest)
+    if int(datetime.datetime.now().timestamp()) - cached["last_used"] > 86400:
+        db_thumb_touch(digest, w, h)
+    return img
+
+class _CoverJob(QtCore.QRunnable):
+    def __init__(self, loader: "CoverLoader", path: str, w: int, h: int):
+        super().__init__()
+        self.setAutoDelete(False)  # the loader keeps it so it can be cancelled
+        self.loader, self.path, self.w, self.h = loader, path, w, h
+        self.cancelled = False
+
+    def run(self):
+        try:
+            if not self.cancelled:
+                load_thumb(self.path, self.w, self.h,
+                           on_image=lambda img, digest: self.loader._decoded.emit(self, img, digest),
+                           is_cancelled=lambda: self.cancelled,
+                           have=self.loader._has_digest)
+                self.loader._stored()
+        finally:
+            self.loader._finished.emit(self)
+
+class _ThumbRebuildJob(QtCore.QRunnable):
+    def __init__(self, loader: "CoverLoader", paths: list[str]):
+        super().__init__()
+        self.loader, self.paths = loader, paths
+
+    def run(self):
+        total = len(self.paths)
+        for i, path in enumerate(self.paths, 1):
+            load_thumb(path, self.loader.w, self.loader.h)
+            self.loader.rebuild_progress.emit(i, total)
+        db_thumb_evict()
+
+class PixmapCache:
+    """Process-wide LRU of scaled cover pixmaps with a byte budget.
+
+    Entries are keyed by (content digest, w, h), so every mod whose cover
+    has the same content shares one pixmap; a changed file gets a new
+    digest rather than replacing the entry. GUI thread only (QPixmap);
+    `in` may be asked from workers.
+    """
+    def __init__(self, max_bytes: int = PIXMAP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[QtGui.QPixmap, int]] = OrderedDict()
+
+    @staticmethod
+    def _cost(pix: QtGui.QPixmap) -> int:
+        return pix.width() * pix.height() * max(pix.depth(), 8) // 8
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def get(self, digest: str, w: int, h: int) -> QtGui.QPixmap | None:
+        key = (digest, w, h)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek(self, digest: str, w: int, h: int) -> QtGui.QPixmap | None:
+        """Like get() but without touching LRU order or counters."""
+        entry = self._entries.get((digest, w, h))
+        return entry[0] if entry else None
+
+    def put(self, digest: str, w: int, h: int, pix: QtGui.QPixmap):
+        key = (digest, w, h)
+        self._drop(key)
+        cost = self._cost(pix)
+        if cost > self.max_bytes:
+            return
+        self._entries[key] = (pix, cost)
+        self.bytes += cost
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def set_budget(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _key, (_p, cost) = self._entries.popitem(last=False)
+            self.bytes -= cost
+            self.evictions += 1
+
+PIXMAP_CACHE = PixmapCache()
+METRICS.add_collector("pixmap_cache", PIXMAP_CACHE.stats)
+
+class CoverLoader(QtCore.QObject):
+    """Decodes cover banners on a bounded worker pool.
+
+    pixmap() never blocks: it returns what is ready (or None) and queues a
+    load for anything missing. Loads go through the persistent thumb_cache
+    (see load_thumb) and land in the shared PIXMAP_CACHE, so they survive
+    refreshes. Each path is resolved to its content digest once; paths with
+    the same content then share one pixmap and one decode. retain() cancels
+    queued work for covers that are no longer on screen. `loaded` fires on
+    the GUI thread once a cover is ready.
+    """
+    loaded = QtCore.pyqtSignal(str)
+    rebuild_progress = QtCore.pyqtSignal(int, int)
+    _decoded = QtCore.pyqtSignal(object, QtGui.QImage, str)
+    _finished = QtCore.pyqtSignal(object)
+
+    MAX_THREADS = 4
+    EVICT_EVERY = 64  # thumb_cache eviction check every N loads
+
+    def __init__(self, w: int, h: int, parent=None, cache: PixmapCache | None = None):
         super().__init__(parent)
-        self.setFixedSize(w, h)
-        self.setScaledContents(True)
-        if cover_path and Path(cover_path).exists():
-            pix = QtGui.QPixmap(cover_path)
-            if not pix.isNull():
-                scaled = pix.scaled(w, h,
-                                    QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                    QtCore.Qt.TransformationMode.SmoothTransformation)
-                self.setPixmap(scaled)
+        self.w, self.h = w, h
+        self.cache = cache or PIXMAP_CACHE
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(self.MAX_THREADS, os.cpu_count() or 1)))
+        self._digests: dict[str, str] = {}   # path -> content digest, as last resolved
+        self._missing: set[str] = set()   # unreadable/missing covers, not retried until forget()
+        self._pending: dict[str, _CoverJob] = {}
+        self._loads = 0
+        self._decoded.connect(self._on_decoded)
+        self._finished.connect(self._on_finished)
+
+    def pixmap(self, path: str) -> QtGui.QPixmap | None:
+        if not path:
+            return None
+        digest = self._digests.get(path)
+        if path in self._pending:
+            return self.cache.peek(digest, self.w, self.h) if digest else None
+        if path in self._missing:
+            return None
+        if digest:
+            pix = self.cache.get(digest, self.w, self.h)
+            if pix is not None:
+                return pix
+        job = _CoverJob(self, path, self.w, self.h)
+        self._pending[path] = job
+        self.pool.start(job)
+        return None
+
+    def is_pending(self, path: str) -> bool:
+        return path in self._pending
+
+    def stats(self) -> dict:
+        return {"paths": len(self._digests), "unique": len(set(self._digests.values()))}
+
+    def retain(self, paths):
+        """Cancel queued/running loads for covers not in `paths`."""
+        keep = set(paths)
+        for path in [p for p in self._pending if p not in keep]:
+            job = self._pending.pop(path)
+            job.cancelled = True
+            self.pool.tryTake(job)
+
+    def forget(self, path: str):
+        # the pixmap itself stays: other paths may share its content
+        self._digests.pop(path, None)
+        self._missing.discard(path)
+        job = self._pending.pop(path, None)
+        if job is not None:
+            job.cancelled = True
+            self.pool.tryTake(job)
+
+    def rebuild(self, paths: list[str]):
+        """Drop every cached banner (memory and thumb_cache) and regenerate `paths` in the background."""
+        self.retain(())
+        self.cache.clear()
+        self._digests.clear()
+        self._missing.clear()
+        db_thumb_clear()
+        self.pool.start(_ThumbRebuildJob(self, list(paths)))
+
+    def shutdown(self):
+        self.retain(())
+        self.pool.clear()
+        self.pool.waitForDone(2000)
+
+    def _has_digest(self, digest: str) -> bool:
+        # asked from workers: a banner for this content is already in memory, skip the DB read/decode
+        return (digest, self.w, self.h) in self.cache
+
+    def _stored(self):
+        # called from workers; an occasional lost increment is harmless
+        self._loads += 1
+        if self._loads % self.EVICT_EVERY == 0:
+            db_thumb_evict()
+
+    def _on_decoded(self, job: _CoverJob, img: QtGui.QImage, digest: str):
+        if self._pending.get(job.path) is not job:
+            return  # cancelled or superseded
+        self._digests[job.path] = digest
+        if not img.isNull() and (digest, self.w, self.h) not in self.cache:
+            self.cache.put(digest, self.w, self.h, QtGui.QPixmap.fromImage(img))
+        self.loaded.emit(job.path)
+
+    def _on_finished(self, job: _CoverJob):
+        if self._pending.get(job.path) is not job:
+            return
+        del self._pending[job.path]
+        digest = self._digests.get(job.path)
+        if digest is None:
+            self._missing.add(job.path)
+        elif self.cache.peek(digest, self.w, self.h) is None:
+            del self._digests[job.path]   # shared pixmap was evicted meanwhile; the next paint reloads it
+        self.loaded.emit(job.path)
+
+# ---------- Cover delegate (image only) ----------
+class CoverDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the cover banner for visible rows only; shows a placeholder until the loader has it."""
+    PLACEHOLDER = QtGui.QColor("#262b33")
+
+    def __init__(self, loader: CoverLoader, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.w, self.h = loader.w, loader.h
+
+    def paint(self, painter, option, index):
+        # background / selection from the style, no text
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        path = index.data(COVER_PATH_ROLE)
+        target = QtCore.QRect(0, 0, self.w, self.h)
+        target.moveCenter(option.rect.center())
+        pix = self.loader.pixmap(path)
+        if pix is not None:
+            painter.drawPixmap(target, pix)
+        elif self.loader.is_pending(path):
+            painter.fillRect(target, self.PLACEHOLDER)
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(self.w + 4, self.h + 18)
+
+# ---------- CPU/RAM sparklines ----------
+class SparklineDelegate(QtWidgets.QStyledItemDelegate):
+    """CPU% (and memory, scaled to its own peak) of a running conversion as sparklines under the current values."""
+    CPU_COLOR = QtGui.QColor("#4fa3e0")
+    RSS_COLOR = QtGui.QColor("#e0b341")
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        samples = index.data(RESOURCE_ROLE)
+        if not samples:
+            super().paint(painter, option, index)
+            return
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+        r = option.rect.adjusted(4, 4, -4, -4)
+        text_h = opt.fontMetrics.height()
+        chart = QtCore.QRectF(r.left(), r.top() + text_h + 4, r.width(), max(8, r.height() - text_h - 4))
+        cpu_top = max(100.0, max(s[1] for s in samples))
+        rss_top = max(s[2] for s in samples) or 1
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        step = chart.width() / max(1, len(samples) - 1)
+        for color, value, top in ((self.RSS_COLOR, 2, rss_top), (self.CPU_COLOR, 1, cpu_top)):
+            painter.setPen(QtGui.QPen(color, 1.5))
+            painter.drawPolyline(QtGui.QPolygonF([
+                QtCore.QPointF(chart.left() + i * step, chart.bottom() - s[value] / top * chart.height())
+                for i, s in enumerate(samples)]))
+        painter.setPen(opt.palette.color(QtGui.QPalette.ColorRole.HighlightedText
+                                         if opt.state & QtWidgets.QStyle.StateFlag.State_Selected
+                                         else QtGui.QPalette.ColorRole.Text))
+        painter.drawText(QtCore.QRect(r.left(), r.top(), r.width(), text_h),
+                         QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, opt.text)
+        painter.restore()
+
+# ---------- run supervisor bridge ----------
+class RunSignals(QtCore.QObject):
+    """Carries supervisor callbacks (reaper threads) over to the GUI thread."""
+    finished = QtCore.pyqtSignal(object)   # RunHandle
+
+class QueueSignals(QtCore.QObject):
+    changed = QtCore.pyqtSignal()
+
+# ---------- run queue panel ----------
+class RunQueueDock(QtWidgets.QDockWidget):
+    """Queued/running/recent jobs with pause, cancel, priority and concurrency controls."""
+    HEADERS = ["Job", "Mod", "Priority", "State", "Waited", "Duration", "ETA"]
+
+    def __init__(self, scheduler: RunScheduler, parent=None):
+        super().__init__("Run Queue", parent)
+        self.scheduler = scheduler
+        self.setObjectName("RunQueueDock")
+
+        self.stats_label = QtWidgets.QLabel()
+        self.pause_btn = QtWidgets.QPushButton("Pause")
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.toggled.connect(self._toggle_pause)
+        self.pause_btn.setChecked(scheduler.paused)
+        up_btn = QtWidgets.QPushButton("Priority ▲"); up_btn.clicked.connect(lambda: self._bump(+1))
+        down_btn = QtWidgets.QPushButton("Priority ▼"); down_btn.clicked.connect(lambda: self._bump(-1))
+        cancel_btn = QtWidgets.QPushButton("Cancel"); cancel_btn.clicked.connect(self._cancel_selected)
+        clear_btn = QtWidgets.QPushButton("Clear Finished"); clear_btn.clicked.connect(self._clear_finished)
+        self.limit_spin = QtWidgets.QSpinBox()
+        self.limit_spin.setRange(1, 256)
+        self.limit_spin.setValue(scheduler.max_concurrent)
+        self.limit_spin.setPrefix("Parallel: ")
+        self.limit_spin.valueChanged.connect(scheduler.set_max_concurrent)
+
+        self.table = QtWidgets.QTableWidget(0, len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)
+
+        bar = QtWidgets.QHBoxLayout()
+        for w in (self.pause_btn, up_btn, down_btn, cancel_btn, clear_btn, self.limit_spin):
+            bar.addWidget(w)
+        bar.addStretch(1)
+        body = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(body)
+        layout.addLayout(bar); layout.addWidget(self.stats_label); layout.addWidget(self.table)
+        self.setWidget(body)
+
+        # elapsed times tick while something is queued or running
+        self.tick = QtCore.QTimer(self, interval=1000)
+        self.tick.timeout.connect(self.reload)
+
+    def reload(self):
+        jobs = db_queue_list()
+        now = time.time()
+        etas = estimate_queue_etas([j for j in jobs if j["state"] in JOB_ACTIVE], self.scheduler.max_concurrent, now)
+        sel = self.selected_job_id()
+        self.table.setRowCount(len(jobs))
+        for i, j in enumerate(jobs):
+            started, finished = j["started_at"], j["finished_at"]
+            waited = (started or now) - j["enqueued_at"] if j["state"] != JOB_CANCELLED or started else None
+            duration = ((finished or now) - started) if started else None
+            eta = etas.get(j["id"])
+            vals = [str(j["id"]), j["name"] or f"#{j['mod_id']}", str(j["priority"]), j["state"],
+                    human_duration(waited), human_duration(duration),
+                    f"{human_clock(eta)} (in {human_duration(eta - now)})" if eta is not None else ""]
+            for c, v in enumerate(vals):
+                item = QtWidgets.QTableWidgetItem(v)
+                item.setData(QtCore.Qt.ItemDataRole.UserRole, j["id"])
+                self.table.setItem(i, c, item)
+            if sel == j["id"]:
+                self.table.selectRow(i)
+
+        st = db_queue_stats()
+        wait_txt = human_duration(st["avg_wait"]) if st["avg_wait"] is not None else "–"
+        state = "paused" if self.scheduler.paused else "running"
+        self.stats_label.setText(
+            f"Queue {state} · Running {st['running']}/{self.scheduler.max_concurrent} · Queued {st['queued']} · "
+            f"Throughput {st['per_hour']:.1f} jobs/h · Avg wait {wait_txt} (last hour)"
+        )
+        active = st["running"] or st["queued"]
+        if active and not self.tick.isActive():
+            self.tick.start()
+        elif not active:
+            self.tick.stop()
+
+    def selected_job_id(self) -> int | None:
+        items = self.table.selectedItems()
+        return items[0].data(QtCore.Qt.ItemDataRole.UserRole) if items else None
+
+    def _toggle_pause(self, paused: bool):
+        self.pause_btn.setText("Resume" if paused else "Pause")
+        if paused:
+            self.scheduler.pause()
+        else:
+            self.scheduler.resume()
+
+    def _bump(self, delta: int):
+        job_id = self.selected_job_id()
+        if job_id is not None:
+            self.scheduler.bump(job_id, delta)
+
+    def _cancel_selected(self):
+        job_id = self.selected_job_id()
+        if job_id is not None:
+            self.scheduler.cancel(job_id)
+
+    def _clear_finished(self):
+        db_queue_clear_finished()
+        self.reload()
+
+# ---------- live log tail ----------
+class LogTailDock(QtWidgets.QDockWidget):
+    """Follows the latest run log of the selected mod.
+
+    Reads only what was appended since the last tick (capped per tick; if a
+    run outpaces that, it skips ahead to the newest output), and the text
+    view keeps a bounded number of lines, so huge logs cost neither memory
+    nor UI time. Rotation is noticed by the file shrinking.
+    """
+    TICK_MS = 250
+    MAX_READ = 256 * 1024     # bytes per tick
+    BACKFILL = 64 * 1024      # bytes shown when starting to follow a log
+    MAX_LINES = 5000
+
+    def __init__(self, parent=None):
+        super().__init__("Run Log", parent)
+        self.setObjectName("LogTailDock")
+        self.header = QtWidgets.QLabel("No run selected.")
+        self.view = QtWidgets.QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(self.MAX_LINES)
+        self.view.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+        self.view.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont))
+        body = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(body)
+        layout.addWidget(self.header); layout.addWidget(self.view)
+        self.setWidget(body)
+
+        self.timer = QtCore.QTimer(self, interval=self.TICK_MS)
+        self.timer.timeout.connect(self._tick)
+        self.mod_id: int | None = None
+        self.run = None
+        self._path: Path | None = None
+        self._pos = 0
+        self._partial = b""
+
+    def follow(self, mod_id: int | None, force: bool = False):
+        """Show the latest run of `mod_id` (re-reads the run record; cheap, indexed)."""
+        run = db_latest_run(mod_id) if mod_id is not None else None
+        if not force and self.run is not None and run is not None and run["id"] == self.run["id"]:
+            self.run = run
+            self._update_header()
+            return
+        self.mod_id, self.run = mod_id, run
+        self.view.clear()
+        self._partial = b""
+        self._path = Path(run["log_path"]) if run is not None and run["log_path"] else None
+        self._pos = 0
+        if self._path is not None:
+            try:
+                self._pos = max(0, self._path.stat().st_size - self.BACKFILL)
+            except OSError:
+                pass
+        self._update_header()
+        self._tick()
+        if self.run is not None and self.run["finished_at"] is None and self.isVisible():
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.run is not None and self.run["finished_at"] is None:
+            self.timer.start()
+
+    def hideEvent(self, e):
+        self.timer.stop()
+        super().hideEvent(e)
+
+    def _update_header(self):
+        if self.run is None:
+            self.header.setText("No runs recorded for this mod." if self.mod_id is not None else "No run selected.")
+            return
+        r = self.run
+        state = r["status"] if r["exit_code"] is None else f"{r['status']} (exit {r['exit_code']})"
+        self.header.setText(f"Run #{r['id']} · started {human_time(r['started_at'])} · {state} · {r['log_path']}")
+
+    def _tick(self):
+        if self._path is None:
+            return
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            return
+        if size < self._pos:          # rotated: a fresh segment started
+            self._pos = 0
+            self._partial = b""
+        if size - self._pos > self.MAX_READ:
+            self._pos = size - self.BACKFILL
+            self._partial = b""
+            self.view.appendPlainText("… (skipped ahead) …")
+        if size > self._pos:
+            with open(self._path, "rb") as fh:
+                fh.seek(self._pos)
+                data = fh.read(size - self._pos)
+            self._pos += len(data)
+            data = self._partial + data
+            cut = data.rfind(b"\n")
+            if cut < 0:
+                self._partial = data
+            else:
+                self._partial = data[cut + 1:]
+                self.view.appendPlainText(data[:cut].decode("utf-8", errors="replace").replace("\r", ""))
+
+    def run_finished(self, mod_id: int):
+        if mod_id == self.mod_id:
+            self._tick()
+            if self._partial:
+                self.view.appendPlainText(self._partial.decode("utf-8", errors="replace"))
+                self._partial = b""
+            self.timer.stop()
+            self.follow(mod_id)
+
+# ---------- base-folder scan job ----------
+class ScanSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int, int)   # dirs done, dirs known so far, mods found
+    finished = QtCore.pyqtSignal(dict)
+    failed = QtCore.pyqtSignal(str)
+
+class ScanJob(QtCore.QRunnable):
+    """Runs scan_base_folder() on the global thread pool; results come back through .signals."""
+    def __init__(self, root: str, full: bool = False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ScanSignals()
+        self.root, self.full = root, full
+        self.cancelled = False
+
+    def run(self):
+        try:
+            result = scan_base_folder(self.root, full=self.full,
+                                      progress=lambda *a: self.signals.progress.emit(*a),
+                                      is_cancelled=lambda: self.cancelled)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            db_close()
+
+class LoadSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(int, object, object)   # generation, mod rows, categories
+    failed = QtCore.pyqtSignal(str)
+
+class LoadModsJob(QtCore.QRunnable):
+    """Initial fill: reads every mod and the category list on the thread pool so the window can show first.
+
+    Libraries over `paged_threshold` mods are not read at all (rows=None): the table pages them instead.
+    """
+    def __init__(self, generation: int, paged_threshold: int):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = LoadSignals()
+        self.generation, self.paged_threshold = generation, paged_threshold
+
+    def run(self):
+        try:
+            with METRICS.timer("refresh.query"):
+                rows = db_fetch_all() if db_count_mods() <= self.paged_threshold else None
+            cats = db_distinct_categories()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(self.generation, rows, cats)
+        finally:
+            db_close()
+
+class BlendMetaSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(int)   # .blend files (re)read
+
+class BlendMetaJob(QtCore.QRunnable):
+    """Reads the header of every mod's .blend that is new or changed since last time into blend_meta."""
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = BlendMetaSignals()
+        self.cancelled = False
+
+    def run(self):
+        changed = 0
+        try:
+            for path, known_mtime, known_size in db_blend_paths():
+                if self.cancelled:
+                    break
+                try:
+                    st = os.stat(path)
+                    if st.st_mtime_ns == known_mtime and st.st_size == known_size:
+                        continue
+                    info = read_blend_info(path, want_thumb=False)
+                except (OSError, ValueError, EOFError, struct.error):
+                    continue
+                if info is not None:
+                    db_blend_meta_put(path, st.st_mtime_ns, st.st_size, info)
+                    changed += 1
+        finally:
+            db_close()
+            self.signals.finished.emit(changed)
 
 # ====================== DIALOG ======================
 class ModEditorDialog(QtWidgets.QDialog):
@@ -273,6 +1339,93 @@ class ModEditorDialog(QtWidgets.QDialog):
             "last_run": self.mod.get("last_run", 0)
         }
 
+class DiagnosticsDialog(QtWidgets.QDialog):
+    """Live view of METRICS: per-operation latency, counters with hit rates, cache gauges; export to data/."""
+    TIMING_HEADERS = ["Operation", "Calls", "Total ms", "Mean ms", "P50 ms", "P95 ms", "Max ms"]
+
+    def __init__(self, parent=None, on_enabled_changed=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(820, 560)
+        self.on_enabled_changed = on_enabled_changed
+
+        self.enabled_check = QtWidgets.QCheckBox("Collect metrics")
+        self.enabled_check.setChecked(METRICS.enabled)
+        self.enabled_check.toggled.connect(self._set_enabled)
+        self.since_label = QtWidgets.QLabel()
+
+        self.timings = QtWidgets.QTableWidget(0, len(self.TIMING_HEADERS))
+        self.timings.setHorizontalHeaderLabels(self.TIMING_HEADERS)
+        self.timings.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.timings.verticalHeader().setVisible(False)
+        self.timings.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.counters = QtWidgets.QPlainTextEdit(readOnly=True)
+        self.counters.setMaximumHeight(150)
+
+        refresh_btn = QtWidgets.QPushButton("Refresh"); refresh_btn.clicked.connect(self.reload)
+        reset_btn = QtWidgets.QPushButton("Reset"); reset_btn.clicked.connect(self._reset)
+        json_btn = QtWidgets.QPushButton("Save JSON…"); json_btn.clicked.connect(lambda: self._dump("json"))
+        prom_btn = QtWidgets.QPushButton("Save Prometheus…"); prom_btn.clicked.connect(lambda: self._dump("prometheus"))
+        close_btn = QtWidgets.QPushButton("Close"); close_btn.clicked.connect(self.accept)
+
+        top = QtWidgets.QHBoxLayout(); top.addWidget(self.enabled_check); top.addStretch(1); top.addWidget(self.since_label)
+        btns = QtWidgets.QHBoxLayout()
+        for b in (refresh_btn, reset_btn, json_btn, prom_btn):
+            btns.addWidget(b)
+        btns.addStretch(1); btns.addWidget(close_btn)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(top); layout.addWidget(self.timings, 1)
+        layout.addWidget(self.counters); layout.addLayout(btns)
+
+        self.timer = QtCore.QTimer(self, interval=1000)
+        self.timer.timeout.connect(self.reload)
+        self.timer.start()
+        self.reload()
+
+    def reload(self):
+        snap = METRICS.snapshot()
+        since = human_time(snap["since"])
+        self.since_label.setText(f"since {since}" if METRICS.enabled else "off (no overhead)")
+        hists = sorted(snap["histograms"].items(), key=lambda kv: kv[1]["sum"], reverse=True)
+        self.timings.setRowCount(len(hists))
+        for i, (op, h) in enumerate(hists):
+            vals = [op, str(h["count"]), f"{h['sum'] * 1e3:.1f}", f"{h['sum'] / h['count'] * 1e3:.2f}",
+                    f"≤{h['p50'] * 1e3:.2f}", f"≤{h['p95'] * 1e3:.2f}", f"{h['max'] * 1e3:.2f}"]
+            for c, v in enumerate(vals):
+                item = QtWidgets.QTableWidgetItem(v)
+                if c:
+                    item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+                self.timings.setItem(i, c, item)
+
+        lines = [f"{k}: {v}" for k, v in sorted(snap["counters"].items())]
+        c = snap["counters"]
+        thumb_lookups = sum(c.get(f"thumb_cache.{k}", 0) for k in ("hit", "miss", "stale"))
+        if thumb_lookups:
+            lines.append(f"thumb_cache hit rate: {c.get('thumb_cache.hit', 0) / thumb_lookups:.1%}")
+        for src, vals in sorted(snap["gauges"].items()):
+            lines.append(f"{src}: " + ", ".join(
+                f"{k}={v:.1%}" if k.endswith("rate") else f"{k}={v}" for k, v in vals.items()))
+        self.counters.setPlainText("\n".join(lines))
+
+    def _set_enabled(self, on: bool):
+        METRICS.enabled = on
+        if self.on_enabled_changed:
+            self.on_enabled_changed(on)
+        self.reload()
+
+    def _reset(self):
+        METRICS.reset()
+        self.reload()
+
+    def _dump(self, fmt: str):
+        try:
+            path = METRICS.dump(fmt=fmt)
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Could not write metrics:\n{e}")
+            return
+        QtWidgets.QMessageBox.information(self, "Diagnostics", f"Saved:\n{path}")
+
 # ====================== MAIN WINDOW ======================
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
@@ -288,6 +1441,7 @@ class MainWindow(QtWidgets.QMainWindow):
         edit_act = QtGui.QAction("Edit", self); edit_act.triggered.connect(self.edit_selected)
         del_act = QtGui.QAction("Delete", self); del_act.triggered.connect(self.delete_selected)
         run_act = QtGui.QAction("Run ▶", self); run_act.triggered.connect(self.run_selected)
+        queue_act = QtGui.QAction("Queue Run ⏩", self); queue_act.triggered.connect(self.queue_selected)
         blend_act = QtGui.QAction("Open Blend ⧉", self); blend_act.triggered.connect(self.open_blend_selected)
 
         # ---- Base Folder button (left-click open, right-click set) ----
@@ -300,60 +1454,117 @@ class MainWindow(QtWidgets.QMainWindow):
         self.base_folder_button.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.base_folder_button.customContextMenuRequested.connect(self._show_base_folder_menu)
 
+        # ---- Tools menu (maintenance actions) ----
+        self.tools_menu = QtWidgets.QMenu(self)
+        self.tools_menu.addAction("Scan Base Folder", self.scan_base_folder)
+        self.tools_menu.addAction("Full Rescan of Base Folder", lambda: self.scan_base_folder(full=True))
+        self.tools_menu.addSeparator()
+        self.tools_menu.addAction("Rebuild Thumbnails", self.rebuild_thumbnails)
+        self.tools_menu.addAction("Cover Cache Stats…", self.show_cover_cache_stats)
+        self.tools_menu.addAction("Diagnostics…", self.show_diagnostics)
+        self.tools_button = QtWidgets.QToolButton()
+        self.tools_button.setText("Tools")
+        self.tools_button.setMenu(self.tools_menu)
+        self.tools_button.setPopupMode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
+
         # Build toolbar
         tb.addAction(add_act); tb.addAction(edit_act); tb.addAction(del_act)
-        tb.addSeparator(); tb.addAction(run_act); tb.addAction(blend_act)
-        tb.addSeparator(); tb.addWidget(self.base_folder_button); tb.addSeparator()
+        tb.addSeparator(); tb.addAction(run_act); tb.addAction(queue_act); tb.addAction(blend_act)
+        tb.addSeparator(); tb.addWidget(self.base_folder_button); tb.addWidget(self.tools_button); tb.addSeparator()
 
         # Category filter
         tb.addWidget(QtWidgets.QLabel("  Category: "))
         self.category_filter = QtWidgets.QComboBox()
         self.category_filter.setMinimumWidth(180)
-        self.category_filter.currentIndexChanged.connect(self.refresh)
+        self.category_filter.currentIndexChanged.connect(self.apply_filter)
         tb.addWidget(self.category_filter)
         tb.addWidget(toolbar_spacer(8))
 
         # Name filter
         tb.addWidget(QtWidgets.QLabel("  Search: "))
-        self.search_edit = QtWidgets.QLineEdit(placeholderText="Filter by name…")
-        self.search_edit.textChanged.connect(self.refresh)
+        self.search_edit = QtWidgets.QLineEdit(placeholderText="Search name, version, category, paths…")
+        # debounced: a burst of keystrokes results in one filter pass
+        self.search_timer = QtCore.QTimer(self, singleShot=True, interval=120)
+        self.search_timer.timeout.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(self.search_timer.start)
         self.search_edit.setClearButtonEnabled(True)
         self.search_edit.setFixedWidth(360)
         tb.addWidget(self.search_edit)
 
         # Table and sizes
         self.BANNER_W, self.BANNER_H = 321, 150  # cover size
-        self.table = QtWidgets.QTableWidget(0, 8, self)
-        self.table.setHorizontalHeaderLabels(["ID", "Cover", "MOD NAME", "Version", "Category", "Last Run", "Path", "Blend Path"])
+
+        # Fonts: name bigger; others default via QSS
+        self.name_font = QtGui.QFont(self.font())
+        self.name_font.setPointSize(self.font().pointSize() + 4)
+
+        self.search_index = ModSearchIndex()
+        # self.model is whichever of the two is on the table (see _use_paged_model)
+        self.memory_model = ModTableModel(self, name_font=self.name_font)
+        self.paged_model = PagedModTableModel(self, name_font=self.name_font)
+        self.model = self.memory_model
+        # Missing-file markers: paths are probed off-thread; the models only read the cache
+        self.path_validator = PathValidator(self)
+        style = self.style()
+        icons = {PATH_MISSING: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MessageBoxWarning),
+                 PATH_UNREACHABLE: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DriveNetIcon)}
+        for m in (self.memory_model, self.paged_model):
+            m.path_validator, m.path_icons = self.path_validator, icons
+        self.cover_loader = CoverLoader(self.BANNER_W, self.BANNER_H, self)
+        METRICS.add_collector("cover_loader", self.cover_loader.stats)
+        self.cover_delegate = CoverDelegate(self.cover_loader, self)
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(COL_COVER, self.cover_delegate)
+        self.table.setItemDelegateForColumn(COL_RESOURCES, SparklineDelegate(self.table))
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setShowGrid(False)
         self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        # fixed row height: the view never has to measure rows it doesn't show
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(self.BANNER_H + 18)
+        self.table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.setCentralWidget(self.table)
 
-        # Fonts: name bigger; others default via QSS
-        self.name_font = QtGui.QFont(self.font())
-        self.name_font.setPointSize(self.font().pointSize() + 4)
+        self._last_selected_id = None
+        self.table.selectionModel().selectionChanged.connect(self._remember_selection)
+        self.paged_threshold = PAGED_MODEL_THRESHOLD
+
+        # Covers: repaint when one arrives, drop decodes for rows scrolled out of view
+        self.cover_loader.loaded.connect(lambda _p: self.table.viewport().update())
+        self.cover_loader.rebuild_progress.connect(self._on_thumb_rebuild_progress)
+        self.path_validator.changed.connect(lambda _paths: self.table.viewport().update())
+        self.table.verticalScrollBar().valueChanged.connect(self._retain_visible_covers)
 
         # Column sizing
         hdr = self.table.horizontalHeader()
         hdr.setStretchLastSection(True)
-        hdr.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)  # ID small
-        hdr.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Fixed)             # Cover fixed
-        hdr.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.Stretch)           # Name stretches
-        hdr.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Version
-        hdr.setSectionResizeMode(4, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Category
-        hdr.setSectionResizeMode(5, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Last Run
-        hdr.setSectionResizeMode(6, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Path
-        hdr.setSectionResizeMode(7, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Blend Path
-        self.table.setColumnWidth(1, self.BANNER_W + 4)
-        self.table.setColumnWidth(3, 120)
-        self.table.setColumnWidth(4, 160)
-        self.table.setColumnWidth(5, 200)
-        self.table.setColumnWidth(6, 420)
-        self.table.setColumnWidth(7, 420)
+        hdr.setSectionResizeMode(COL_ID, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)        # ID small
+        hdr.setSectionResizeMode(COL_COVER, QtWidgets.QHeaderView.ResizeMode.Fixed)                # Cover fixed
+        hdr.setSectionResizeMode(COL_NAME, QtWidgets.QHeaderView.ResizeMode.Stretch)               # Name stretches
+        hdr.setSectionResizeMode(COL_VERSION, QtWidgets.QHeaderView.ResizeMode.Interactive)        # Version
+        hdr.setSectionResizeMode(COL_CATEGORY, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Category
+        hdr.setSectionResizeMode(COL_LAST_RUN, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Last Run
+        hdr.setSectionResizeMode(COL_STATUS, QtWidgets.QHeaderView.ResizeMode.Interactive)         # Status
+        hdr.setSectionResizeMode(COL_RESOURCES, QtWidgets.QHeaderView.ResizeMode.Interactive)      # CPU / RAM
+        hdr.setSectionResizeMode(COL_DURATION, QtWidgets.QHeaderView.ResizeMode.Interactive)       # Median / P95
+        hdr.setSectionResizeMode(COL_SUCCESS, QtWidgets.QHeaderView.ResizeMode.Interactive)        # Success
+        hdr.setSectionResizeMode(COL_PATH, QtWidgets.QHeaderView.ResizeMode.Interactive)           # Path
+        hdr.setSectionResizeMode(COL_BLEND, QtWidgets.QHeaderView.ResizeMode.Interactive)          # Blend Path
+        self.table.setColumnWidth(COL_COVER, self.BANNER_W + 4)
+        self.table.setColumnWidth(COL_VERSION, 120)
+        self.table.setColumnWidth(COL_CATEGORY, 160)
+        self.table.setColumnWidth(COL_LAST_RUN, 200)
+        self.table.setColumnWidth(COL_STATUS, 200)
+        self.table.setColumnWidth(COL_RESOURCES, 160)
+        self.table.setColumnWidth(COL_DURATION, 140)
+        self.table.setColumnWidth(COL_SUCCESS, 110)
+        self.table.setColumnWidth(COL_PATH, 420)
+        self.table.setColumnWidth(COL_BLEND, 420)
 
         # Context menu
         self.table.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
@@ -362,14 +1573,130 @@ class MainWindow(QtWidgets.QMainWindow):
         # Double click runs
         self.table.doubleClicked.connect(self.run_selected)
 
-        # Rows cache
-        self.rows = []
+        # Launched conversions: reaped in the background, only the finished row is patched
+        self.run_signals = RunSignals(self)
+        self.run_signals.finished.connect(self._on_run_finished)
+        # CPU/RAM/IO of running process trees, sampled off the GUI thread; peaks are saved with each run
+        self.resource_monitor = ResourceMonitor(interval=self._resource_interval_ms() / 1000)
+        for m in (self.memory_model, self.paged_model):
+            m.resource_monitor = self.resource_monitor
+        self.supervisor = ProcessSupervisor(on_exit=self.run_signals.finished.emit, monitor=self.resource_monitor)
+        self._resources_shown = False
+        self.resource_timer = QtCore.QTimer(self, interval=self._resource_interval_ms())
+        self.resource_timer.timeout.connect(self._repaint_resources)
+        self.resource_timer.start()
+
+        # Batch queue (persistent in run_queue) + its dock
+        self.queue_signals = QueueSignals(self)
+        self.scheduler = RunScheduler(self.supervisor, max_concurrent=self._max_concurrent_runs(),
+                                      on_change=self.queue_signals.changed.emit,
+                                      paused=self._settings().value("queue_paused", "false") == "true")
+        self.queue_dock = RunQueueDock(self.scheduler, self)
+        self.queue_dock.limit_spin.valueChanged.connect(
+            lambda n: self._settings().setValue("max_concurrent_runs", n))
+        self.queue_dock.pause_btn.toggled.connect(lambda on: self._settings().setValue("queue_paused", on))
+        self.queue_signals.changed.connect(self.queue_dock.reload)
+        self.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.queue_dock)
+        self.queue_dock.hide()
+
+        # Live output of the selected mod's latest run
+        self.log_dock = LogTailDock(self)
+        self.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.log_dock)
+        self.tabifyDockWidget(self.queue_dock, self.log_dock)
+        self.log_dock.hide()
+        self.tools_menu.addAction(self.log_dock.toggleViewAction())
+        self.table.selectionModel().currentRowChanged.connect(self._follow_selected_log)
+        self.tools_menu.addAction(self.queue_dock.toggleViewAction())
+
+        # Status bar: scan progress (hidden until a scan runs)
+        self._scan_job = None
+        self._blend_job = None
+        self.scan_progress = QtWidgets.QProgressBar()
+        self.scan_progress.setMaximumWidth(240)
+        self.scan_progress.hide()
+        self.scan_cancel_button = QtWidgets.QPushButton("Cancel")
+        self.scan_cancel_button.clicked.connect(self.cancel_scan)
+        self.scan_cancel_button.hide()
+        self.statusBar().addPermanentWidget(self.scan_progress)
+        self.statusBar().addPermanentWidget(self.scan_cancel_button)
+
+        # Opt-in instrumentation (Tools > Diagnostics); B4RT_METRICS=1 also turns it on
+        if self._settings().value("metrics_enabled", "false") == "true":
+            METRICS.enabled = True
+
+        try:
+            self.paged_threshold = int(self._settings().value("paged_threshold", PAGED_MODEL_THRESHOLD))
+        except (TypeError, ValueError):
+            pass
+
+        # Other launchers on the same DB: PRAGMA data_version says when someone else committed,
+        # the mod_changes log says which mods to re-read (see _poll_external_changes)
+        self._rev = 0
+        self._data_version = None
+        self.external_timer = QtCore.QTimer(self)
+        self.external_timer.timeout.connect(self._poll_external_changes)
+        try:
+            self.external_timer.setInterval(int(self._settings().value("external_poll_ms", EXTERNAL_POLL_MS)))
+        except (TypeError, ValueError):
+            self.external_timer.setInterval(EXTERNAL_POLL_MS)
+
+        # In-memory cover budget (MB) can be tuned in settings.ini for big libraries
+        budget_mb = self._settings().value("pixmap_cache_mb", None)
+        if budget_mb:
+            try:
+                PIXMAP_CACHE.set_budget(int(budget_mb) * 1024 * 1024)
+            except ValueError:
+                pass
 
-        # Initialize category, data, and base folder tooltip
-        self.refresh_categories()
-        self.refresh()
         self._set_base_folder(str(self._get_base_folder()))
 
+        # Mods/categories load off the GUI thread once the window is up; covers then stream in via CoverLoader.
+        # refresh() bumps _load_gen, so a slower initial load never overwrites newer data.
+        self._load_gen = 0
+        self._load_job = None
+        QtCore.QTimer.singleShot(0, self._start_initial_load)
+
+    def _start_initial_load(self):
+        STARTUP.mark("first event loop turn")
+        self.statusBar().showMessage("Loading mods…")
+        self._mark_synced()
+        self._load_job = LoadModsJob(self._load_gen, self.paged_threshold)
+        self._load_job.signals.loaded.connect(self._on_initial_load)
+        self._load_job.signals.failed.connect(self._on_initial_load_failed)
+        QtCore.QThreadPool.globalInstance().start(self._load_job)
+
+    def _on_initial_load(self, generation: int, rows, cats):
+        self._load_job = None
+        self.statusBar().clearMessage()
+        if generation == self._load_gen:
+            self.refresh_categories(cats)
+            self._use_paged_model(rows is None)
+            self.search_index.load(rows or ())
+            self.path_validator.check_rows(rows or ())
+            self.apply_filter()
+        STARTUP.mark(f"mods loaded ({'paged' if rows is None else len(rows)} rows)")
+
+        # Resume whatever the last session left in the queue
+        recovered = self.scheduler.recover()
+        if recovered:
+            self.queue_dock.show()
+            paused = " The queue is paused." if self.scheduler.paused else ""
+            self.statusBar().showMessage(f"Re-queued {recovered} interrupted job(s).{paused}", 8000)
+        self.read_blend_meta()
+        db_changes_prune()
+        if self.external_timer.interval() > 0:
+            self.external_timer.start()
+        QtCore.QTimer.singleShot(0, self._on_startup_done)
+
+    def _on_initial_load_failed(self, msg: str):
+        self._load_job = None
+        self.statusBar().clearMessage()
+        QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load mods:\n{msg}")
+
+    def _on_startup_done(self):
+        STARTUP.mark("table filled")
+        STARTUP.report()
+
     # ----- Base folder: portable QSettings via INI in data/ -----
     def _settings(self) -> QtCore.QSettings:
         return QtCore.QSettings(str(SETTINGS_FILE), QtCore.QSettings.Format.IniFormat)
@@ -409,9 +1736,104 @@ class MainWindow(QtWidgets.QMainWindow):
         btn = self.base_folder_button
         menu.exec(btn.mapToGlobal(pos))
 
+    # ----- base folder scan -----
+    def scan_base_folder(self, full: bool = False):
+        if self._scan_job is not None:
+            self.statusBar().showMessage("A scan is already running.", 3000)
+            return
+        root = self._get_base_folder()
+        if not root.is_dir():
+            QtWidgets.QMessageBox.information(
+                self, "Scan Base Folder",
+                "Base folder is not set or does not exist.\nRight‑click the Base Folder button to set it."
+            )
+            return
+        job = ScanJob(str(root), full=full)
+        job.signals.progress.connect(self._on_scan_progress)
+        job.signals.finished.connect(self._on_scan_finished)
+        job.signals.failed.connect(self._on_scan_failed)
+        self._scan_job = job
+        self.scan_progress.setRange(0, 0)
+        self.scan_progress.show()
+        self.scan_cancel_button.show()
+        self.statusBar().showMessage(f"Scanning {root}…")
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def cancel_scan(self):
+        if self._scan_job is not None:
+            self._scan_job.cancelled = True
+
+    def _on_scan_progress(self, done: int, total: int, found: int):
+        self.scan_progress.setRange(0, total)
+        self.scan_progress.setValue(done)
+        self.statusBar().showMessage(f"Scanning… {done}/{total} folders, {found} new mods")
+
+    def _scan_ended(self):
+        self._scan_job = None
+        self.scan_progress.hide()
+        self.scan_cancel_button.hide()
+
+    def _on_scan_finished(self, result: dict):
+        self._scan_ended()
+        if result["cancelled"]:
+            self.statusBar().showMessage("Scan cancelled.", 5000)
+            return
+        self.statusBar().showMessage(
+            f"Imported {result['imported']} mods — {result['scanned']} folders, "
+            f"{result['unchanged']} unchanged, {result['errors']} unreadable.", 8000)
+        if result["imported"]:
+            self.refresh_categories()
+            self.refresh()
+            self.read_blend_meta()
+
+    def _on_scan_failed(self, msg: str):
+        self._scan_ended()
+        self.statusBar().clearMessage()
+        QtWidgets.QMessageBox.critical(self, "Scan Base Folder", f"Scan failed:\n{msg}")
+
+    def read_blend_meta(self):
+        """Pick up version/compression of new or changed .blend files in the background."""
+        if self._blend_job is not None:
+            return
+        self._blend_job = BlendMetaJob()
+        self._blend_job.signals.finished.connect(self._on_blend_meta_read)
+        QtCore.QThreadPool.globalInstance().start(self._blend_job)
+
+    def _on_blend_meta_read(self, changed: int):
+        self._blend_job = None
+        if changed:
+            self.refresh()
+
+    # ----- maintenance -----
+    def rebuild_thumbnails(self):
+        self.cover_loader.rebuild(db_cover_paths())
+        self.table.viewport().update()
+        self.statusBar().showMessage("Rebuilding thumbnails…")
+
+    def show_cover_cache_stats(self):
+        st = PIXMAP_CACHE.stats()
+        shared = self.cover_loader.stats()
+        QtWidgets.QMessageBox.information(
+            self, "Cover Cache",
+            f"Entries: {st['entries']}   (cover paths seen: {shared['paths']}, unique images: {shared['unique']})\n"
+            f"Memory: {st['bytes'] / 2**20:.1f} / {st['max_bytes'] / 2**20:.0f} MB\n"
+            f"Hits: {st['hits']}   Misses: {st['misses']}   Hit rate: {st['hit_rate']:.1%}\n"
+            f"Evictions: {st['evictions']}"
+        )
+
+    def show_diagnostics(self):
+        DiagnosticsDialog(self, on_enabled_changed=lambda on: self._settings().setValue("metrics_enabled", on)).exec()
+
+    def _on_thumb_rebuild_progress(self, done: int, total: int):
+        if done >= total:
+            self.statusBar().showMessage(f"Rebuilt {total} thumbnails.", 5000)
+        else:
+            self.statusBar().showMessage(f"Rebuilding thumbnails… {done}/{total}")
+
     # ----- helpers -----
-    def refresh_categories(self):
-        cats = db_distinct_categories()
+    def refresh_categories(self, cats: list[str] | None = None):
+        if cats is None:
+            cats = db_distinct_categories()
         self.category_filter.blockSignals(True)
         self.category_filter.clear()
         self.category_filter.addItem("All", userData="__all__")
@@ -426,54 +1848,89 @@ class MainWindow(QtWidgets.QMainWindow):
     def context_menu(self, pos):
         menu = QtWidgets.QMenu(self)
         menu.addAction("Run ▶", self.run_selected)
+        menu.addAction("Queue Run ⏩", self.queue_selected)
+        menu.addAction("Queue Run (High Priority)", lambda: self.queue_selected(priority=10))
         menu.addAction("Open Blend ⧉", self.open_blend_selected)
         menu.addAction("Open Project Folder", self.open_project_folder_selected)
+        menu.addAction("Show Run Log", self.show_log_selected)
         menu.addSeparator()
         menu.addAction("Edit", self.edit_selected)
         menu.addAction("Delete", self.delete_selected)
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
+    def selected_ids(self) -> list[int]:
+        return [int(self.model.row_at(i.row())["id"]) for i in self.table.selectionModel().selectedRows()]
+
     def current_row_index(self) -> int:
-        rows = {i.row() for i in self.table.selectedIndexes()}
+        rows = self.table.selectionModel().selectedRows()
         if not rows: return -1
-        return next(iter(rows))
+        return rows[0].row()
 
     def selected_id(self) -> int | None:
         idx = self.current_row_index()
         if idx < 0: return None
-        return int(self.rows[idx]["id"])
+        return int(self.model.row_at(idx)["id"])
+
+    def _remember_selection(self, *_args):
+        sel_id = self.selected_id()
+        if sel_id is not None:
+            self._last_selected_id = sel_id
+
+    def select_row(self, i: int):
+        if i < 0: return
+        self.table.selectRow(i)
+        self.table.scrollTo(self.model.index(i, COL_NAME))
 
     # ----- CRUD -----
     def add_mod(self):
         dlg = ModEditorDialog(self, existing_categories=db_distinct_categories())
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             v = dlg.get_value()
-            if v["name"]:
-                db_insert(v)
+            if v["name"] and self._confirm_name(v["name"]):
+                mod_id = db_insert(v)
                 self.refresh_categories()
-                self.refresh(select_name=v["name"])
+                self.refresh(select_id=mod_id)
 
     def edit_selected(self):
         idx = self.current_row_index()
         if idx < 0: return
-        row = self.rows[idx]
+        row = self.model.row_at(idx)
         current = {
             "name": row["name"],
             "version": row["version"],
             "category": row["category"],
             "cover_path": row["cover_path"],
             "bat_path": row["bat_path"],
-            "blend_path": row["blend_path"] if "blend_path" in row.keys() else "",
-            "work_path": row["work_path"] if "work_path" in row.keys() else "",
+            "blend_path": row["blend_path"],
+            "work_path": row["work_path"],
             "status": row["status"],
             "last_run": row["last_run"]
         }
         dlg = ModEditorDialog(self, mod=current, existing_categories=db_distinct_categories())
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             updated = dlg.get_value()
+            if not self._confirm_name(updated["name"], row["id"]):
+                return
             db_update(row["id"], updated)
+            if cover_source(updated) != cover_source(row):
+                self.cover_loader.forget(cover_source(row))
             self.refresh_categories()
-            self.refresh(select_name=updated["name"])
+            self.refresh(select_id=row["id"])
+            if updated["blend_path"] != row["blend_path"]:
+                self.read_blend_meta()
+
+    def _confirm_name(self, name: str, mod_id: int | None = None) -> bool:
+        """Ask before saving a mod under a name another mod already uses (case/spacing ignored)."""
+        if self.model is self.paged_model:
+            others = [i for i in db_mod_ids_named(name) if i != mod_id]
+        else:
+            others = [i for i in self.search_index.store.ids_named(name) if i != mod_id]
+        if not others:
+            return True
+        reply = QtWidgets.QMessageBox.question(
+            self, "Duplicate name",
+            f"{len(others)} other mod(s) are already named \"{name}\". Save anyway?")
+        return reply == QtWidgets.QMessageBox.StandardButton.Yes
 
     def delete_selected(self):
         sel_id = self.selected_id()
@@ -487,20 +1944,88 @@ class MainWindow(QtWidgets.QMainWindow):
     def run_selected(self):
         idx = self.current_row_index()
         if idx < 0: return
-        row = self.rows[idx]
+        row = self.model.row_at(idx)
         bat = row["bat_path"]
-        if not bat or not Path(bat).exists():
+        if not bat:
             QtWidgets.QMessageBox.warning(self, "Not found", "BAT/CMD path is empty or missing.")
             return
+        if self._path_unusable(bat, "BAT/CMD file"):
+            return
+        if self.supervisor.is_running(row["id"]):
+            QtWidgets.QMessageBox.information(self, "Running", f"{row['name']} is already running.")
+            return
         try:
-            subprocess.Popen(['cmd', '/c', bat], shell=False)
-            now_ts = int(datetime.datetime.now().timestamp())
-            db_update_run(row["id"], "Running", now_ts)
-            self.refresh(select_name=row["name"])
+            self.supervisor.start(row["id"], bat)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to run:\n{e}")
+            return
+        self.refresh_row(row["id"])
+        self.log_dock.show()
+        self.log_dock.raise_()
+        self.log_dock.follow(row["id"], force=True)
+
+    def show_log_selected(self):
+        self.log_dock.show()
+        self.log_dock.raise_()
+        self.log_dock.follow(self.selected_id(), force=True)
+
+    def queue_selected(self, *_args, priority: int = 0):
+        ids = self.selected_ids()
+        if not ids: return
+        self.scheduler.enqueue(ids, priority=priority)
+        self.queue_dock.show()
+        self.statusBar().showMessage(f"Queued {len(ids)} mod(s).", 4000)
+
+    def _resource_interval_ms(self) -> int:
+        try:
+            return max(100, int(self._settings().value("resource_interval_ms", RESOURCE_INTERVAL_MS)))
+        except (TypeError, ValueError):
+            return RESOURCE_INTERVAL_MS
+
+    def _repaint_resources(self):
+        """Redraw just the CPU / RAM column while something runs (one more pass after the last run ends)."""
+        running = bool(self.supervisor.running())
+        if running or self._resources_shown:
+            x = self.table.columnViewportPosition(COL_RESOURCES)
+            self.table.viewport().update(x, 0, self.table.columnWidth(COL_RESOURCES), self.table.viewport().height())
+        self._resources_shown = running
+
+    def _max_concurrent_runs(self) -> int:
+        try:
+            return int(self._settings().value("max_concurrent_runs", os.cpu_count() or 1))
+        except (TypeError, ValueError):
+            return os.cpu_count() or 1
+
+    def _follow_selected_log(self, *_args):
+        if self.log_dock.isVisible():
+            self.log_dock.follow(self.selected_id())
+
+    def _on_run_finished(self, handle: RunHandle):
+        row = self.refresh_row(handle.mod_id)
+        self.log_dock.run_finished(handle.mod_id)
+        name = row["name"] if row is not None else f"#{handle.mod_id}"
+        verdict = "finished" if handle.exit_code == 0 else f"failed (exit {handle.exit_code})"
+        self.statusBar().showMessage(f"{name} {verdict} after {human_duration(handle.duration)}.", 8000)
 
     # ----- open helpers -----
+    def _path_unusable(self, path: str, what: str) -> bool:
+        """Warn when the validator already knows `path` is missing/unreachable.
+
+        Never stats on the GUI thread: an unchecked path is queued for a check
+        and let through (the launch/open then reports its own error).
+        """
+        state = self.path_validator.state(path)
+        if state is None:
+            self.path_validator.check([path])
+        elif state == PATH_MISSING:
+            QtWidgets.QMessageBox.warning(self, "Not found", f"{what} not found:\n{path}")
+            return True
+        elif state == PATH_UNREACHABLE:
+            QtWidgets.QMessageBox.warning(self, "Not reachable",
+                                          f"{what} is on a location that is not responding:\n{path}")
+            return True
+        return False
+
     def _open_path_with_os(self, p: Path):
         if sys.platform.startswith("win"):
             os.startfile(str(p))
@@ -512,14 +2037,13 @@ class MainWindow(QtWidgets.QMainWindow):
     def open_blend_selected(self):
         idx = self.current_row_index()
         if idx < 0: return
-        row = self.rows[idx]
-        blend_path = (row["blend_path"] if "blend_path" in row.keys() else "").strip()
+        row = self.model.row_at(idx)
+        blend_path = (row["blend_path"] or "").strip()
         if not blend_path:
             QtWidgets.QMessageBox.information(self, "No Blend File", "No .blend file set for this mod. Use Edit to set one.")
             return
         p = Path(blend_path)
-        if not p.exists():
-            QtWidgets.QMessageBox.warning(self, "Not found", f"Blend file not found:\n{blend_path}")
+        if self._path_unusable(blend_path, "Blend file"):
             return
         try:
             self._open_path_with_os(p)
@@ -529,14 +2053,13 @@ class MainWindow(QtWidgets.QMainWindow):
     def open_project_folder_selected(self):
         idx = self.current_row_index()
         if idx < 0: return
-        row = self.rows[idx]
-        work_path = (row["work_path"] if "work_path" in row.keys() else "").strip()
+        row = self.model.row_at(idx)
+        work_path = (row["work_path"] or "").strip()
         if not work_path:
             QtWidgets.QMessageBox.information(self, "No Project Folder", "No project/work folder set. Use Edit to set one.")
             return
         p = Path(work_path)
-        if not p.exists():
-            QtWidgets.QMessageBox.warning(self, "Not found", f"Project folder not found:\n{work_path}")
+        if self._path_unusable(work_path, "Project folder"):
             return
         try:
             self._open_path_with_os(p)
@@ -544,55 +2067,153 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to open project folder:\n{e}")
 
     # ----- table population -----
-    def refresh(self, *_args, select_name=None):
-        name_q = self.search_edit.text().strip()
-        cat_q = self.current_category_filter()
-        self.rows = db_fetch_all(name_q if name_q else None, cat_q)
-
-        self.table.setRowCount(0)
-        for r in self.rows:
-            i = self.table.rowCount()
-            self.table.insertRow(i)
-
-            # ID
-            self.table.setItem(i, 0, QtWidgets.QTableWidgetItem(str(r["id"])))
-
-            # Cover widget
-            cover_widget = CoverCell(r["cover_path"], self.BANNER_W, self.BANNER_H, self.table)
-            self.table.setCellWidget(i, 1, cover_widget)
-
-            # Name (bigger font)
-            name_item = QtWidgets.QTableWidgetItem(r["name"])
-            name_font = QtGui.QFont(self.font()); name_font.setPointSize(self.font().pointSize() + 4)
-            name_item.setFont(name_font)
-            self.table.setItem(i, 2, name_item)
-
-            # Version
-            self.table.setItem(i, 3, QtWidgets.QTableWidgetItem(r["version"] or ""))
-
-            # Category
-            self.table.setItem(i, 4, QtWidgets.QTableWidgetItem(r["category"] or ""))
-
-            # Last Run
-            last = r["last_run"] or 0
-            self.table.setItem(i, 5, QtWidgets.QTableWidgetItem(human_time(last) if last else ""))
-
-            # Path (BAT/CMD)
-            self.table.setItem(i, 6, QtWidgets.QTableWidgetItem(r["bat_path"] or ""))
-
-            # Blend Path
-            blend_val = r["blend_path"] if "blend_path" in r.keys() else ""
-            self.table.setItem(i, 7, QtWidgets.QTableWidgetItem(blend_val))
-
-        # Reselect if needed
-        if select_name:
-            for r in range(self.table.rowCount()):
-                if self.table.item(r, 2) and self.table.item(r, 2).text() == select_name:
-                    self.table.selectRow(r)
-                    break
+    def refresh(self, *_args, select_id=None):
+        """Reload every mod from the DB (or just recount, for a paged library), then re-apply the filters."""
+        self._load_gen += 1
+        self._mark_synced()
+        with METRICS.timer("refresh.query"):
+            paged = db_count_mods() > self.paged_threshold
+            rows = () if paged else db_fetch_all()
+        self._use_paged_model(paged)
+        with METRICS.timer("refresh.index"):
+            self.search_index.load(rows)
+        self.path_validator.check_rows(rows)
+        with METRICS.timer("refresh.filter"):
+            self.apply_filter(select_id=select_id)
+
+    def _mark_synced(self):
+        """Everything up to now is about to be (re)loaded; external polling continues from here."""
+        self._data_version = db_data_version()
+        self._rev = db_change_rev()
+
+    def _poll_external_changes(self):
+        """Patch in what other launchers sharing the DB changed: only the changed mods are re-read."""
+        if self._load_job is not None:
+            return
+        version = db_data_version()
+        if version == self._data_version:
+            return
+        self._data_version = version
+        delta = db_changes_since(self._rev)
+        if delta is None:
+            self.refresh()   # change log no longer reaches back to our revision
+            return
+        self._rev, ids = delta
+        if not ids:
+            return
+        if len(ids) > CHANGE_PATCH_MAX:
+            self.refresh()
+            return
+        with METRICS.timer("refresh.external"):
+            records = db_fetch_many(ids)
+            deleted = set(ids) - {r.id for r in records}
+            if self.model is self.paged_model:
+                self.paged_model.apply_changes(records, deleted)
+            else:
+                self.search_index.apply(records, deleted)
+                self.apply_filter()
+            self.path_validator.check_rows(records)
+            self._sync_categories()
+
+    def _sync_categories(self):
+        cats = db_distinct_categories()
+        if cats == [self.category_filter.itemData(i) for i in range(1, self.category_filter.count())]:
+            return
+        current = self.category_filter.currentData()
+        self.refresh_categories(cats)
+        i = self.category_filter.findData(current)
+        self.category_filter.setCurrentIndex(max(i, 0))
+
+    def _use_paged_model(self, paged: bool):
+        """Put the paged or the in-memory model on the table; the idle one is emptied."""
+        model = self.paged_model if paged else self.memory_model
+        if model is self.model:
+            return
+        old_sel = self.table.selectionModel()
+        self.model = model
+        self.table.setModel(model)
+        old_sel.deleteLater()
+        self.table.selectionModel().selectionChanged.connect(self._remember_selection)
+        self.table.selectionModel().currentRowChanged.connect(self._follow_selected_log)
+        if paged:
+            self.memory_model.set_rows([])
+        else:
+            self.paged_model.clear()
+
+    def refresh_row(self, mod_id: int):
+        """Re-read one mod after a status-only change and patch it in place (no reload, no re-filter)."""
+        row = db_fetch_one(mod_id)
+        if row is None:
+            return None
+        self.search_index.update_row(row)
+        self.model.update_row(row)
+        return row
+
+    def apply_filter(self, *_args, select_id=None):
+        """Filter the loaded mods in memory (search text + category) and patch the table; paged: re-query."""
+        self.search_timer.stop()
+        if self.model is self.paged_model:
+            with METRICS.timer("filter.search"):
+                self.paged_model.set_query(self.search_edit.text(), self.current_category_filter())
+        else:
+            with METRICS.timer("filter.search"):
+                rows = self.search_index.filter(self.search_edit.text(), self.current_category_filter())
+            with METRICS.timer("filter.rows"):
+                self.model.set_rows(rows)
+
+        # Reselect if needed; otherwise bring back the last selection once it matches again
+        if select_id is not None:
+            self.select_row(self.model.row_of_id(select_id))
+        elif self._last_selected_id is not None and self.selected_id() != self._last_selected_id:
+            i = self.model.row_of_id(self._last_selected_id)
+            if i >= 0:
+                self.table.selectRow(i)
+        self._retain_visible_covers()
+
+    def _retain_visible_covers(self, *_args):
+        vp = self.table.viewport()
+        first = self.table.rowAt(0)
+        if first < 0:
+            self.cover_loader.retain(())
+            return
+        last = self.table.rowAt(vp.height() - 1)
+        if last < 0:
+            last = self.model.rowCount() - 1
+        rows = (self.model.row_at(i) for i in range(first, last + 1))
+        self.cover_loader.retain(cover_source(r) for r in rows if r is not None)
+
+    def closeEvent(self, e: QtGui.QCloseEvent):
+        running = self.supervisor.running()
+        if running:
+            reply = QtWidgets.QMessageBox.question(
+                self, "Conversions running",
+                f"{len(running)} conversion(s) still running.\n"
+                "They will keep running, but their result won't be recorded. Quit anyway?"
+            )
+            if reply != QtWidgets.QMessageBox.StandardButton.Yes:
+                e.ignore()
+                return
+            self.scheduler.abandon_running()
+            self.supervisor.abandon()
+        self.cancel_scan()
+        self.cover_loader.shutdown()
+        self.path_validator.shutdown()
+        self.external_timer.stop()
+        self.resource_timer.stop()
+        self.resource_monitor.close()
+        if self._blend_job is not None:
+            self._blend_job.cancelled = True
+        db_close()
+        super().closeEvent(e)
 
 # ====================== ENTRY ======================
 def main():
+    STARTUP.enabled = "--profile-startup" in sys.argv
+    if STARTUP.enabled:
+        sys.argv.remove("--profile-startup")
+    STARTUP.start("process start", _PROCESS_T0)
+    STARTUP.mark("imports (Qt, core)")
+
     # show paths in console (useful when testing exe via terminal)
     print(f"[DATA] Portable data dir: {DATA_DIR}")
     print(f"[DB]   Using database:   {DB_FILE}")
@@ -604,15 +2225,23 @@ def main():
         app = QtWidgets.QApplication(sys.argv)
         QtWidgets.QMessageBox.critical(None, "Startup Error", str(e))
         sys.exit(1)
+    STARTUP.mark("data folder")
 
+    # rollback journal instead of WAL for a DB shared from several machines ("auto": on network paths)
+    db_set_journal_mode(QtCore.QSettings(str(SETTINGS_FILE), QtCore.QSettings.Format.IniFormat).value("journal_mode"))
     db_init()
+    db_runs_recover()   # runs cut off by a crash or a quit while running
+    STARTUP.mark("db_init")
 
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName(APP_TITLE)
     load_styles(app)
+    STARTUP.mark("QApplication + styles")
 
     w = MainWindow()
+    STARTUP.mark("MainWindow()")
     w.show()
+    STARTUP.mark("show()")
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+"""Per-call overhead of the DB layer: fresh connection per call (old) vs the shared, tuned one.
+
+    python benchmarks/bench_db.py [--mods 5000] [--calls 200]
+"""
+import argparse, sqlite3, sys, tempfile, time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import launcher_core as core  # noqa: E402
+
+
+# ---- the pre-pool behaviour: new connection per call, default pragmas ----
+def _legacy_connect():
+    conn = sqlite3.connect(core.DB_FILE)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+@contextmanager
+def _legacy_transaction():
+    with _legacy_connect() as con:
+        yield con
+
+
+def _make_db(path: Path, n: int):
+    core.DB_FILE = path
+    core.db_init()
+    cats = ["Vehicles", "Weapons", "Maps", "Characters", "Props", "UI"]
+    with core.db_transaction() as con:
+        con.executemany(
+            "INSERT INTO mods (name, version, category, bat_path) VALUES (?, ?, ?, ?)",
+            [(f"mod {i:06}", f"1.{i % 7}", cats[i % len(cats)], f"D:/mods/{i}/run.bat") for i in range(n)],
+        )
+    core.db_close()
+
+
+def _time(fn, calls: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - t0) / calls * 1e3
+
+
+def _suite(calls: int) -> dict[str, float]:
+    return {
+        "db_fetch_all": _time(lambda i: core.db_fetch_all(), max(1, calls // 10)),
+        "db_fetch_all(search)": _time(lambda i: core.db_fetch_all("mod 0001"), calls),
+        "db_update_run": _time(lambda i: core.db_update_run(1 + i % 100, "Running", i), calls),
+        "db_distinct_categories": _time(lambda i: core.db_distinct_categories(), calls),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mods", type=int, default=5000)
+    ap.add_argument("--calls", type=int, default=200)
+    args = ap.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="b4rt-bench-"))
+    before_db, after_db = tmp / "before.db", tmp / "after.db"
+    _make_db(before_db, args.mods)
+    _make_db(after_db, args.mods)
+
+    # before: rollback journal + a connection per call
+    con = sqlite3.connect(before_db)
+    con.execute("PRAGMA journal_mode = DELETE")
+    con.close()
+    connect, transaction = core.db_connect, core.db_transaction
+    core.db_connect, core.db_transaction = _legacy_connect, _legacy_transaction
+    core.DB_FILE = before_db
+    before = _suite(args.calls)
+    core.db_connect, core.db_transaction = connect, transaction
+
+    core.DB_FILE = after_db
+    after = _suite(args.calls)
+    core.db_close()
+
+    print(f"{args.mods} mods, ms per call")
+    print(f"{'call':<24}{'before':>10}{'after':>10}{'speedup':>10}")
+    for k in before:
+        print(f"{k:<24}{before[k]:>10.3f}{after[k]:>10.3f}{before[k] / after[k]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Memory per loaded mod: sqlite3.Row (the old representation) vs ModRecord, plus lookup cost.
+
+    python benchmarks/bench_mod_memory.py [--mods 20000]
+
+Bytes are what tracemalloc sees allocated for the fetched list (rows and
+their values), divided by the mod count. Lookups compare the old linear
+scan by id with ModStore's index.
+"""
+import argparse, random, sqlite3, sys, tempfile, time, tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import launcher_core as core  # noqa: E402
+
+CATEGORIES = ["Vehicles", "Weapons", "Maps", "Characters", "Props", "UI", "Audio", "Effects"]
+
+
+def _make_db(path: Path, n: int, rng: random.Random):
+    core.DB_FILE = path
+    core.db_init()
+    mods = []
+    for i in range(n):
+        cat = rng.choice(CATEGORIES)
+        name = f"Mod {rng.randrange(n * 10)} {i}"
+        mods.append({
+            "name": name, "cover_path": f"D:/mods/{cat}/{name}/cover.png", "bat_path": f"D:/mods/{cat}/{name}/convert.bat",
+            "status": "Ready", "last_run": 0, "version": f"1.{rng.randrange(10)}", "category": cat,
+            "blend_path": f"D:/mods/{cat}/{name}/{name}.blend", "work_path": f"D:/mods/{cat}/{name}",
+        })
+    core.db_bulk_insert(mods)
+
+
+def _measure(fetch) -> tuple[list, int, float]:
+    t0 = time.perf_counter()
+    tracemalloc.start()
+    rows = fetch()
+    used, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, used, (time.perf_counter() - t0) * 1e3
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mods", type=int, default=20000)
+    args = ap.parse_args()
+    _make_db(Path(tempfile.mkdtemp(prefix="b4rt-mem-")) / "mods.db", args.mods, random.Random(1))
+    con = core.db_connect()
+    sql = core.MOD_SELECT + " ORDER BY mods.name ASC"
+
+    rows, row_bytes, row_ms = _measure(lambda: con.execute(sql).fetchall())   # sqlite3.Row
+    assert isinstance(rows[0], sqlite3.Row)
+    del rows
+    records, rec_bytes, rec_ms = _measure(core.db_fetch_all)
+    n = len(records)
+    print(f"{n} mods")
+    print(f"{'representation':<16}{'bytes/mod':>12}{'fetch ms':>12}")
+    print(f"{'sqlite3.Row':<16}{row_bytes / n:>12.0f}{row_ms:>12.1f}")
+    print(f"{'ModRecord':<16}{rec_bytes / n:>12.0f}{rec_ms:>12.1f}   ({(1 - rec_bytes / row_bytes):.0%} less)")
+
+    ids = [r.id for r in random.Random(2).sample(records, min(1000, n))]
+    t0 = time.perf_counter()
+    for mod_id in ids:
+        next(i for i, r in enumerate(records) if r["id"] == mod_id)
+    scan_us = (time.perf_counter() - t0) / len(ids) * 1e6
+    store = core.ModStore(records)
+    t0 = time.perf_counter()
+    for mod_id in ids:
+        store.position(mod_id)
+    index_us = (time.perf_counter() - t0) / len(ids) * 1e6
+    print(f"lookup by id: linear scan {scan_us:.1f} us, ModStore {index_us:.2f} us")
+    core.db_close()
+
+
+if __name__ == "__main__":
+    main()
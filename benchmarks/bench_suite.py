@@ -0,0 +1,262 @@
+"""Hot-path benchmarks on synthetic libraries, with JSON output and baseline comparison.
+
+    python benchmarks/bench_suite.py [--sizes 1000,10000,100000] [--repeat 5] [--out results.json]
+                                     [--baseline benchmarks/baseline.json] [--save-baseline] [--threshold 15]
+
+For each size a mods.db (plus generated cover images) is built once under
+--work and reused by later runs with the same seed. Everything runs with
+QT_QPA_PLATFORM=offscreen. Times are the median of --repeat runs, in ms.
+With a baseline, every metric is compared and the exit code is 1 when one
+got slower than --threshold percent.
+"""
+import argparse, json, os, platform, random, statistics, subprocess, sys, tempfile, time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import launcher_core as core  # noqa: E402
+
+BANNER_W, BANNER_H = 321, 150   # MainWindow.BANNER_W/H
+CATEGORIES = ["Vehicles", "Weapons", "Maps", "Characters", "Props", "UI", "Audio", "Effects"]
+WORDS = ["alpha", "bravo", "delta", "nova", "storm", "rally", "drift", "titan", "ghost", "ember"]
+SEARCH_TYPED = "storm 12"   # typed one key at a time in the search box
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+# ---------------- synthetic library ----------------
+def _make_covers(folder: Path, n: int, rng: random.Random) -> list[str]:
+    from PyQt6 import QtGui, QtCore
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(n):
+        p = folder / (f"cover_{i:03}.jpg" if i % 2 else f"cover_{i:03}.png")
+        if not p.exists():
+            img = QtGui.QImage(1280, 600, QtGui.QImage.Format.Format_RGB32)
+            painter = QtGui.QPainter(img)
+            grad = QtGui.QLinearGradient(0, 0, 1280, 600)
+            grad.setColorAt(0, QtGui.QColor.fromHsv(rng.randrange(360), 180, 220))
+            grad.setColorAt(1, QtGui.QColor.fromHsv(rng.randrange(360), 200, 90))
+            painter.fillRect(img.rect(), grad)
+            for _ in range(40):
+                painter.fillRect(QtCore.QRect(rng.randrange(1280), rng.randrange(600), 90, 40),
+                                 QtGui.QColor.fromHsv(rng.randrange(360), 160, 200))
+            painter.end()
+            img.save(str(p))
+        paths.append(str(p))
+    return paths
+
+def make_library(folder: Path, n: int, covers: int, seed: int) -> Path:
+    """<folder>/mods.db with n mods sharing `covers` cover images; reused when it already exists."""
+    db = folder / "mods.db"
+    if db.exists():
+        return db
+    rng = random.Random(seed)
+    from PyQt6 import QtWidgets
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])   # QImage painting needs one
+    cover_paths = _make_covers(folder.parent / "covers", covers, rng)
+    core.DB_FILE = folder / "mods.tmp"
+    core.DB_FILE.unlink(missing_ok=True)
+    core.db_init()
+    mods = []
+    for i in range(n):
+        name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i}"
+        cat = rng.choice(CATEGORIES)
+        mods.append({
+            "name": name, "cover_path": cover_paths[i % len(cover_paths)],
+            "bat_path": f"D:/mods/{cat}/{name}/convert.bat", "status": "Ready", "last_run": 0,
+            "version": f"{rng.randrange(1, 4)}.{rng.randrange(10)}", "category": cat,
+            "blend_path": f"D:/mods/{cat}/{name}/{name}.blend", "work_path": f"D:/mods/{cat}/{name}",
+        })
+    with core.db_transaction():
+        core.db_bulk_insert(mods)
+    core.db_close()
+    os.replace(core.DB_FILE, db)
+    return db
+
+def use_library(db: Path):
+    """Point launcher_core (and app's copies of the path globals) at `db`."""
+    import app
+    for mod in (core, app):
+        mod.DATA_DIR, mod.DB_FILE = db.parent, db
+        mod.SETTINGS_FILE = db.parent / "settings.ini"
+    core.LOG_DIR = db.parent / "logs"
+
+
+# ---------------- measurements ----------------
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1e3)
+    return round(statistics.median(times), 3)
+
+def _wait_loaded(qa, w, timeout: float = 120.0):
+    deadline = time.time() + timeout
+    while w._load_job is not None and time.time() < deadline:
+        qa.processEvents()
+        time.sleep(0.001)
+
+def bench_library(db: Path, repeat: int) -> dict[str, float]:
+    import app
+    from PyQt6 import QtWidgets
+    qa = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    use_library(db)
+    core.db_init()
+    res = {
+        "db_fetch_all": _median_ms(core.db_fetch_all, repeat),
+        "db_fetch_all_search": _median_ms(lambda: core.db_fetch_all("storm 12"), repeat),
+        "db_distinct_categories": _median_ms(core.db_distinct_categories, repeat),
+    }
+
+    w = app.MainWindow()
+    w.show()
+    _wait_loaded(qa, w)
+    w.scheduler.pause()
+    res["main_window_refresh"] = _median_ms(w.refresh, repeat)
+
+    def type_search():
+        # what the debounced textChanged -> apply_filter path does, once per key
+        for i in range(1, len(SEARCH_TYPED) + 1):
+            w.search_edit.blockSignals(True)
+            w.search_edit.setText(SEARCH_TYPED[:i])
+            w.search_edit.blockSignals(False)
+            w.apply_filter()
+        w.search_edit.clear()
+        w.apply_filter()
+    res["search_typing"] = _median_ms(type_search, repeat)
+
+    covers = core.db_cover_paths()
+    res["cover_decode_per_image"] = round(_median_ms(
+        lambda: [app.decode_cover(p, BANNER_W, BANNER_H) for p in covers], repeat) / max(1, len(covers)), 3)
+    for p in covers:   # fill thumb_cache, then time the warm path
+        app.load_thumb(p, BANNER_W, BANNER_H)
+    res["cover_thumb_cache_hit_per_image"] = round(_median_ms(
+        lambda: [app.load_thumb(p, BANNER_W, BANNER_H) for p in covers], repeat) / max(1, len(covers)), 3)
+
+    w.scheduler.abandon_running()
+    w.close()
+    w.deleteLater()
+    qa.processEvents()
+    core.db_close()
+
+    startup = [_startup_once(db) for _ in range(repeat)]
+    for key in startup[0]:
+        vals = [s[key] for s in startup if s[key] is not None]   # no paint seen: None
+        res[key] = round(statistics.median(vals), 3) if vals else None
+    return res
+
+def _startup_once(db: Path) -> dict[str, float]:
+    out = subprocess.run([sys.executable, __file__, "--startup-child", str(db)],
+                         capture_output=True, text=True, check=True, env=dict(os.environ))
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def startup_child(db: Path):
+    """Fresh process: imports, DB init, window construction, first paint of the table, table filled."""
+    t0 = time.perf_counter()
+    import app
+    from PyQt6 import QtWidgets, QtCore
+    use_library(db)
+    core.db_init()
+    qa = QtWidgets.QApplication(sys.argv[:1])
+    app.load_styles(qa)
+    painted = []
+
+    class PaintSpy(QtCore.QObject):
+        def eventFilter(self, obj, ev):
+            if ev.type() == QtCore.QEvent.Type.Paint and not painted:
+                painted.append(time.perf_counter())
+            return False
+
+    w = app.MainWindow()
+    spy = PaintSpy()
+    w.table.viewport().installEventFilter(spy)
+    w.scheduler.pause()
+    w.show()
+    deadline = time.time() + 120
+    while (not painted or w.model.rowCount() == 0) and time.time() < deadline:
+        qa.processEvents()
+        time.sleep(0.001)
+    filled = time.perf_counter()
+    print(json.dumps({
+        "startup_first_paint": (painted[0] - t0) * 1e3 if painted else None,
+        "startup_table_filled": (filled - t0) * 1e3,
+    }))
+    sys.stdout.flush()
+    os._exit(0)   # skip teardown (thread pools, close prompt); the numbers are out
+
+
+# ---------------- reporting ----------------
+def _fmt(ms: float | None) -> str:
+    return "-" if ms is None else f"{ms:.3f}"
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print current vs baseline per metric; return the metrics that regressed past threshold %."""
+    regressions = []
+    print(f"\n{'size':>7}  {'metric':<34}{'baseline':>11}{'now':>11}{'change':>9}")
+    for size, metrics in results["results"].items():
+        base = baseline.get("results", {}).get(size, {})
+        for key, now in metrics.items():
+            was = base.get(key)
+            if was is None or now is None or not was:
+                print(f"{size:>7}  {key:<34}{_fmt(was):>11}{_fmt(now):>11}")
+                continue
+            change = (now - was) / was * 100
+            flag = "  REGRESSION" if change > threshold else ""
+            if flag:
+                regressions.append(f"{size}:{key}")
+            print(f"{size:>7}  {key:<34}{was:>11.3f}{now:>11.3f}{change:>+8.1f}%{flag}")
+    return regressions
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000,10000,100000")
+    ap.add_argument("--covers", type=int, default=48, help="distinct cover images shared by the mods")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--work", type=Path, default=Path(tempfile.gettempdir()) / "b4rt-bench")
+    ap.add_argument("--out", type=Path, help="write results JSON here")
+    ap.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    ap.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=15.0, help="percent slower that counts as a regression")
+    ap.add_argument("--startup-child", type=Path, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.startup_child:
+        startup_child(args.startup_child)
+
+    from PyQt6.QtCore import QT_VERSION_STR
+    import sqlite3
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "qt": QT_VERSION_STR, "sqlite": sqlite3.sqlite_version, "platform": platform.platform(),
+            "cpu_count": os.cpu_count(), "repeat": args.repeat, "covers": args.covers, "seed": args.seed,
+        },
+        "results": {},
+    }
+    for size in (int(s) for s in args.sizes.split(",")):
+        folder = args.work / f"seed{args.seed}-covers{args.covers}" / f"mods-{size}"
+        folder.mkdir(parents=True, exist_ok=True)
+        t0 = time.perf_counter()
+        db = make_library(folder, size, args.covers, args.seed)
+        print(f"[{size} mods] library ready in {time.perf_counter() - t0:.1f}s: {db}", flush=True)
+        results["results"][str(size)] = bench_library(db, args.repeat)
+        for key, val in results["results"][str(size)].items():
+            print(f"[{size} mods] {key:<34}{_fmt(val):>10} ms", flush=True)
+
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2))
+    regressions = []
+    if args.baseline.exists() and not args.save_baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0f}%: {', '.join(regressions)}")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"\nbaseline saved: {args.baseline}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Check that the launcher's list queries are served by indexes, via EXPLAIN QUERY PLAN.
+
+    python benchmarks/check_query_plans.py [--mods 5000]
+
+Captures the exact SQL the db_* calls run (sqlite3 trace callback, with
+bound values) and fails when a plan scans mods without an index or sorts
+in a temp B-tree. Also churns mods and checks that the trigger-kept
+mod_categories table still equals a DISTINCT over mods. Exit code 1 on
+any failure.
+"""
+import argparse, random, sqlite3, sys, tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import launcher_core as core  # noqa: E402
+
+CATEGORIES = ["Vehicles", "weapons", "Maps", "Characters", "props", "UI", "  "]
+
+
+def _make_db(path: Path, n: int, rng: random.Random):
+    core.DB_FILE = path
+    core.db_init()
+    core.db_bulk_insert([{
+        "name": f"mod {rng.randrange(n * 10):07}", "cover_path": "", "bat_path": f"D:/mods/{i}/run.bat",
+        "status": "Ready", "last_run": 0, "version": "", "category": rng.choice(CATEGORIES),
+        "blend_path": "", "work_path": "",
+    } for i in range(n)])
+    core.db_connect().execute("ANALYZE")
+
+
+def _captured(fn) -> list[str]:
+    """SELECT statements (values inlined) that fn() ran on this thread's connection."""
+    con = core.db_connect()
+    seen = []
+    con.set_trace_callback(seen.append)
+    try:
+        fn()
+    finally:
+        con.set_trace_callback(None)
+    return [s for s in seen if s.lstrip().upper().startswith("SELECT")]
+
+
+def _plan_problems(sql: str) -> list[str]:
+    con = core.db_connect()
+    plan = [row[3] for row in con.execute("EXPLAIN QUERY PLAN " + sql)]
+    bad = [p for p in plan if (p.startswith("SCAN mods") and "INDEX" not in p) or "TEMP B-TREE FOR ORDER BY" in p]
+    return [f"{p}\n      in: {sql.strip()}" for p in bad]
+
+
+CHECKS = {
+    "db_fetch_all()": lambda: core.db_fetch_all(),
+    "db_fetch_all(category)": lambda: core.db_fetch_all(None, "Maps"),
+    "db_distinct_categories()": lambda: core.db_distinct_categories(),
+    "db_count_mods(category)": lambda: core.db_count_mods(None, "Maps"),
+    "db_fetch_page()": lambda: core.db_fetch_page(after=("mod 0001000", 0)),
+    "db_fetch_page(category)": lambda: core.db_fetch_page(None, "Maps", after=("mod 0001000", 0)),
+    "db_fetch_page(before)": lambda: core.db_fetch_page(before=("mod 0020000", 0)),
+    "db_page_anchor()": lambda: core.db_page_anchor(None, None, 1000),
+    "db_mod_position()": lambda: core.db_mod_position(10),
+    "db_changes_since()": lambda: core.db_changes_since(core.db_change_rev()),
+    "db_fetch_many()": lambda: core.db_fetch_many(range(1, 300, 7)),
+}
+
+
+def check_plans() -> int:
+    failures = 0
+    for name, fn in CHECKS.items():
+        problems = [p for sql in _captured(fn) for p in _plan_problems(sql)]
+        print(f"{'FAIL' if problems else 'ok  '}  {name}")
+        for p in problems:
+            print(f"      {p}")
+        failures += bool(problems)
+    return failures
+
+
+def check_categories(rng: random.Random, rounds: int = 500) -> int:
+    con = core.db_connect()
+    ids = [r[0] for r in con.execute("SELECT id FROM mods")]
+    for _ in range(rounds):
+        op = rng.random()
+        if op < 0.4:
+            core.db_update(rng.choice(ids), {"name": "x", "category": rng.choice(CATEGORIES + ["New", "new"])})
+        elif op < 0.7 and ids:
+            core.db_delete(ids.pop(rng.randrange(len(ids))))
+        else:
+            ids.append(core.db_insert({"name": "y", "category": rng.choice(CATEGORIES + ["Other"])}))
+    expected = [r[0] for r in con.execute(
+        "SELECT DISTINCT category FROM mods WHERE TRIM(category) <> '' ORDER BY category COLLATE NOCASE")]
+    counts = dict(con.execute("SELECT category, COUNT(*) FROM mods WHERE TRIM(category) <> '' GROUP BY category"))
+    kept = dict(con.execute("SELECT category, mods FROM mod_categories"))
+    ok = core.db_distinct_categories() == expected and kept == counts
+    print(f"{'ok  ' if ok else 'FAIL'}  mod_categories matches DISTINCT after {rounds} edits")
+    if not ok:
+        print(f"      expected {counts}\n      kept     {kept}")
+    return 0 if ok else 1
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mods", type=int, default=5000)
+    args = ap.parse_args()
+    rng = random.Random(1)
+    _make_db(Path(tempfile.mkdtemp(prefix="b4rt-plans-")) / "mods.db", args.mods, rng)
+    print(f"SQLite {sqlite3.sqlite_version}, {args.mods} mods")
+    failures = check_plans() + check_categories(rng)
+    core.db_close()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Headless command line for scripting conversions (CI, build machines).
+
+    python app.py list [-s QUERY] [-c CATEGORY] [--json]
+    python app.py add NAME --bat PATH [--blend PATH] [--cover PATH] [--version V] [--category C] [--work DIR]
+    python app.py run MOD [MOD ...] [-j N]
+    python app.py scan [FOLDER] [--full] [--workers N]
+    python app.py export [--format json|csv] [-o FILE]
+
+MOD is a mod id or its exact name. With B4RT_METRICS=1 a timing snapshot
+is written to data/metrics-<timestamp>.json on exit. Uses the same data folder and DB as the
+GUI and never imports PyQt6, so it starts fast and needs no display.
+"""
+import argparse, configparser, csv, json, os, sys, threading
+
+from launcher_core import (
+    APP_TITLE, APP_DIR, SETTINGS_FILE, MOD_FIELDS, METRICS, ensure_portable_paths,
+    db_init, db_close, db_connect, db_fetch_all, db_fetch_one, db_insert, db_runs_recover, db_set_journal_mode,
+    human_time, human_duration, human_bytes, status_text, scan_base_folder, ProcessSupervisor, ResourceMonitor,
+    STATUS_SUCCEEDED,
+)
+
+EXPORT_FIELDS = ("id",) + MOD_FIELDS + ("last_exit_code", "last_duration")
+
+def read_setting(key: str, default: str = "") -> str:
+    """A [General] value from settings.ini as written by QSettings (IniFormat)."""
+    cp = configparser.ConfigParser(interpolation=None, strict=False)
+    try:
+        cp.read(SETTINGS_FILE, encoding="utf-8")
+    except configparser.Error:
+        return default
+    val = cp.get("General", key, fallback=None)
+    if val is None:
+        return default
+    val = val.strip()
+    if len(val) >= 2 and val[0] == val[-1] == '"':
+        val = val[1:-1]
+    return val.replace('\\"', '"').replace("\\\\", "\\")
+
+def _resolve(refs: list[str]) -> list:
+    """Mods for ids / exact names (case-insensitive), in the given order, without duplicates."""
+    con = db_connect()
+    mods, seen = [], set()
+    for ref in refs:
+        mod = db_fetch_one(int(ref)) if ref.isdigit() else None
+        if mod is None:
+            hit = con.execute("SELECT id FROM mods WHERE name = ? COLLATE NOCASE ORDER BY id LIMIT 1",
+                              (ref,)).fetchone()
+            mod = db_fetch_one(hit[0]) if hit else None
+        if mod is None:
+            raise SystemExit(f"error: no mod with id or name {ref!r}")
+        if mod["id"] not in seen:
+            seen.add(mod["id"])
+            mods.append(mod)
+    return mods
+
+# ------------------ commands ------------------
+def cmd_list(args) -> int:
+    rows = db_fetch_all(args.search, args.category)
+    if args.json:
+        json.dump([{k: r[k] for k in EXPORT_FIELDS} for r in rows], sys.stdout, indent=2)
+        print()
+        return 0
+    name_w = max([len("Name")] + [len(r["name"]) for r in rows])
+    print(f"{'ID':>5}  {'Name':<{name_w}}  {'Category':<14}  {'Last Run':<16}  Status")
+    for r in rows:
+        print(f"{r['id']:>5}  {r['name']:<{name_w}}  {(r['category'] or ''):<14}  "
+              f"{human_time(r['last_run']) if r['last_run'] else '':<16}  {status_text(r)}")
+    return 0
+
+def cmd_add(args) -> int:
+    mod = {
+        "name": args.name, "bat_path": args.bat, "blend_path": args.blend or "", "cover_path": args.cover or "",
+        "version": args.version or "", "category": args.category or "", "work_path": args.work or "",
+    }
+    for key in ("bat_path", "blend_path", "cover_path", "work_path"):
+        if mod[key]:
+            mod[key] = os.path.abspath(mod[key])
+        if mod[key] and not os.path.exists(mod[key]):
+            print(f"warning: {key} does not exist: {mod[key]}", file=sys.stderr)
+    print(db_insert(mod))
+    return 0
+
+def cmd_run(args) -> int:
+    mods = _resolve(args.mods)
+    missing = [m["name"] for m in mods if not m["bat_path"] or not os.path.exists(m["bat_path"])]
+    if missing:
+        raise SystemExit("error: .bat not found for: " + ", ".join(missing))
+
+    slots = threading.Semaphore(max(1, args.jobs))
+    failed = []
+    out_lock = threading.Lock()
+    names = {m["id"]: m["name"] for m in mods}
+
+    def finished(h):
+        ok = h.exit_code == 0
+        if not ok:
+            failed.append(h.mod_id)
+        with out_lock:
+            state = STATUS_SUCCEEDED if ok else f"Failed (exit {h.exit_code})"
+            usage = (f"  peak CPU {h.peaks['peak_cpu']:.0f}%, RAM {human_bytes(h.peaks['peak_rss'])}"
+                     if h.peaks else "")
+            print(f"[{state}] {names[h.mod_id]} in {human_duration(h.duration)}{usage}  log: {h.log_path}", flush=True)
+        slots.release()
+
+    monitor = ResourceMonitor()
+    sup = ProcessSupervisor(on_exit=finished, monitor=monitor)
+    try:
+        for m in mods:
+            slots.acquire()
+            with out_lock:   # held until [Started] is out, so a quick exit can't print its result first
+                try:
+                    h = sup.start(m["id"], m["bat_path"])
+                except Exception as e:
+                    failed.append(m["id"])
+                    slots.release()
+                    print(f"[Failed] {m['name']}: {e}", file=sys.stderr, flush=True)
+                    continue
+                print(f"[Started] {m['name']} (pid {h.pid})", flush=True)
+        sup.wait_all()
+    except KeyboardInterrupt:
+        for h in sup.running():
+            sup.terminate(h.mod_id)
+        if not sup.wait_all(10):
+            sup.abandon()
+        return 130
+    finally:
+        monitor.close()
+    print(f"{len(mods) - len(failed)}/{len(mods)} succeeded")
+    return 1 if failed else 0
+
+def cmd_scan(args) -> int:
+    root = os.path.abspath(args.folder or read_setting("base_folder", str(APP_DIR)))
+    if not os.path.isdir(root):
+        raise SystemExit(f"error: base folder does not exist: {root}")
+    res = scan_base_folder(root, workers=args.workers, full=args.full)
+    print(f"Imported {res['imported']} new mod(s) from {root} "
+          f"({res['scanned']} folders, {res['unchanged']} unchanged, {res['errors']} unreadable)")
+    return 0
+
+def cmd_export(args) -> int:
+    rows = db_fetch_all()
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            w = csv.writer(out)
+            w.writerow(EXPORT_FIELDS)
+            w.writerows([r[k] for k in EXPORT_FIELDS] for r in rows)
+        else:
+            json.dump([{k: r[k] for k in EXPORT_FIELDS} for r in rows], out, indent=2)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="app.py", description=f"{APP_TITLE} (headless). Run without arguments for the GUI.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    s = sub.add_parser("list", help="list mods")
+    s.add_argument("-s", "--search", help="search terms (name, version, category, paths)")
+    s.add_argument("-c", "--category")
+    s.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    s.set_defaults(func=cmd_list)
+
+    s = sub.add_parser("add", help="add a mod, prints its id")
+    s.add_argument("name")
+    s.add_argument("--bat", required=True, help="conversion script (.bat)")
+    s.add_argument("--blend")
+    s.add_argument("--cover")
+    s.add_argument("--version")
+    s.add_argument("--category")
+    s.add_argument("--work", help="working folder")
+    s.set_defaults(func=cmd_add)
+
+    s = sub.add_parser("run", help="run conversions and wait; exit code 1 if any failed")
+    s.add_argument("mods", nargs="+", metavar="MOD", help="mod id or exact name")
+    s.add_argument("-j", "--jobs", type=int, default=1, help="how many to run at once (default 1)")
+    s.set_defaults(func=cmd_run)
+
+    s = sub.add_parser("scan", help="import new mods from the base folder")
+    s.add_argument("folder", nargs="?", help="folder to scan (default: base folder from settings.ini)")
+    s.add_argument("--full", action="store_true", help="ignore the saved scan state")
+    s.add_argument("--workers", type=int)
+    s.set_defaults(func=cmd_scan)
+
+    s = sub.add_parser("export", help="dump all mods as JSON or CSV")
+    s.add_argument("--format", choices=("json", "csv"), default="json")
+    s.add_argument("-o", "--output", help="file to write (default: stdout)")
+    s.set_defaults(func=cmd_export)
+    return p
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        ensure_portable_paths()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    db_set_journal_mode(read_setting("journal_mode", "auto"))
+    db_init()
+    db_runs_recover()
+    try:
+        return args.func(args)
+    finally:
+        if METRICS.enabled:   # B4RT_METRICS=1
+            print(f"metrics: {METRICS.dump()}", file=sys.stderr)
+        db_close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2328 @@
+"""Qt-free core of the launcher: paths, DB layer, base folder scan, run supervisor/scheduler, search.
+
+The GUI (app.py) and the headless CLI (cli.py) both build on this module;
+it must not import PyQt6.
+"""
+import sys, os, subprocess, datetime, sqlite3, threading, json, time, signal, gzip, shutil, heapq, functools, mmap, struct, hashlib
+import math, random, socket
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from pathlib import Path
+
+try:   # zstd-compressed .blend (Blender 3.0+): stdlib from Python 3.14, else the zstandard package
+    from compression import zstd as _zstd
+except ImportError:
+    _zstd = None
+try:
+    import zstandard as _zstandard
+except ImportError:
+    _zstandard = None
+try:   # per-process CPU/memory/IO where there is no /proc (Windows, macOS); optional
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+APP_TITLE = "B4RT Mod Launcher"
+
+# ========= Portable paths (next to EXE/SCRIPT) =========
+def _app_dir() -> Path:
+    # folder of executable when frozen, else script folder
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent
+    return Path(__file__).resolve().parent
+
+APP_DIR  = _app_dir()
+DATA_DIR = (APP_DIR / "data")
+DB_FILE  = DATA_DIR / "mods.db"
+SETTINGS_FILE = DATA_DIR / "settings.ini"
+LOG_DIR = DATA_DIR / "logs"
+
+THUMB_CACHE_MAX_BYTES = 256 * 1024 * 1024  # on-disk banner cache budget (thumb_cache table)
+
+def ensure_portable_paths():
+    """Make sure data dir exists and DB file is creatable, show clear error if not."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        if not DB_FILE.exists():
+            DB_FILE.touch()
+    except Exception as e:
+        raise RuntimeError(f"Failed to create data folder or DB file.\n\n{DB_FILE}\n\n{e}")
+
+# ====================== METRICS ======================
+# Opt-in instrumentation: latency histograms and event counters kept in memory.
+# Every hook starts with `if not METRICS.enabled`, so a disabled build pays one
+# attribute check per call. Enabled from settings.ini (metrics_enabled, GUI) or
+# B4RT_METRICS=1 (CLI); dumped as JSON or Prometheus text into data/.
+METRIC_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                  0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0)   # seconds, upper bounds
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(METRIC_BUCKETS) + 1)   # last one is +Inf
+        self.count, self.sum, self.max = 0, 0.0, 0.0
+
+    def observe(self, sec: float):
+        self.counts[bisect_left(METRIC_BUCKETS, sec)] += 1
+        self.count += 1
+        self.sum += sec
+        if sec > self.max:
+            self.max = sec
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(METRIC_BUCKETS[i], self.max) if i < len(METRIC_BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "sum": self.sum, "max": self.max,
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95), "buckets": list(self.counts)}
+
+class _Timer:
+    __slots__ = ("metrics", "name", "t0")
+
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics, self.name = metrics, name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter() if self.metrics.enabled else None
+        return self
+
+    def __exit__(self, *exc):
+        if self.t0 is not None:
+            self.metrics.observe(self.name, time.perf_counter() - self.t0)
+
+class Metrics:
+    """Named latency histograms (seconds) and counters; safe to update from any thread."""
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._collectors: dict[str, object] = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.histograms: dict[str, Histogram] = {}
+            self.counters: dict[str, int] = {}
+            self.since = time.time()
+
+    def observe(self, name: str, sec: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            h = self.histograms.get(name)
+            if h is None:
+                h = self.histograms[name] = Histogram()
+            h.observe(sec)
+
+    def count(self, name: str, n: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def timer(self, name: str) -> _Timer:
+        """`with METRICS.timer("refresh.query"): ...` records the block's duration."""
+        return _Timer(self, name)
+
+    def add_collector(self, name: str, fn):
+        """fn() -> {key: number}, read at snapshot time (e.g. a cache's own hit counters)."""
+        self._collectors[name] = fn
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            hists = {k: h.to_dict() for k, h in self.histograms.items()}
+            counters = dict(self.counters)
+        gauges = {}
+        for name, fn in self._collectors.items():
+            try:
+                gauges[name] = {k: v for k, v in fn().items() if isinstance(v, (int, float))}
+            except Exception:
+                continue
+        return {"since": self.since, "taken": time.time(), "enabled": self.enabled,
+                "buckets": list(METRIC_BUCKETS), "histograms": hists, "counters": counters, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        snap = self.snapshot()
+        out = ["# TYPE b4rt_duration_seconds histogram"]
+        for op, h in sorted(snap["histograms"].items()):
+            cum = 0
+            for bound, n in zip(list(METRIC_BUCKETS) + ["+Inf"], h["buckets"]):
+                cum += n
+                out.append(f'b4rt_duration_seconds_bucket{{op="{op}",le="{bound}"}} {cum}')
+            out.append(f'b4rt_duration_seconds_sum{{op="{op}"}} {h["sum"]:.6f}')
+            out.append(f'b4rt_duration_seconds_count{{op="{op}"}} {h["count"]}')
+        out.append("# TYPE b4rt_events_total counter")
+        out += [f'b4rt_events_total{{event="{k}"}} {v}' for k, v in sorted(snap["counters"].items())]
+        out.append("# TYPE b4rt_gauge gauge")
+        for src, vals in sorted(snap["gauges"].items()):
+            out += [f'b4rt_gauge{{source="{src}",key="{k}"}} {v}' for k, v in sorted(vals.items())]
+        return "\n".join(out) + "\n"
+
+    def dump(self, path: Path | None = None, fmt: str = "json") -> Path:
+        """Write a snapshot to `path` (default data/metrics-<timestamp>.json|.prom); returns the path."""
+        if path is None:
+            stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            path = DATA_DIR / f"metrics-{stamp}.{'prom' if fmt == 'prometheus' else 'json'}"
+        path = Path(path)
+        text = self.to_prometheus() if fmt == "prometheus" else json.dumps(self.snapshot(), indent=2)
+        path.write_text(text, encoding="utf-8")
+        return path
+
+METRICS = Metrics(enabled=os.environ.get("B4RT_METRICS") == "1")
+
+def timed(name: str):
+    """Decorator: record each call's duration under `name` while METRICS is enabled."""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                METRICS.observe(name, time.perf_counter() - t0)
+        return wrapper
+    return deco
+
+# ====================== DB LAYER ======================
+# One long-lived connection per thread (GUI thread + each pool worker), opened
+# on first use and tuned once. Write through db_transaction() so nested calls
+# (e.g. a bulk import calling db_insert) commit once at the outermost level.
+# Several launchers may share one DB: a writer that finds it locked waits
+# busy_timeout, then retries BEGIN (and COMMIT) with jittered exponential
+# backoff. WAL needs shared memory between all connections, so it only
+# works when they are on one machine; a DB on a network share used from
+# several machines needs the rollback journal (journal_mode in settings.ini,
+# "auto" picks it for network paths).
+DB_PRAGMAS = (
+    "PRAGMA busy_timeout = 1000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",       # ~16 MB page cache
+)
+JOURNAL_PRAGMAS = {
+    "wal": (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",      # durable at checkpoints; safe with WAL
+        "PRAGMA mmap_size = 268435456",
+    ),
+    "delete": (
+        "PRAGMA journal_mode = DELETE",
+        "PRAGMA synchronous = FULL",
+        "PRAGMA mmap_size = 0",             # no mmap of a file other machines write
+        "PRAGMA busy_timeout = 5000",       # readers and writers take turns here, so reads wait too
+    ),
+}
+DB_JOURNAL_MODE = "auto"   # "wal", "delete" or "auto"; see db_set_journal_mode
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p", "ceph", "glusterfs", "fuse.sshfs",
+                       "davfs", "fuse.rclone"}
+_db_local = threading.local()
+_journal_warned: list[str] = []
+
+def db_set_journal_mode(mode: str | None):
+    """settings.ini journal_mode; call before the first db_connect()."""
+    global DB_JOURNAL_MODE
+    mode = (mode or "auto").strip().lower()
+    if mode != "auto" and mode not in JOURNAL_PRAGMAS:
+        print(f"[DB]   Unknown journal_mode {mode!r}, using auto", file=sys.stderr)
+        mode = "auto"
+    DB_JOURNAL_MODE = mode
+
+@functools.lru_cache(maxsize=16)
+def is_network_path(path: str) -> bool:
+    """Whether `path` is on a network share (UNC/mapped drive on Windows, NFS/SMB/... mount elsewhere)."""
+    p = os.path.realpath(path)
+    if sys.platform.startswith("win"):
+        if p.startswith("\\\\"):
+            return True
+        import ctypes
+        return ctypes.windll.kernel32.GetDriveTypeW(os.path.splitdrive(p)[0] + "\\") == 4   # DRIVE_REMOTE
+    try:
+        with open("/proc/mounts", encoding="utf-8", errors="replace") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False   # no /proc (macOS): assume local
+    best, fstype = "", ""
+    for mnt, fs in mounts:
+        mnt = mnt.replace("\\040", " ")
+        if (p == mnt or p.startswith(mnt.rstrip("/") + "/")) and len(mnt) > len(best):
+            best, fstype = mnt, fs
+    return fstype in NETWORK_FILESYSTEMS
+
+def db_journal_mode(path=None) -> str:
+    """"wal" or "delete" for `path` (default DB_FILE), resolving "auto"."""
+    if DB_JOURNAL_MODE != "auto":
+        return DB_JOURNAL_MODE
+    return "delete" if is_network_path(str(path or DB_FILE)) else "wal"
+
+def _db_open(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=5.0, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    mode = db_journal_mode(path)
+    for pragma in JOURNAL_PRAGMAS[mode]:
+        got = conn.execute(pragma).fetchone()
+        if pragma.startswith("PRAGMA journal_mode") and got and got[0].lower() != mode and not _journal_warned:
+            # leaving WAL needs every other connection (other launchers too) closed; stays as is until then
+            _journal_warned.append(mode)
+            print(f"[DB]   journal_mode {mode} requested, still {got[0]} (DB in use elsewhere?)", file=sys.stderr)
+    return conn
+
+def db_connect() -> sqlite3.Connection:
+    """This thread's shared connection to DB_FILE (do not close it; see db_close)."""
+    conn = getattr(_db_local, "conn", None)
+    if conn is None or _db_local.path != DB_FILE:
+        if conn is not None:
+            conn.close()
+        conn = _db_open(DB_FILE)
+        _db_local.conn, _db_local.path, _db_local.tx_depth = conn, DB_FILE, 0
+    return conn
+
+def db_close():
+    """Close this thread's connection (next db_connect() reopens)."""
+    conn = getattr(_db_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _db_local.conn = None
+
+DB_BUSY_RETRIES = 8          # BEGIN attempts after the first, each after busy_timeout ran out
+DB_BUSY_BACKOFF = (0.05, 2.0)   # first / longest sleep between them, seconds (jittered ±50%)
+
+def _is_busy(e: sqlite3.OperationalError) -> bool:
+    msg = str(e).lower()
+    return "locked" in msg or "busy" in msg
+
+def _retry_busy(fn):
+    delay, longest = DB_BUSY_BACKOFF
+    for attempt in range(DB_BUSY_RETRIES + 1):
+        try:
+            return fn()
+        except sqlite3.OperationalError as e:
+            if not _is_busy(e) or attempt == DB_BUSY_RETRIES:
+                raise
+        METRICS.count("db.busy_retry")
+        time.sleep(delay * random.uniform(0.5, 1.5))
+        delay = min(delay * 2, longest)
+
+def _begin_immediate(con):
+    _retry_busy(lambda: con.execute("BEGIN IMMEDIATE"))
+
+@contextmanager
+def db_transaction():
+    """BEGIN IMMEDIATE … COMMIT on this thread's connection; nested uses join the outer one."""
+    con = db_connect()
+    depth = _db_local.tx_depth
+    if depth == 0:
+        _begin_immediate(con)
+    _db_local.tx_depth = depth + 1
+    try:
+        yield con
+    except BaseException:
+        _db_local.tx_depth = depth
+        if depth == 0:
+            con.rollback()
+        raise
+    _db_local.tx_depth = depth
+    if depth == 0:
+        try:
+            # with a rollback journal COMMIT waits for readers to let go and can time out; the
+            # transaction stays open, so retrying is safe
+            _retry_busy(con.commit)
+        except BaseException:
+            con.rollback()
+            raise
+
+def _column_exists(con, table, col):
+    cur = con.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == col for row in cur.fetchall())
+
+# PRAGMA user_version of a fully migrated DB. Bump it whenever db_init's
+# schema block changes so existing DBs run the (idempotent) block once more.
+SCHEMA_VERSION = 10
+
+def db_init():
+    """Create/migrate the schema; a no-op past one PRAGMA when the DB is already current."""
+    if db_connect().execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    with db_transaction() as con:
+        if con.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return   # another process migrated it meanwhile
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS mods (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                cover_path TEXT NOT NULL DEFAULT '',
+                bat_path TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL DEFAULT 'Ready',
+                last_run INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        # migrations; mods tables from older launchers (cover/blend_file/project_folder) lack even the base
+        # columns, and the FTS rebuild and indexes below need all of them
+        if not _column_exists(con, "mods", "cover_path"):
+            con.execute("ALTER TABLE mods ADD COLUMN cover_path TEXT NOT NULL DEFAULT ''")
+            if _column_exists(con, "mods", "cover"):
+                con.execute("UPDATE mods SET cover_path = COALESCE(cover, '')")
+        if not _column_exists(con, "mods", "bat_path"):
+            con.execute("ALTER TABLE mods ADD COLUMN bat_path TEXT NOT NULL DEFAULT ''")
+        if not _column_exists(con, "mods", "status"):
+            con.execute("ALTER TABLE mods ADD COLUMN status TEXT NOT NULL DEFAULT 'Ready'")
+        if not _column_exists(con, "mods", "last_run"):
+            con.execute("ALTER TABLE mods ADD COLUMN last_run INTEGER NOT NULL DEFAULT 0")
+        if not _column_exists(con, "mods", "version"):
+            con.execute("ALTER TABLE mods ADD COLUMN version TEXT NOT NULL DEFAULT ''")
+        if not _column_exists(con, "mods", "category"):
+            con.execute("ALTER TABLE mods ADD COLUMN category TEXT NOT NULL DEFAULT ''")
+        if not _column_exists(con, "mods", "blend_path"):
+            con.execute("ALTER TABLE mods ADD COLUMN blend_path TEXT NOT NULL DEFAULT ''")
+        if not _column_exists(con, "mods", "work_path"):
+            con.execute("ALTER TABLE mods ADD COLUMN work_path TEXT NOT NULL DEFAULT ''")
+        if not _column_exists(con, "mods", "last_exit_code"):
+            con.execute("ALTER TABLE mods ADD COLUMN last_exit_code INTEGER")
+        if not _column_exists(con, "mods", "last_duration"):
+            con.execute("ALTER TABLE mods ADD COLUMN last_duration REAL")
+        if _column_exists(con, "mods", "blend_file"):
+            con.execute("UPDATE mods SET blend_path = blend_file WHERE blend_path = '' AND blend_file <> ''")
+        if _column_exists(con, "mods", "project_folder"):
+            con.execute("UPDATE mods SET work_path = project_folder WHERE work_path = '' AND project_folder <> ''")
+        # the legacy columns are nullable; everything downstream (ModRecord, FTS, sorting) expects text
+        con.execute("UPDATE mods SET name = COALESCE(name, ''), version = COALESCE(version, ''), "
+                    "category = COALESCE(category, '') WHERE name IS NULL OR version IS NULL OR category IS NULL")
+        # keyset paging / name ordering (db_fetch_page)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_mods_name_id ON mods(name, id)")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_mods_category_name_id ON mods(category, name, id)")
+        _categories_init(con)
+        # content hash of every cover source, so unchanged files are never hashed twice (cover_digest)
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS cover_hashes (
+                path TEXT PRIMARY KEY,
+                src_mtime INTEGER NOT NULL,
+                src_size INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            )
+        """)
+        # pre-scaled cover banners by content: identical images at different paths share one entry.
+        # Pre-v5 caches were keyed by path; they are only a cache, so they are dropped, not converted.
+        if _column_exists(con, "thumb_cache", "path"):
+            con.execute("DROP TABLE thumb_cache")
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS thumb_cache (
+                digest TEXT NOT NULL,
+                w INTEGER NOT NULL,
+                h INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                bytes INTEGER NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (digest, w, h)
+            )
+        """)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_thumb_cache_last_used ON thumb_cache(last_used)")
+        # base-folder scan state: per directory mtime + child dirs, for incremental rescans
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS scan_dirs (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER NOT NULL,
+                subdirs TEXT NOT NULL DEFAULT '[]'
+            )
+        """)
+        # one row per launch, linked to its captured output
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS run_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                mod_id INTEGER NOT NULL,
+                started_at REAL NOT NULL,
+                finished_at REAL,
+                exit_code INTEGER,
+                status TEXT NOT NULL DEFAULT 'Running',
+                log_path TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_run_history_mod ON run_history(mod_id, started_at DESC)")
+        if not _column_exists(con, "run_history", "peak_rss"):
+            con.execute("ALTER TABLE run_history ADD COLUMN peak_rss INTEGER")
+        # sampled by ResourceMonitor over the run's process tree
+        for col in ("peak_cpu", "peak_read_bps", "peak_write_bps"):
+            if not _column_exists(con, "run_history", col):
+                con.execute(f"ALTER TABLE run_history ADD COLUMN {col} REAL")
+        # host + pid of the launcher that owns the run, so a restart can tell cut-off runs from live ones
+        # (db_runs_recover); the DB may be shared by launchers on several machines
+        if not _column_exists(con, "run_history", "launcher_pid"):
+            con.execute("ALTER TABLE run_history ADD COLUMN launcher_pid INTEGER")
+        if not _column_exists(con, "run_history", "launcher_host"):
+            con.execute("ALTER TABLE run_history ADD COLUMN launcher_host TEXT")
+        # runs left open by launchers that didn't record an owner can't be judged later; close them once here
+        con.execute("UPDATE run_history SET finished_at = ?, status = ? WHERE finished_at IS NULL AND launcher_pid IS NULL",
+                    (time.time(), STATUS_INTERRUPTED))
+        con.execute("CREATE INDEX IF NOT EXISTS idx_run_history_finished ON run_history(finished_at)")
+        # per-mod duration aggregates, updated as each run ends (see db_run_end)
+        stats_new = not con.execute("SELECT 1 FROM sqlite_master WHERE name = 'mod_run_stats'").fetchone()
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS mod_run_stats (
+                mod_id INTEGER PRIMARY KEY,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                run_successes INTEGER NOT NULL DEFAULT 0,
+                recent_durations TEXT NOT NULL DEFAULT '[]',
+                median_duration REAL,
+                p95_duration REAL
+            )
+        """)
+        if stats_new:
+            _run_stats_backfill(con)
+        else:
+            _run_stats_recompute(con)
+        # header facts of each .blend (see read_blend_info), refreshed when the file's mtime/size change
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS blend_meta (
+                path TEXT PRIMARY KEY,
+                src_mtime INTEGER NOT NULL,
+                src_size INTEGER NOT NULL,
+                version TEXT NOT NULL DEFAULT '',
+                pointer_size INTEGER,
+                endian TEXT NOT NULL DEFAULT '',
+                compression TEXT NOT NULL DEFAULT '',
+                thumb_w INTEGER,
+                thumb_h INTEGER
+            )
+        """)
+        # batch run queue; survives restarts (running jobs are re-queued on startup)
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS run_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                mod_id INTEGER NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                state TEXT NOT NULL DEFAULT 'queued',
+                enqueued_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                exit_code INTEGER
+            )
+        """)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_run_queue_state ON run_queue(state, priority DESC, id)")
+        # launcher that claimed a running job; recover() only takes back jobs whose owner is gone
+        if not _column_exists(con, "run_queue", "launcher_host"):
+            con.execute("ALTER TABLE run_queue ADD COLUMN launcher_host TEXT")
+            con.execute("ALTER TABLE run_queue ADD COLUMN launcher_pid INTEGER")
+            con.execute("UPDATE run_queue SET state = 'queued', started_at = NULL WHERE state = 'running'")
+        _fts_init(con)
+        _changes_init(con)
+        con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+def _changes_init(con):
+    """mod_changes: one row per change to what a mod row shows (mods, run stats, .blend facts), by triggers.
+
+    rev only grows (AUTOINCREMENT), so another launcher on the same DB can
+    ask for everything after the last rev it saw (db_changes_since).
+    """
+    if con.execute("SELECT 1 FROM sqlite_master WHERE name = 'mod_changes'").fetchone():
+        return
+    con.execute("""
+        CREATE TABLE mod_changes (
+            rev INTEGER PRIMARY KEY AUTOINCREMENT,
+            mod_id INTEGER NOT NULL
+        )
+    """)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_mods_blend_path ON mods(blend_path)")
+    for name, event, mod_id in (("mods_ai", "AFTER INSERT ON mods", "new.id"),
+                                ("mods_au", "AFTER UPDATE ON mods", "new.id"),
+                                ("mods_ad", "AFTER DELETE ON mods", "old.id"),
+                                ("stats_ai", "AFTER INSERT ON mod_run_stats", "new.mod_id"),
+                                ("stats_au", "AFTER UPDATE ON mod_run_stats", "new.mod_id")):
+        con.execute(f"""
+            CREATE TRIGGER mod_changes_{name} {event} BEGIN
+                INSERT INTO mod_changes(mod_id) VALUES ({mod_id});
+            END
+        """)
+    for name, event in (("blend_ai", "AFTER INSERT ON blend_meta"), ("blend_au", "AFTER UPDATE ON blend_meta")):
+        con.execute(f"""
+            CREATE TRIGGER mod_changes_{name} {event} BEGIN
+                INSERT INTO mod_changes(mod_id) SELECT id FROM mods WHERE blend_path = new.path;
+            END
+        """)
+
+def _categories_init(con):
+    """mod_categories: distinct non-blank categories with their mod count, kept by triggers on mods."""
+    if con.execute("SELECT 1 FROM sqlite_master WHERE name = 'mod_categories'").fetchone():
+        return
+    con.execute("""
+        CREATE TABLE mod_categories (
+            category TEXT PRIMARY KEY,
+            mods INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    con.execute("CREATE INDEX idx_mod_categories_nocase ON mod_categories(category COLLATE NOCASE)")
+    add = """INSERT INTO mod_categories(category, mods) VALUES (new.category, 1)
+                 ON CONFLICT(category) DO UPDATE SET mods = mods + 1"""
+    drop = """UPDATE mod_categories SET mods = mods - 1 WHERE category = old.category;
+              DELETE FROM mod_categories WHERE category = old.category AND mods <= 0"""
+    con.execute(f"""
+        CREATE TRIGGER mod_categories_ai AFTER INSERT ON mods WHEN TRIM(new.category) <> '' BEGIN
+            {add};
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER mod_categories_ad AFTER DELETE ON mods WHEN TRIM(old.category) <> '' BEGIN
+            {drop};
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER mod_categories_au_old AFTER UPDATE OF category ON mods
+        WHEN old.category IS NOT new.category AND TRIM(old.category) <> '' BEGIN
+            {drop};
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER mod_categories_au_new AFTER UPDATE OF category ON mods
+        WHEN old.category IS NOT new.category AND TRIM(new.category) <> '' BEGIN
+            {add};
+        END
+    """)
+    con.execute("""
+        INSERT INTO mod_categories(category, mods)
+        SELECT category, COUNT(*) FROM mods WHERE TRIM(category) <> '' GROUP BY category
+    """)
+
+# ----- full-text search (FTS5) -----
+FTS_COLUMNS = ("name", "version", "category", "bat_path", "blend_path")
+_fts_tokenizer_cache: str | None = None   # "trigram" | "unicode61" | "" (no FTS5)
+
+def _fts_init(con):
+    """Create mods_fts (external content over mods) + sync triggers; backfill on first creation."""
+    if con.execute("SELECT 1 FROM sqlite_master WHERE name = 'mods_fts'").fetchone():
+        return
+    cols = ", ".join(FTS_COLUMNS)
+    created = False
+    for tokenize in ("trigram", "unicode61 remove_diacritics 2"):
+        prefix = "" if tokenize == "trigram" else ", prefix='2 3'"
+        try:
+            con.execute(f"""
+                CREATE VIRTUAL TABLE mods_fts USING fts5(
+                    {cols}, content='mods', content_rowid='id', tokenize='{tokenize}'{prefix}
+                )
+            """)
+            created = True
+            break
+        except sqlite3.OperationalError:
+            continue  # tokenizer (or FTS5 itself) not compiled in
+    if not created:
+        return
+    new_vals = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_vals = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS mods_fts_ai AFTER INSERT ON mods BEGIN
+            INSERT INTO mods_fts(rowid, {cols}) VALUES (new.id, {new_vals});
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS mods_fts_ad AFTER DELETE ON mods BEGIN
+            INSERT INTO mods_fts(mods_fts, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS mods_fts_au AFTER UPDATE OF {cols} ON mods BEGIN
+            INSERT INTO mods_fts(mods_fts, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+            INSERT INTO mods_fts(rowid, {cols}) VALUES (new.id, {new_vals});
+        END
+    """)
+    con.execute("INSERT INTO mods_fts(mods_fts) VALUES ('rebuild')")
+
+def _fts_tokenizer(con) -> str:
+    global _fts_tokenizer_cache
+    if _fts_tokenizer_cache is None:
+        row = con.execute("SELECT sql FROM sqlite_master WHERE name = 'mods_fts'").fetchone()
+        if row is None:
+            _fts_tokenizer_cache = ""
+        else:
+            _fts_tokenizer_cache = "trigram" if "trigram" in row[0] else "unicode61"
+    return _fts_tokenizer_cache
+
+def _fts_query(terms: list[str], tokenizer: str) -> tuple[str, list[str]]:
+    """Split search terms into an FTS5 MATCH expression and the terms it can't serve.
+
+    trigram needs 3+ characters per term; shorter ones are left for LIKE.
+    """
+    match, rest = [], []
+    for t in terms:
+        quoted = '"' + t.replace('"', '""') + '"'
+        if tokenizer == "trigram":
+            if len(t) >= 3:
+                match.append(quoted)
+            else:
+                rest.append(t)
+        else:
+            match.append(quoted + "*")
+    return " AND ".join(match), rest
+
+# mods plus their run aggregates (mod_run_stats) and .blend header facts (blend_meta);
+# every row the UI shows comes through this, as a ModRecord with these fields in this order
+MOD_TABLE_FIELDS = ("id", "name", "cover_path", "bat_path", "status", "last_run", "version", "category",
+                    "blend_path", "work_path", "last_exit_code", "last_duration")
+MOD_COLUMNS = (", ".join(f"mods.{c}" for c in MOD_TABLE_FIELDS) +
+               ", s.run_count, s.run_successes, s.median_duration, s.p95_duration,"
+               " b.version AS blend_version, b.compression AS blend_compression")
+MOD_JOINS = ("LEFT JOIN mod_run_stats s ON s.mod_id = mods.id"
+             " LEFT JOIN blend_meta b ON b.path = mods.blend_path")
+MOD_SELECT = f"SELECT {MOD_COLUMNS} FROM mods {MOD_JOINS}"
+
+def _mod_filter(con, name_filter: str | None, category_filter: str | None) -> tuple[str, list[str], list]:
+    """(FTS MATCH expression or "", extra WHERE clauses, their args) for a search + category."""
+    terms = name_filter.split() if name_filter else []
+    tokenizer = _fts_tokenizer(con) if terms else ""
+    match, like_terms = _fts_query(terms, tokenizer) if tokenizer else ("", terms)
+    where, args = [], []
+    for t in like_terms:
+        where.append("(" + " OR ".join(f"LOWER(mods.{c}) LIKE ?" for c in FTS_COLUMNS) + ")")
+        args.extend([f"%{t.lower()}%"] * len(FTS_COLUMNS))
+    if category_filter and category_filter.lower() != "__all__":
+        where.append("mods.category = ?")
+        args.append(category_filter)
+    return match, where, args
+
+def _mod_records(con, sql: str, args=()) -> list["ModRecord"]:
+    cur = con.cursor()
+    cur.row_factory = _record_factory
+    return cur.execute(sql, args).fetchall()
+
+def db_fetch_all(name_filter: str | None = None, category_filter: str | None = None):
+    """Mods matching every search term (name, version, category, bat/blend path), best match first."""
+    con = db_connect()
+    match, where, args = _mod_filter(con, name_filter, category_filter)
+    if match:
+        q = (f"SELECT {MOD_COLUMNS} FROM mods_fts JOIN mods ON mods.id = mods_fts.rowid {MOD_JOINS}"
+             " WHERE mods_fts MATCH ?")
+        args.insert(0, match)
+    else:
+        q = MOD_SELECT + " WHERE 1=1"
+    for w in where:
+        q += " AND " + w
+    if match:
+        # name hits weigh most, then version/category, then paths
+        q += " ORDER BY bm25(mods_fts, 10.0, 4.0, 4.0, 1.0, 1.0), mods.name ASC"
+    else:
+        q += " ORDER BY mods.name ASC"
+    return _mod_records(con, q, args)
+
+# ----- keyset paging over (name, id), for libraries too big to hold in memory -----
+def _page_where(con, name_filter: str | None, category_filter: str | None) -> tuple[str, list]:
+    match, where, args = _mod_filter(con, name_filter, category_filter)
+    if match:
+        where.insert(0, "mods.id IN (SELECT rowid FROM mods_fts WHERE mods_fts MATCH ?)")
+        args.insert(0, match)
+    return (" WHERE " + " AND ".join(where)) if where else " WHERE 1=1", args
+
+def db_count_mods(name_filter: str | None = None, category_filter: str | None = None) -> int:
+    con = db_connect()
+    where, args = _page_where(con, name_filter, category_filter)
+    return con.execute("SELECT COUNT(*) FROM mods" + where, args).fetchone()[0]
+
+def db_fetch_page(name_filter: str | None = None, category_filter: str | None = None, *,
+                  after: tuple[str, int] | None = None, before: tuple[str, int] | None = None,
+                  inclusive: bool = False, limit: int = 200) -> list:
+    """Up to `limit` mods in (name, id) order following `after` (or preceding `before`).
+
+    Seeks on idx_mods_name_id, so the cost does not grow with the page's
+    position the way OFFSET does. inclusive=True also returns the `after` key itself.
+    """
+    con = db_connect()
+    where, args = _page_where(con, name_filter, category_filter)
+    order = "ASC"
+    if after is not None:
+        where += f" AND (mods.name, mods.id) {'>=' if inclusive else '>'} (?, ?)"
+        args += list(after)
+    elif before is not None:
+        where += " AND (mods.name, mods.id) < (?, ?)"
+        args += list(before)
+        order = "DESC"
+    rows = _mod_records(con, f"{MOD_SELECT}{where} ORDER BY mods.name {order}, mods.id {order} LIMIT ?",
+                        args + [limit])
+    return rows[::-1] if order == "DESC" else rows
+
+def db_page_anchor(name_filter: str | None, category_filter: str | None, position: int) -> tuple[str, int] | None:
+    """(name, id) key of the row at `position`, for jumping into the middle without neighbouring pages.
+
+    Walks only the (name, id) index, never the rows.
+    """
+    con = db_connect()
+    where, args = _page_where(con, name_filter, category_filter)
+    row = con.execute(f"SELECT mods.name, mods.id FROM mods{where} ORDER BY mods.name, mods.id LIMIT 1 OFFSET ?",
+                      args + [position]).fetchone()
+    return (row[0], row[1]) if row else None
+
+def db_mod_position(mod_id: int, name_filter: str | None = None, category_filter: str | None = None) -> int:
+    """Index of a mod in the (name, id) ordered, filtered list; -1 when it doesn't match."""
+    con = db_connect()
+    where, args = _page_where(con, name_filter, category_filter)
+    key = con.execute(f"SELECT mods.name, mods.id FROM mods{where} AND mods.id = ?", args + [mod_id]).fetchone()
+    if key is None:
+        return -1
+    return con.execute(f"SELECT COUNT(*) FROM mods{where} AND (mods.name, mods.id) < (?, ?)",
+                       args + [key[0], key[1]]).fetchone()[0]
+
+def db_mod_ids_named(name: str) -> list[int]:
+    """Ids of the mods with this name, ignoring case and surrounding spaces (the DB side of ModStore.ids_named)."""
+    con = db_connect()
+    return [r[0] for r in con.execute("SELECT id FROM mods WHERE TRIM(name) = ? COLLATE NOCASE ORDER BY id",
+                                      (name.strip(),))]
+
+# ----- change log (mod_changes), for launchers sharing one DB -----
+CHANGE_LOG_KEEP = 50000   # newest change rows kept by db_changes_prune()
+
+def db_data_version() -> int:
+    """Bumps whenever another connection (thread or process) commits to the DB; costs no I/O."""
+    return db_connect().execute("PRAGMA data_version").fetchone()[0]
+
+def db_change_rev() -> int:
+    return db_connect().execute("SELECT COALESCE(MAX(rev), 0) FROM mod_changes").fetchone()[0]
+
+def db_changes_since(rev: int) -> tuple[int, list[int]] | None:
+    """(newest rev, ids of mods changed after `rev`), or None when the log can't answer that
+    (pruned past it, or the DB was replaced) and the caller must reload everything."""
+    con = db_connect()
+    rows = con.execute("SELECT rev, mod_id FROM mod_changes WHERE rev >= ? ORDER BY rev", (rev,)).fetchall()
+    # the row for `rev` itself (or rev 1, from 0) proves nothing in between was pruned
+    first = rows[0][0] if rows else None
+    if (rev and first != rev) or (not rev and rows and first != 1):
+        return None
+    newest = rows[-1][0] if rows else rev
+    return newest, list(dict.fromkeys(mod_id for r, mod_id in rows if r > rev))
+
+def db_changes_prune(keep: int = CHANGE_LOG_KEEP) -> int:
+    with db_transaction() as con:
+        return con.execute("DELETE FROM mod_changes WHERE rev <= (SELECT MAX(rev) FROM mod_changes) - ?",
+                           (keep,)).rowcount
+
+def db_fetch_many(mod_ids) -> list["ModRecord"]:
+    con = db_connect()
+    ids = list(mod_ids)
+    rows = []
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        rows += _mod_records(con, f"{MOD_SELECT} WHERE mods.id IN ({','.join('?' * len(chunk))})", chunk)
+    return rows
+
+def db_distinct_categories():
+    con = db_connect()
+    rows = con.execute("SELECT category FROM mod_categories ORDER BY category COLLATE NOCASE").fetchall()
+    return [r[0] for r in rows]
+
+def db_insert(mod: dict) -> int:
+    with db_transaction() as con:
+        cur = con.execute("""
+            INSERT INTO mods (name, cover_path, bat_path, status, last_run, version, category, blend_path, work_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            mod.get("name",""),
+            mod.get("cover_path",""),
+            mod.get("bat_path",""),
+            mod.get("status","Ready"),
+            int(mod.get("last_run", 0)),
+            mod.get("version","").strip(),
+            mod.get("category","").strip(),
+            mod.get("blend_path","").strip(),
+            mod.get("work_path","").strip(),
+        ))
+        return cur.lastrowid
+
+def db_update(mod_id: int, mod: dict):
+    with db_transaction() as con:
+        con.execute("""
+            UPDATE mods
+               SET name = ?, cover_path = ?, bat_path = ?, status = ?, last_run = ?, version = ?, category = ?, blend_path = ?, work_path = ?
+             WHERE id = ?
+        """, (
+            mod.get("name",""),
+            mod.get("cover_path",""),
+            mod.get("bat_path",""),
+            mod.get("status","Ready"),
+            int(mod.get("last_run", 0)),
+            mod.get("version","").strip(),
+            mod.get("category","").strip(),
+            mod.get("blend_path","").strip(),
+            mod.get("work_path","").strip(),
+            mod_id
+        ))
+
+def db_delete(mod_id: int):
+    with db_transaction() as con:
+        con.execute("DELETE FROM mods WHERE id = ?", (mod_id,))
+
+def db_update_run(mod_id: int, status: str, last_run_ts: int):
+    with db_transaction() as con:
+        con.execute("UPDATE mods SET status = ?, last_run = ? WHERE id = ?",
+                    (status, int(last_run_ts), mod_id))
+
+def db_finish_run(mod_id: int, status: str, exit_code: int | None, duration: float):
+    with db_transaction() as con:
+        con.execute("UPDATE mods SET status = ?, last_exit_code = ?, last_duration = ? WHERE id = ?",
+                    (status, exit_code, float(duration), mod_id))
+
+# ----- run history -----
+RUN_STATS_WINDOW = 50   # successful durations kept per mod for median/p95
+
+def _percentile(sorted_vals: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_vals:
+        return None
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(pct * len(sorted_vals) / 100.0) - 1))
+    return sorted_vals[k]
+
+def _run_stats_add(con, mod_id: int, duration: float | None, success: bool):
+    """Fold one finished run into mod_run_stats: O(window), no scan of run_history."""
+    row = con.execute("SELECT * FROM mod_run_stats WHERE mod_id = ?", (mod_id,)).fetchone()
+    recent = json.loads(row["recent_durations"]) if row else []
+    if success and duration is not None:
+        recent = (recent + [round(duration, 3)])[-RUN_STATS_WINDOW:]
+    ordered = sorted(recent)
+    con.execute("""
+        INSERT INTO mod_run_stats (mod_id, run_count, run_successes, recent_durations, median_duration, p95_duration)
+        VALUES (?, 1, ?, ?, ?, ?)
+        ON CONFLICT(mod_id) DO UPDATE SET
+            run_count = run_count + 1,
+            run_successes = run_successes + excluded.run_successes,
+            recent_durations = excluded.recent_durations,
+            median_duration = excluded.median_duration,
+            p95_duration = excluded.p95_duration
+    """, (mod_id, int(success), json.dumps(recent), _percentile(ordered, 50), _percentile(ordered, 95)))
+
+def _run_stats_backfill(con):
+    """One-off: build mod_run_stats from runs recorded before it existed."""
+    for r in con.execute("""
+        SELECT mod_id, finished_at - started_at AS duration, exit_code
+          FROM run_history WHERE finished_at IS NOT NULL AND status <> 'Interrupted' ORDER BY started_at
+    """).fetchall():
+        _run_stats_add(con, r["mod_id"], r["duration"], r["exit_code"] == 0)
+
+def _run_stats_recompute(con):
+    """Median/p95 again from the kept durations (schema 9: earlier versions stored some one rank off)."""
+    rows = con.execute("SELECT mod_id, recent_durations FROM mod_run_stats").fetchall()
+    con.executemany("UPDATE mod_run_stats SET median_duration = ?, p95_duration = ? WHERE mod_id = ?", [
+        (_percentile(ordered, 50), _percentile(ordered, 95), r["mod_id"])
+        for r in rows for ordered in (sorted(json.loads(r["recent_durations"])),)])
+
+def db_run_begin(mod_id: int, started_at: float) -> tuple[int, Path]:
+    """Create the run_history row (+ mark the mod Running); returns (run id, log file path)."""
+    with db_transaction() as con:
+        run_id = con.execute("""
+            INSERT INTO run_history (mod_id, started_at, launcher_host, launcher_pid) VALUES (?, ?, ?, ?)
+        """, (mod_id, started_at, LAUNCHER_HOST, os.getpid())).lastrowid
+        log_path = LOG_DIR / str(mod_id) / f"run-{run_id}.log"
+        con.execute("UPDATE run_history SET log_path = ? WHERE id = ?", (str(log_path), run_id))
+        db_update_run(mod_id, STATUS_RUNNING, int(started_at))
+    return run_id, log_path
+
+def db_run_end(run_id: int, finished_at: float, exit_code: int | None, status: str,
+               peak_rss: int | None = None, peaks: dict | None = None):
+    """Close a run; `peaks` are ResourceMonitor.untrack()'s peak_cpu/peak_read_bps/peak_write_bps."""
+    peaks = peaks or {}
+    with db_transaction() as con:
+        con.execute("""
+            UPDATE run_history SET finished_at = ?, exit_code = ?, status = ?, peak_rss = ?,
+                                   peak_cpu = ?, peak_read_bps = ?, peak_write_bps = ?
+             WHERE id = ?
+        """, (finished_at, exit_code, status, peak_rss, peaks.get("peak_cpu"), peaks.get("peak_read_bps"),
+              peaks.get("peak_write_bps"), run_id))
+        run = con.execute("SELECT mod_id, started_at FROM run_history WHERE id = ?", (run_id,)).fetchone()
+        if run is not None:
+            _run_stats_add(con, run["mod_id"], finished_at - run["started_at"], exit_code == 0)
+
+def db_runs_interrupt(run_ids) -> int:
+    """Close runs whose result will never be known as Interrupted; returns how many mods were un-stuck.
+
+    Mods still marked Running without an open run (also ones from before
+    runs were recorded) become Interrupted too. Not counted in run stats.
+    """
+    now = time.time()
+    with db_transaction() as con:
+        con.executemany("UPDATE run_history SET finished_at = ?, status = ? WHERE id = ? AND finished_at IS NULL",
+                        [(now, STATUS_INTERRUPTED, run_id) for run_id in run_ids])
+        return con.execute("""
+            UPDATE mods SET status = ?
+             WHERE status = ?
+               AND NOT EXISTS (SELECT 1 FROM run_history h WHERE h.mod_id = mods.id AND h.finished_at IS NULL)
+        """, (STATUS_INTERRUPTED, STATUS_RUNNING)).rowcount
+
+def db_runs_recover() -> int:
+    """At startup: interrupt open runs whose launcher is known to be gone (crash, quit while running)."""
+    runs = db_connect().execute("""
+        SELECT id, launcher_host, launcher_pid FROM run_history WHERE finished_at IS NULL
+    """).fetchall()
+    return db_runs_interrupt([r["id"] for r in runs if _launcher_gone(r["launcher_host"], r["launcher_pid"])])
+
+def db_run_history(mod_id: int, limit: int = 100) -> list:
+    con = db_connect()
+    return con.execute("SELECT * FROM run_history WHERE mod_id = ? ORDER BY started_at DESC LIMIT ?",
+                       (mod_id, limit)).fetchall()
+
+def db_latest_run(mod_id: int):
+    con = db_connect()
+    return con.execute("SELECT * FROM run_history WHERE mod_id = ? ORDER BY started_at DESC LIMIT 1",
+                       (mod_id,)).fetchone()
+
+def db_fetch_one(mod_id: int):
+    rows = _mod_records(db_connect(), MOD_SELECT + " WHERE mods.id = ?", (mod_id,))
+    return rows[0] if rows else None
+
+# ----- run queue -----
+JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED, JOB_CANCELLED = "queued", "running", "done", "failed", "cancelled"
+JOB_ACTIVE = (JOB_QUEUED, JOB_RUNNING)
+
+def db_queue_add(mod_ids: list[int], priority: int = 0) -> list[int]:
+    now = time.time()
+    with db_transaction() as con:
+        return [con.execute("INSERT INTO run_queue (mod_id, priority, enqueued_at) VALUES (?, ?, ?)",
+                            (mid, priority, now)).lastrowid for mid in mod_ids]
+
+def db_queue_claim(skip_mod_ids=()):
+    """Take the highest-priority, oldest queued job whose mod isn't running here or in another launcher.
+
+    The job is marked running and owned by this launcher in the same write
+    transaction, so two schedulers on one DB never get the same job.
+    """
+    skip = list(skip_mod_ids)
+    q = """
+        SELECT * FROM run_queue
+         WHERE state = 'queued'
+           AND mod_id NOT IN (SELECT mod_id FROM run_queue WHERE state = 'running')
+    """
+    if skip:
+        q += f" AND mod_id NOT IN ({','.join('?' * len(skip))})"
+    q += " ORDER BY priority DESC, id ASC LIMIT 1"
+    with db_transaction() as con:
+        job = con.execute(q, skip).fetchone()
+        if job is None:
+            return None
+        claimed = con.execute("""
+            UPDATE run_queue SET state = 'running', started_at = ?, launcher_host = ?, launcher_pid = ?
+             WHERE id = ? AND state = 'queued'
+        """, (time.time(), LAUNCHER_HOST, os.getpid(), job["id"])).rowcount
+    return job if claimed == 1 else None
+
+def db_queue_release(job_id: int):
+    """Put a claimed job that wasn't started back in the queue."""
+    with db_transaction() as con:
+        con.execute("""
+            UPDATE run_queue SET state = 'queued', started_at = NULL, launcher_host = NULL, launcher_pid = NULL
+             WHERE id = ? AND state = 'running'
+        """, (job_id,))
+
+def db_queue_update(job_id: int, **fields):
+    cols = ", ".join(f"{k} = ?" for k in fields)
+    with db_transaction() as con:
+        con.execute(f"UPDATE run_queue SET {cols} WHERE id = ?", (*fields.values(), job_id))
+
+def db_queue_state(job_id: int) -> str | None:
+    row = db_connect().execute("SELECT state FROM run_queue WHERE id = ?", (job_id,)).fetchone()
+    return row[0] if row else None
+
+def db_queue_bump(job_id: int, delta: int):
+    with db_transaction() as con:
+        con.execute("UPDATE run_queue SET priority = priority + ? WHERE id = ? AND state = 'queued'", (delta, job_id))
+
+def db_queue_list(finished_limit: int = 50) -> list:
+    """Active jobs (running first, then in run order) followed by the most recent finished ones."""
+    con = db_connect()
+    active = con.execute("""
+        SELECT q.*, m.name, s.median_duration FROM run_queue q
+          LEFT JOIN mods m ON m.id = q.mod_id
+          LEFT JOIN mod_run_stats s ON s.mod_id = q.mod_id
+         WHERE q.state IN ('queued', 'running')
+         ORDER BY q.state = 'queued', q.priority DESC, q.id ASC
+    """).fetchall()
+    finished = con.execute("""
+        SELECT q.*, m.name, NULL AS median_duration FROM run_queue q
+          LEFT JOIN mods m ON m.id = q.mod_id
+         WHERE q.state NOT IN ('queued', 'running')
+         ORDER BY q.finished_at DESC LIMIT ?
+    """, (finished_limit,)).fetchall()
+    return active + finished
+
+def db_queue_recover() -> int:
+    """Jobs left 'running' by a launcher that is gone (see _launcher_gone) go back to the queue."""
+    jobs = db_connect().execute("SELECT id, launcher_host, launcher_pid FROM run_queue WHERE state = 'running'").fetchall()
+    gone = [j["id"] for j in jobs if _launcher_gone(j["launcher_host"], j["launcher_pid"])]
+    for job_id in gone:
+        db_queue_release(job_id)
+    return len(gone)
+
+def db_queue_clear_finished():
+    with db_transaction() as con:
+        con.execute("DELETE FROM run_queue WHERE state NOT IN ('queued', 'running')")
+
+def db_queue_stats(window_sec: float = 3600.0) -> dict:
+    con = db_connect()
+    since = time.time() - window_sec
+    row = con.execute("""
+        SELECT SUM(state = 'queued') AS queued,
+               SUM(state = 'running') AS running,
+               SUM(finished_at >= :since AND state IN ('done', 'failed')) AS finished,
+               AVG(CASE WHEN started_at >= :since THEN started_at - enqueued_at END) AS avg_wait
+          FROM run_queue
+    """, {"since": since}).fetchone()
+    return {
+        "queued": row["queued"] or 0,
+        "running": row["running"] or 0,
+        "per_hour": (row["finished"] or 0) * 3600.0 / window_sec,
+        "avg_wait": row["avg_wait"],
+    }
+
+MOD_FIELDS = ("name", "cover_path", "bat_path", "status", "last_run", "version", "category", "blend_path", "work_path")
+
+def db_bulk_insert(mods: list[dict]) -> int:
+    """Insert many mods with one executemany (joins an outer db_transaction if any)."""
+    with db_transaction() as con:
+        con.executemany(f"""
+            INSERT INTO mods ({", ".join(MOD_FIELDS)})
+            VALUES ({", ".join("?" * len(MOD_FIELDS))})
+        """, [(
+            m.get("name",""),
+            m.get("cover_path",""),
+            m.get("bat_path",""),
+            m.get("status","Ready"),
+            int(m.get("last_run", 0)),
+            m.get("version","").strip(),
+            m.get("category","").strip(),
+            m.get("blend_path","").strip(),
+            m.get("work_path","").strip(),
+        ) for m in mods])
+        return len(mods)
+
+def db_known_paths() -> set[str]:
+    """Normalized bat/blend paths already referenced by a mod (scan de-duplication)."""
+    con = db_connect()
+    known = set()
+    for row in con.execute("SELECT bat_path, blend_path FROM mods"):
+        known.update(_norm_path(p) for p in row if p)
+    return known
+
+# ----- base-folder scan state -----
+def db_scan_state() -> dict[str, tuple[int, list[str]]]:
+    con = db_connect()
+    return {r["path"]: (r["mtime"], json.loads(r["subdirs"])) for r in con.execute("SELECT * FROM scan_dirs")}
+
+def db_scan_state_save(updated: dict[str, tuple[int, list[str]]], removed: list[str]):
+    with db_transaction() as con:
+        con.executemany("INSERT OR REPLACE INTO scan_dirs (path, mtime, subdirs) VALUES (?, ?, ?)",
+                        [(p, m, json.dumps(sub)) for p, (m, sub) in updated.items()])
+        con.executemany("DELETE FROM scan_dirs WHERE path = ?", [(p,) for p in removed])
+
+def db_scan_state_clear():
+    with db_transaction() as con:
+        con.execute("DELETE FROM scan_dirs")
+
+# ----- thumbnail cache -----
+def db_thumb_get(digest: str, w: int, h: int):
+    """Return (data, last_used) for the cached banner of a cover's content, or None."""
+    con = db_connect()
+    return con.execute(
+        "SELECT data, last_used FROM thumb_cache WHERE digest = ? AND w = ? AND h = ?",
+        (digest, w, h)
+    ).fetchone()
+
+def db_thumb_put(digest: str, w: int, h: int, data: bytes):
+    with db_transaction() as con:
+        con.execute("""
+            INSERT OR REPLACE INTO thumb_cache (digest, w, h, data, bytes, last_used)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (digest, w, h, data, len(data), int(datetime.datetime.now().timestamp())))
+
+def db_thumb_touch(digest: str, w: int, h: int):
+    with db_transaction() as con:
+        con.execute("UPDATE thumb_cache SET last_used = ? WHERE digest = ? AND w = ? AND h = ?",
+                    (int(datetime.datetime.now().timestamp()), digest, w, h))
+
+def db_thumb_evict(max_bytes: int = THUMB_CACHE_MAX_BYTES) -> int:
+    """Drop least recently used banners until the cache fits in max_bytes. Returns rows removed."""
+    with db_transaction() as con:
+        total = con.execute("SELECT COALESCE(SUM(bytes), 0) FROM thumb_cache").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+        victims = []
+        for rowid, nbytes in con.execute("SELECT rowid, bytes FROM thumb_cache ORDER BY last_used ASC"):
+            if total <= max_bytes:
+                break
+            victims.append((rowid,))
+            total -= nbytes
+        con.executemany("DELETE FROM thumb_cache WHERE rowid = ?", victims)
+        return len(victims)
+
+def db_thumb_clear():
+    with db_transaction() as con:
+        con.execute("DELETE FROM thumb_cache")
+
+def db_cover_hash_get(path: str):
+    """Return (src_mtime, src_size, digest) last recorded for a cover source, or None."""
+    return db_connect().execute(
+        "SELECT src_mtime, src_size, digest FROM cover_hashes WHERE path = ?", (path,)).fetchone()
+
+def db_cover_hash_put(path: str, src_mtime: int, src_size: int, digest: str):
+    with db_transaction() as con:
+        con.execute("INSERT OR REPLACE INTO cover_hashes (path, src_mtime, src_size, digest) VALUES (?, ?, ?, ?)",
+                    (path, int(src_mtime), int(src_size), digest))
+
+def db_cover_paths() -> list[str]:
+    """Every cover source: cover_path, or the .blend (embedded thumbnail) when a mod has no cover."""
+    con = db_connect()
+    rows = con.execute("""
+        SELECT DISTINCT CASE WHEN cover_path <> '' THEN cover_path ELSE blend_path END AS src
+          FROM mods WHERE cover_path <> '' OR blend_path <> ''
+    """).fetchall()
+    return [r[0] for r in rows]
+
+def db_blend_meta(path: str):
+    return db_connect().execute("SELECT * FROM blend_meta WHERE path = ?", (path,)).fetchone()
+
+def db_blend_meta_put(path: str, src_mtime: int, src_size: int, info: dict):
+    with db_transaction() as con:
+        con.execute("""
+            INSERT OR REPLACE INTO blend_meta
+                (path, src_mtime, src_size, version, pointer_size, endian, compression, thumb_w, thumb_h)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (path, int(src_mtime), int(src_size), info["version"], info["pointer_size"], info["endian"],
+              info["compression"], info["thumb_w"], info["thumb_h"]))
+
+def db_blend_paths() -> list[tuple[str, int | None, int | None]]:
+    """(blend_path, known mtime, known size) for every mod's .blend; mtime/size None when never read."""
+    con = db_connect()
+    return [tuple(r) for r in con.execute("""
+        SELECT DISTINCT m.blend_path, b.src_mtime, b.src_size
+          FROM mods m LEFT JOIN blend_meta b ON b.path = m.blend_path
+         WHERE m.blend_path <> ''
+    """)]
+
+# Time every public db_* call (connection plumbing excluded: it runs inside the others).
+for _name in [n for n in globals() if n.startswith("db_") and n not in ("db_connect", "db_close", "db_transaction")]:
+    globals()[_name] = timed(_name)(globals()[_name])
+del _name
+
+# ====================== UTIL ======================
+def human_time(ts: int | float):
+    try:
+        return datetime.datetime.fromtimestamp(int(ts)).strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return ""
+
+def human_clock(ts: float) -> str:
+    return datetime.datetime.fromtimestamp(ts).strftime("%H:%M")
+
+def human_duration(sec: float | None) -> str:
+    if sec is None:
+        return ""
+    sec = int(round(sec))
+    h, rem = divmod(sec, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+def human_bytes(n: float | None) -> str:
+    if n is None:
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+def _row_get(row, key, default=""):
+    return row[key] if key in row.keys() else default
+
+def cover_source(row) -> str:
+    """Where a mod's banner comes from: its cover image, else the preview embedded in its .blend."""
+    return (row["cover_path"] or "") or (_row_get(row, "blend_path") or "")
+
+COVER_HASH_CHUNK = 1024 * 1024
+
+@timed("cover.hash")
+def cover_digest(path: str) -> str:
+    """Content hash of a cover source (BLAKE2b-128, streamed); "" when it has no image.
+
+    For a .blend only the embedded preview is hashed, not the (large) file.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if path.lower().endswith(".blend"):
+        info = read_blend_info(path)
+        if info is None or info["thumb"] is None:
+            return ""
+        h.update(b"blend-preview")
+        h.update(struct.pack("<ii", info["thumb_w"], info["thumb_h"]))
+        h.update(info["thumb"])
+        return h.hexdigest()
+    with open(path, "rb") as f:
+        while chunk := f.read(COVER_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+def status_text(row) -> str:
+    status = row["status"] or ""
+    code = _row_get(row, "last_exit_code", None)
+    dur = _row_get(row, "last_duration", None)
+    if status == STATUS_SUCCEEDED and dur is not None:
+        return f"{status} ({human_duration(dur)})"
+    if status == STATUS_FAILED and code is not None:
+        return f"{status} (exit {code}, {human_duration(dur)})" if dur is not None else f"{status} (exit {code})"
+    return status
+
+def _norm_path(p: str) -> str:
+    return os.path.normcase(os.path.normpath(p))
+
+# ====================== BLEND FILES ======================
+# A .blend starts with a file header, then blocks each led by a BHead. The
+# embedded preview is the "TEST" block (int32 width, int32 height, RGBA rows
+# bottom-up), written right after the "REND" blocks, so only the first few
+# hundred KB of a (possibly multi-GB) file are ever touched.
+BLEND_MAGIC = b"BLENDER"
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+BLEND_THUMB_MAX = 1024   # sanity bound on the preview's width/height
+
+def _blend_stream(path: str):
+    """(file-like positioned at the .blend header, compression name, closer) or None.
+
+    Plain files are memory-mapped (pages load only as the walk reaches them);
+    gzip/zstd files are decompressed as a stream, only as far as read.
+    """
+    fh = open(path, "rb")
+    try:
+        magic = fh.read(4)
+        fh.seek(0)
+        if magic.startswith(GZIP_MAGIC):
+            stream = gzip.GzipFile(fileobj=fh)
+            return stream, "gzip", lambda: (stream.close(), fh.close())
+        if magic == ZSTD_MAGIC:
+            if _zstd is not None:
+                stream = _zstd.ZstdFile(fh)
+            elif _zstandard is not None:
+                stream = _zstandard.ZstdDecompressor().stream_reader(fh, read_across_frames=True)
+            else:
+                fh.close()
+                return None   # no zstd decoder available
+            return stream, "zstd", lambda: (stream.close(), fh.close())
+        if os.fstat(fh.fileno()).st_size == 0:
+            fh.close()
+            return None
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return mm, "", lambda: (mm.close(), fh.close())
+    except Exception:
+        fh.close()
+        raise
+
+def _read_exact(stream, n: int) -> bytes:
+    buf = stream.read(n)
+    while len(buf) < n:
+        more = stream.read(n - len(buf))
+        if not more:
+            break
+        buf += more
+    return buf
+
+def _skip(stream, n: int):
+    while n > 0:
+        chunk = stream.read(min(n, 1024 * 1024))
+        if not chunk:
+            return
+        n -= len(chunk)
+
+def _blend_version(digits: bytes) -> str:
+    v = int(digits)
+    return f"{v // 100}.{v % 100}"
+
+@timed("blend.read")
+def read_blend_info(path: str, want_thumb: bool = True) -> dict | None:
+    """Header facts of a .blend and, optionally, its embedded preview; None if it isn't a readable .blend.
+
+    Returns {"version": "4.2", "pointer_size": 8, "endian": "little", "compression": ""|"gzip"|"zstd",
+    "thumb_w", "thumb_h", "thumb": RGBA bytes top-down or None}.
+    """
+    opened = _blend_stream(path)
+    if opened is None:
+        return None
+    stream, compression, close = opened
+    try:
+        head = _read_exact(stream, 12)
+        if len(head) < 12 or not head.startswith(BLEND_MAGIC):
+            return None
+        if head[7:9].isdigit():
+            # Blender 5.0+ header: BLENDER + header size + '-' + format version + endian + 4-digit version
+            size = int(head[7:9])
+            head += _read_exact(stream, size - 12)
+            ptr, endian_ch, version = 8, head[size - 5:size - 4], _blend_version(head[size - 4:size])
+            bhead_fmt, length_field = "4siqqq", 3        # code, sdna index, old address, length, count
+        else:
+            ptr = 8 if head[7:8] == b"-" else 4
+            endian_ch, version = head[8:9], _blend_version(head[9:12])
+            bhead_fmt, length_field = "4si" + ("Q" if ptr == 8 else "I") + "ii", 1   # code, length, old address, sdna, count
+        order = "<" if endian_ch == b"v" else ">"
+        bhead = struct.Struct(order + bhead_fmt)
+        info = {"version": version, "pointer_size": ptr, "endian": "little" if order == "<" else "big",
+                "compression": compression, "thumb_w": None, "thumb_h": None, "thumb": None}
+        while True:
+            raw = _read_exact(stream, bhead.size)
+            if len(raw) < bhead.size:
+                break
+            fields = bhead.unpack(raw)
+            code, length = fields[0], fields[length_field]
+            if code == b"TEST" and length >= 8:
+                w, h = struct.unpack(order + "ii", _read_exact(stream, 8))
+                if 0 < w <= BLEND_THUMB_MAX and 0 < h <= BLEND_THUMB_MAX and length >= 8 + w * h * 4:
+                    info["thumb_w"], info["thumb_h"] = w, h
+                    if want_thumb:
+                        rows = _read_exact(stream, w * h * 4)
+                        if len(rows) == w * h * 4:
+                            stride = w * 4
+                            info["thumb"] = b"".join(rows[i:i + stride] for i in range(len(rows) - stride, -1, -stride))
+                break
+            if code != b"REND":
+                break   # the preview, when present, comes before any data block
+            _skip(stream, length)
+        return info
+    finally:
+        close()
+
+# ====================== BASE FOLDER SCAN ======================
+SCAN_BAT_EXT = (".bat", ".cmd")
+SCAN_BLEND_EXT = (".blend",)
+SCAN_IMAGE_EXT = (".png", ".jpg", ".jpeg", ".webp")
+SCAN_COVER_HINTS = ("cover", "banner", "thumb", "preview", "poster")
+SCAN_SKIP_DIRS = {"__pycache__", "node_modules"}
+
+def _pick(paths: list[str], *prefer: str) -> str:
+    """First of `paths` whose file stem contains one of `prefer` (case-insensitive), else the first one."""
+    if not paths:
+        return ""
+    for want in prefer:
+        want = want.lower()
+        for p in paths:
+            if want and want in Path(p).stem.lower():
+                return p
+    return paths[0]
+
+def group_mod_files(dir_path: str, files: list[str], category: str = "") -> list[dict]:
+    """Turn the files of one directory into candidate mods.
+
+    A folder with one .bat/.cmd (or just a .blend) becomes one mod named after
+    the folder; a folder with several .bat/.cmd becomes one mod per script.
+    """
+    bats = sorted(f for f in files if f.lower().endswith(SCAN_BAT_EXT))
+    blends = sorted(f for f in files if f.lower().endswith(SCAN_BLEND_EXT))
+    images = sorted(f for f in files if f.lower().endswith(SCAN_IMAGE_EXT))
+    if not bats and not blends:
+        return []
+    dir_name = Path(dir_path).name
+    base = {"version": "", "category": category, "work_path": dir_path, "status": "Ready", "last_run": 0}
+    if len(bats) <= 1:
+        return [dict(base, name=dir_name,
+                     bat_path=bats[0] if bats else "",
+                     blend_path=_pick(blends, dir_name),
+                     cover_path=_pick(images, *SCAN_COVER_HINTS, dir_name))]
+    mods = []
+    for bat in bats:
+        stem = Path(bat).stem
+        mods.append(dict(base, name=f"{dir_name} - {stem}", bat_path=bat,
+                         blend_path=_pick(blends, stem, dir_name),
+                         cover_path=_pick(images, stem, *SCAN_COVER_HINTS)))
+    return mods
+
+def _scan_one(path: str, state: dict):
+    """Stat one directory; list it only if its mtime changed since the last scan.
+
+    Returns (path, mtime, subdirs, files or None when unchanged).
+    """
+    mtime = os.stat(path).st_mtime_ns
+    prev = state.get(path)
+    if prev is not None and prev[0] == mtime:
+        return path, mtime, prev[1], None
+    subdirs, files = [], []
+    with os.scandir(path) as it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    if not e.name.startswith(".") and e.name not in SCAN_SKIP_DIRS:
+                        subdirs.append(e.name)
+                elif e.is_file():
+                    files.append(e.path)
+            except OSError:
+                continue
+    return path, mtime, sorted(subdirs), files
+
+@timed("scan_base_folder")
+def scan_base_folder(root: str | Path, workers: int | None = None, full: bool = False,
+                     progress=None, is_cancelled=lambda: False) -> dict:
+    """Walk `root` in parallel and import every new mod found, in one transaction.
+
+    Directories whose mtime matches the stored scan state are not listed
+    again (their child dirs come from the state), so rescans only pay a stat
+    per directory. Paths already used by a mod are skipped. progress(done,
+    total, found) is called from this thread as directories complete.
+    """
+    root = os.path.normpath(str(root))
+    state = {} if full else db_scan_state()
+    known = db_known_paths()
+    workers = workers or min(16, (os.cpu_count() or 2) * 2)  # I/O bound: network shares like many in flight
+
+    updated, seen, candidates = {}, set(), []
+    done = unchanged = errors = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as ex:
+        pending = {ex.submit(_scan_one, root, state)}
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                done += 1
+                try:
+                    path, mtime, subdirs, files = fut.result()
+                except OSError:
+                    errors += 1
+                    continue
+                seen.add(path)
+                if files is None:
+                    unchanged += 1
+                else:
+                    updated[path] = (mtime, subdirs)
+                    rel = Path(os.path.relpath(path, root)).parts
+                    category = rel[0] if len(rel) > 1 else ""
+                    for mod in group_mod_files(path, files, category):
+                        # a mod is identified by its script, or by its .blend when it has none
+                        key = _norm_path(mod["bat_path"] or mod["blend_path"])
+                        if key in known:
+                            continue
+                        known.add(key)
+                        candidates.append(mod)
+                if not is_cancelled():
+                    pending |= {ex.submit(_scan_one, os.path.join(path, d), state) for d in subdirs}
+            if progress:
+                progress(done, done + len(pending), len(candidates))
+            if is_cancelled():
+                for fut in pending:
+                    fut.cancel()
+                pending = set()
+
+    removed = [p for p in state if p not in seen and (p == root or p.startswith(root + os.sep))]
+    if is_cancelled():
+        return {"imported": 0, "scanned": done, "unchanged": unchanged, "errors": errors, "cancelled": True}
+    with db_transaction():
+        imported = db_bulk_insert(candidates) if candidates else 0
+        db_scan_state_save(updated, removed)
+    return {"imported": imported, "scanned": done, "unchanged": unchanged, "errors": errors, "cancelled": False}
+
+# ====================== RUN SUPERVISOR ======================
+STATUS_RUNNING, STATUS_SUCCEEDED, STATUS_FAILED = "Running", "Succeeded", "Failed"
+STATUS_INTERRUPTED = "Interrupted"   # the launcher went away before the run ended
+
+LAUNCHER_HOST = socket.gethostname()
+
+def _pid_alive(pid: int) -> bool | None:
+    """Whether a process with this pid exists on this machine; None when that can't be told."""
+    if _psutil is not None:
+        return _psutil.pid_exists(pid)
+    if sys.platform.startswith("win"):   # os.kill() would terminate it
+        import ctypes
+        from ctypes import wintypes
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.OpenProcess.restype = wintypes.HANDLE
+        k32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        k32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+        k32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        handle = k32.OpenProcess(0x1000, False, pid)   # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            err = ctypes.get_last_error()
+            return False if err == 87 else True if err == 5 else None   # INVALID_PARAMETER: no such pid
+        try:
+            code = wintypes.DWORD()
+            if not k32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return None
+            return code.value == 259   # STILL_ACTIVE
+        finally:
+            k32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return None
+    return True
+
+def _launcher_gone(host: str | None, pid: int | None) -> bool:
+    """True only for an owner on this machine whose process has certainly exited; other hosts can't be checked."""
+    return bool(pid) and host == LAUNCHER_HOST and _pid_alive(pid) is False
+
+def launch_command(bat: str) -> list[str]:
+    """Command line for a conversion script: cmd on Windows, sh elsewhere (shell scripts stand in for .bat)."""
+    if sys.platform.startswith("win"):
+        return ["cmd", "/c", bat]
+    return ["/bin/sh", bat]
+
+class RotatingLogWriter:
+    """Append-only run log with size-based rotation.
+
+    When the live file passes max_bytes it is renamed to <name>.NNN and gzip'ed
+    to <name>.NNN.gz on a side thread (so the pipe keeps draining); only the
+    newest `backups` compressed segments are kept. Memory use is one chunk.
+    """
+    def __init__(self, path: Path, max_bytes: int = 32 * 1024 * 1024, backups: int = 5):
+        self.path, self.max_bytes, self.backups = Path(path), max_bytes, backups
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "ab")
+        self._size = self._fh.tell()
+        self._segment = 0
+        self._compressors: list[threading.Thread] = []
+        self._prune_lock = threading.Lock()
+
+    def write(self, data: bytes):
+        self._fh.write(data)
+        self._fh.flush()   # keep the tail panel current
+        self._size += len(data)
+        if self._size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._fh.close()
+        self._segment += 1
+        rotated = self.path.with_name(f"{self.path.name}.{self._segment:03d}")
+        os.replace(self.path, rotated)
+        t = threading.Thread(target=self._compress, args=(rotated, self._segment), daemon=True)
+        t.start()
+        self._compressors.append(t)
+        self._fh = open(self.path, "ab")
+        self._size = 0
+
+    def _compress(self, src: Path, segment: int):
+        try:
+            with open(src, "rb") as fin, gzip.open(f"{src}.gz", "wb", compresslevel=5) as fout:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+            src.unlink()
+        except OSError:
+            pass
+        self._prune()
+
+    def _prune(self):
+        # compressions finish out of order, so look at every .gz there is, after each one
+        with self._prune_lock:
+            oldest_kept = self._segment - self.backups + 1
+            for gz in self.path.parent.glob(f"{self.path.name}.*.gz"):
+                num = gz.name[len(self.path.name) + 1:-3]
+                if num.isdigit() and int(num) < oldest_kept:
+                    try:
+                        gz.unlink()
+                    except OSError:
+                        pass
+
+    def close(self):
+        self._fh.close()
+        for t in self._compressors:
+            t.join()
+
+class RunHandle:
+    __slots__ = ("mod_id", "proc", "started", "ended", "exit_code", "peak_rss", "peaks", "run_id", "log_path", "_pump")
+
+    def __init__(self, mod_id: int, proc: subprocess.Popen, started: float, run_id: int, log_path: Path):
+        self.mod_id, self.proc, self.started = mod_id, proc, started
+        self.run_id, self.log_path = run_id, log_path
+        self.ended: float | None = None
+        self.exit_code: int | None = None
+        self.peak_rss: int | None = None
+        self.peaks: dict | None = None
+        self._pump: threading.Thread | None = None
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    @property
+    def duration(self) -> float:
+        return (self.ended or time.time()) - self.started
+
+class ProcessSupervisor:
+    """Keeps handles to launched conversions and records how they end.
+
+    stdout/stderr of each child are streamed by a pump thread into a rotating
+    per-run log (run_history.log_path). A daemon reaper thread blocks in
+    wait(), so nothing polls. When a child exits its status becomes
+    Succeeded/Failed with exit code and duration (written from the reaper
+    thread), then on_exit(handle) is called from that thread. With a
+    ResourceMonitor, each run's process tree is sampled while it runs and
+    the peaks are saved with the run.
+    """
+    LOG_CHUNK = 64 * 1024
+
+    def __init__(self, on_exit=None, log_max_bytes: int = 32 * 1024 * 1024, log_backups: int = 5,
+                 monitor: "ResourceMonitor | None" = None):
+        self.on_exit, self.monitor = on_exit, monitor
+        self.log_max_bytes, self.log_backups = log_max_bytes, log_backups
+        self._lock = threading.Lock()
+        self._running: dict[int, RunHandle] = {}
+        self._reaping = 0   # reaper threads whose on_exit callbacks haven't returned yet (wait_all)
+
+    def start(self, mod_id: int, bat: str, on_exit=None) -> RunHandle:
+        with self._lock:
+            if mod_id in self._running:
+                raise RuntimeError("This mod is already running.")
+            started = time.time()
+            run_id, log_path = db_run_begin(mod_id, started)
+            log = RotatingLogWriter(log_path, self.log_max_bytes, self.log_backups)
+            try:
+                # own process group/session so terminate() can take the whole tree (Blender etc.) down
+                spawn_t0 = time.perf_counter()
+                proc = subprocess.Popen(
+                    launch_command(bat), shell=False,
+                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    start_new_session=not sys.platform.startswith("win"),
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+            except Exception:
+                log.close()
+                db_run_end(run_id, time.time(), None, STATUS_FAILED)
+                db_finish_run(mod_id, STATUS_FAILED, None, 0.0)
+                raise
+            METRICS.observe("run.spawn", time.perf_counter() - spawn_t0)
+            METRICS.count("run.launched")
+            handle = RunHandle(mod_id, proc, started, run_id, log_path)
+            self._running[mod_id] = handle
+            self._reaping += 1
+            if self.monitor is not None:
+                self.monitor.track(mod_id, proc.pid)
+        handle._pump = threading.Thread(target=self._pump_output, args=(proc.stdout, log), daemon=True,
+                                        name=f"log-{proc.pid}")
+        handle._pump.start()
+        threading.Thread(target=self._reap, args=(handle, on_exit), daemon=True,
+                         name=f"reap-{proc.pid}").start()
+        return handle
+
+    def _pump_output(self, pipe, log: RotatingLogWriter):
+        try:
+            while True:
+                chunk = pipe.read1(self.LOG_CHUNK)
+                if not chunk:
+                    break
+                log.write(chunk)
+        except (OSError, ValueError):
+            pass
+        finally:
+            pipe.close()
+            log.close()
+
+    @staticmethod
+    def _wait(proc: subprocess.Popen) -> tuple[int, int | None]:
+        """Wait for the child; on POSIX also return its peak RSS in bytes (incl. waited-for descendants)."""
+        if hasattr(os, "wait4"):
+            try:
+                _pid, status, usage = os.wait4(proc.pid, 0)
+            except ChildProcessError:
+                pass
+            else:
+                proc.returncode = os.waitstatus_to_exitcode(status)
+                scale = 1 if sys.platform == "darwin" else 1024   # bytes on macOS, KiB on Linux
+                return proc.returncode, usage.ru_maxrss * scale
+        return proc.wait(), None
+
+    def _reap(self, handle: RunHandle, on_exit):
+        try:
+            try:
+                handle.exit_code, handle.peak_rss = self._wait(handle.proc)
+                handle._pump.join(10)   # a detached grandchild may keep the pipe open; don't wait on it forever
+                handle.ended = time.time()
+                if self.monitor is not None:
+                    handle.peaks = self.monitor.untrack(handle.mod_id)
+                    if handle.peaks and handle.peaks["peak_rss"]:
+                        # wait4 sees the largest single process, the sampler the whole tree at once
+                        handle.peak_rss = max(handle.peak_rss or 0, handle.peaks["peak_rss"])
+                status = STATUS_SUCCEEDED if handle.exit_code == 0 else STATUS_FAILED
+                db_run_end(handle.run_id, handle.ended, handle.exit_code, status, handle.peak_rss, handle.peaks)
+                db_finish_run(handle.mod_id, status, handle.exit_code, handle.duration)
+                METRICS.observe("run.duration", handle.duration)
+                METRICS.count("run.succeeded" if handle.exit_code == 0 else "run.failed")
+            finally:
+                # off the running list before the callbacks, so they can start this mod's next run
+                with self._lock:
+                    self._running.pop(handle.mod_id, None)
+            for cb in (on_exit, self.on_exit):
+                if cb:
+                    cb(handle)
+        finally:
+            db_close()
+            with self._lock:
+                self._reaping -= 1
+
+    def is_running(self, mod_id: int) -> bool:
+        with self._lock:
+            return mod_id in self._running
+
+    def running(self) -> list[RunHandle]:
+        with self._lock:
+            return list(self._running.values())
+
+    def terminate(self, mod_id: int) -> bool:
+        with self._lock:
+            handle = self._running.get(mod_id)
+        if handle is None:
+            return False
+        try:
+            if sys.platform.startswith("win"):
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(handle.pid)], capture_output=True)
+            else:
+                os.killpg(handle.pid, signal.SIGTERM)
+        except (OSError, subprocess.SubprocessError):
+            handle.proc.terminate()
+        return True
+
+    def abandon(self) -> list[RunHandle]:
+        """On quit: record the running conversions as Interrupted; they keep running, untracked."""
+        handles = self.running()
+        if handles:
+            db_runs_interrupt([h.run_id for h in handles])
+        return handles
+
+    def wait_all(self, timeout: float | None = None) -> bool:
+        """Block until every tracked child has been reaped and its on_exit callbacks returned (tests/CLI).
+        False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            with self._lock:
+                if not self._running and not self._reaping:
+                    return True
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+
+def estimate_queue_etas(jobs, max_concurrent: int, now: float | None = None) -> dict[int, float]:
+    """Predicted finish time per active job (job id -> epoch seconds).
+
+    Simulates the scheduler: running jobs free their slot after their mod's
+    median duration (minus time already spent), queued jobs take the next
+    free slot in run order. Mods without history use the median of the
+    known ones; with no history at all there is no estimate.
+    """
+    now = time.time() if now is None else now
+    known = sorted(j["median_duration"] for j in jobs if j["median_duration"] is not None)
+    fallback = _percentile(known, 50)
+    etas: dict[int, float] = {}
+    slots = []
+    for j in jobs:
+        if j["state"] == JOB_RUNNING:
+            est = j["median_duration"] if j["median_duration"] is not None else fallback
+            end = max(now, j["started_at"] + est) if est is not None else now
+            if est is not None:
+                etas[j["id"]] = end
+            slots.append(end)
+    slots += [now] * max(0, max_concurrent - len(slots))
+    heapq.heapify(slots)
+    for j in jobs:
+        if j["state"] != JOB_QUEUED:
+            continue
+        est = j["median_duration"] if j["median_duration"] is not None else fallback
+        if est is None:
+            return etas
+        end = heapq.heappop(slots) + est
+        etas[j["id"]] = end
+        heapq.heappush(slots, end)
+    return etas
+
+class RunScheduler:
+    """Runs queued mods (run_queue) through a ProcessSupervisor, at most max_concurrent at once.
+
+    Jobs start by priority (higher first), then FIFO. pump() fills free slots
+    and is called on enqueue, resume and whenever a job ends (reaper thread);
+    the filling runs on the scheduler's own worker thread, since checking and
+    spawning a .bat can block on slow or network drives. The queue lives in
+    the DB, so recover() after a restart picks up where the last session
+    stopped, unless the scheduler was created paused. on_change() fires
+    after any state change, from whichever thread caused it.
+    """
+    def __init__(self, supervisor: ProcessSupervisor, max_concurrent: int | None = None, on_change=None,
+                 paused: bool = False):
+        self.supervisor = supervisor
+        self.max_concurrent = max(1, max_concurrent or os.cpu_count() or 1)
+        self.on_change = on_change
+        self.paused = paused
+        self._lock = threading.RLock()
+        self._jobs: dict[int, int] = {}   # running job id -> mod id
+        self._cancelled: set[int] = set()
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-queue")
+        self._pump_queued = False
+        self._closed = False
+
+    def recover(self) -> int:
+        n = db_queue_recover()
+        self.pump()
+        return n
+
+    def enqueue(self, mod_ids: list[int], priority: int = 0) -> list[int]:
+        ids = db_queue_add(mod_ids, priority)
+        self.pump()
+        return ids
+
+    def set_max_concurrent(self, n: int):
+        self.max_concurrent = max(1, int(n))
+        self.pump()
+
+    def pause(self):
+        self.paused = True
+        self._changed()
+
+    def resume(self):
+        self.paused = False
+        self.pump()
+
+    def bump(self, job_id: int, delta: int):
+        db_queue_bump(job_id, delta)
+        self._changed()
+
+    def cancel(self, job_id: int):
+        """Drop a queued job, or terminate a running one (recorded as cancelled when it exits)."""
+        with self._lock:
+            mod_id = self._jobs.get(job_id)
+            if mod_id is None:
+                db_queue_update(job_id, state=JOB_CANCELLED, finished_at=time.time())
+            else:
+                self._cancelled.add(job_id)
+                self.supervisor.terminate(mod_id)
+        self._changed()
+
+    def abandon_running(self):
+        """On quit: running jobs keep going untracked; record them as cancelled so a restart won't re-run them."""
+        with self._lock:
+            self._closed = True
+            for job_id in self._jobs:
+                db_queue_update(job_id, state=JOB_CANCELLED, finished_at=time.time())
+            self._jobs.clear()
+            self.paused = True
+        self._worker.shutdown(wait=False)
+
+    def running_jobs(self) -> dict[int, int]:
+        with self._lock:
+            return dict(self._jobs)
+
+    def pump(self):
+        """Fill free slots soon, on the worker thread; at most one fill is pending at a time."""
+        with self._lock:
+            if self._closed or self._pump_queued:
+                return
+            self._pump_queued = True
+            self._worker.submit(self._pump)
+
+    def _pump(self):
+        try:
+            with self._lock:
+                self._pump_queued = False
+            while True:
+                with self._lock:
+                    if self.paused or self._closed or len(self._jobs) >= self.max_concurrent:
+                        break
+                    job = db_queue_claim({h.mod_id for h in self.supervisor.running()})
+                if job is None:
+                    break
+                self._start(job)
+            self._changed()
+        finally:
+            db_close()
+
+    def _start(self, job):
+        mod = db_fetch_one(job["mod_id"])
+        bat = mod["bat_path"] if mod is not None else ""
+        found = bool(bat) and Path(bat).exists()   # outside the lock: may stall on a network drive
+        with self._lock:
+            if db_queue_state(job["id"]) != JOB_RUNNING:   # cancelled meanwhile
+                return
+            if self.paused or self._closed:
+                db_queue_release(job["id"])
+                return
+            if not found:
+                db_queue_update(job["id"], state=JOB_FAILED, finished_at=time.time(), started_at=time.time())
+                return
+            try:
+                self.supervisor.start(job["mod_id"], bat,
+                                      on_exit=lambda h, job_id=job["id"]: self._finished(job_id, h))
+            except Exception:
+                db_queue_update(job["id"], state=JOB_FAILED, finished_at=time.time(), started_at=time.time())
+                return
+            self._jobs[job["id"]] = job["mod_id"]
+            db_queue_update(job["id"], state=JOB_RUNNING, started_at=time.time())
+
+    def _finished(self, job_id: int, handle: RunHandle):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            if job_id in self._cancelled:
+                self._cancelled.discard(job_id)
+                state = JOB_CANCELLED
+            else:
+                state = JOB_DONE if handle.exit_code == 0 else JOB_FAILED
+            db_queue_update(job_id, state=state, finished_at=handle.ended, exit_code=handle.exit_code)
+        self.pump()
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
+
+# ====================== RESOURCE MONITOR ======================
+RESOURCE_INTERVAL = 1.0   # seconds between samples of running conversions
+RESOURCE_HISTORY = 120    # samples kept per run (ring buffer)
+SAMPLE_FIELDS = ("t", "cpu", "rss", "read_bps", "write_bps")   # cpu: % of one core, rss: bytes
+
+def _proc_stat(pid: str):
+    """(ppid, cpu ticks incl. reaped children, rss pages) from /proc/<pid>/stat, or None if it's gone."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    rest = data[data.rindex(b")") + 2:].split()   # comm may contain spaces/parens
+    return int(rest[1]), sum(int(x) for x in rest[11:15]), int(rest[21])
+
+def _proc_io(pid: int) -> tuple[int, int]:
+    read = write = 0
+    try:
+        with open(f"/proc/{pid}/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"read_bytes:"):
+                    read = int(line.split()[1])
+                elif line.startswith(b"write_bytes:"):
+                    write = int(line.split()[1])
+    except (OSError, ValueError):
+        pass   # not ours to read (setuid child) or already gone
+    return read, write
+
+class _ProcTreeReader:
+    """Totals (cpu seconds, rss bytes, read bytes, written bytes) per process tree, from /proc.
+
+    One pass over /proc per tick builds the parent map for every tracked
+    root at once, so the cost does not grow with the number of runs.
+    """
+    def __init__(self):
+        self._tick = os.sysconf("SC_CLK_TCK")
+        self._page = os.sysconf("SC_PAGE_SIZE")
+
+    def totals(self, roots) -> dict[int, tuple[float, int, int, int]]:
+        stats, children = {}, {}
+        for name in os.listdir("/proc"):
+            if name.isdigit():
+                st = _proc_stat(name)
+                if st is not None:
+                    pid = int(name)
+                    stats[pid] = st
+                    children.setdefault(st[0], []).append(pid)
+        out = {}
+        for root in roots:
+            if root not in stats:
+                continue
+            cpu = rss = read = write = 0
+            todo = [root]
+            while todo:
+                pid = todo.pop()
+                _ppid, ticks, pages = stats[pid]
+                r, w = _proc_io(pid)
+                cpu, rss, read, write = cpu + ticks, rss + pages, read + r, write + w
+                todo += children.get(pid, ())
+            out[root] = (cpu / self._tick, rss * self._page, read, write)
+        return out
+
+class _PsutilTreeReader:
+    """Same totals through psutil, for platforms without /proc."""
+    def totals(self, roots) -> dict[int, tuple[float, int, int, int]]:
+        out = {}
+        for root in roots:
+            try:
+                top = _psutil.Process(root)
+                procs = [top] + top.children(recursive=True)
+            except _psutil.Error:
+                continue
+            cpu = rss = read = write = 0
+            for p in procs:
+                try:
+                    with p.oneshot():
+                        t = p.cpu_times()
+                        cpu += t.user + t.system + getattr(t, "children_user", 0) + getattr(t, "children_system", 0)
+                        rss += p.memory_info().rss
+                        if hasattr(p, "io_counters"):   # not on macOS
+                            io = p.io_counters()
+                            read, write = read + io.read_bytes, write + io.write_bytes
+                except _psutil.Error:
+                    pass
+            out[root] = (cpu, rss, read, write)
+        return out
+
+class ResourceMonitor:
+    """Samples CPU%, RSS and I/O rates of running conversions' process trees on one daemon thread.
+
+    Each tracked run keeps its last `history` samples (SAMPLE_FIELDS tuples)
+    in a ring buffer, plus running peaks that untrack() hands back for
+    run_history. Rates come from the change since the previous sample; a
+    child that exits takes its counters with it, so a drop counts as zero.
+    Without /proc or psutil `available` is False and nothing is sampled.
+    """
+    def __init__(self, interval: float = RESOURCE_INTERVAL, history: int = RESOURCE_HISTORY):
+        self.interval, self.history = interval, history
+        if os.path.isdir("/proc/self"):
+            self._reader = _ProcTreeReader()
+        elif _psutil is not None:
+            self._reader = _PsutilTreeReader()
+        else:
+            self._reader = None
+        self._lock = threading.Lock()
+        self._runs: dict[int, dict] = {}   # key -> {pid, samples, last, peaks}
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        return self._reader is not None
+
+    def track(self, key: int, pid: int):
+        if self._reader is None:
+            return
+        with self._lock:
+            self._runs[key] = {"pid": pid, "samples": deque(maxlen=self.history), "last": None,
+                               "peaks": dict.fromkeys(("peak_cpu", "peak_rss", "peak_read_bps", "peak_write_bps"), 0)}
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True, name="resource-monitor")
+                self._thread.start()
+        self._wake.set()   # first sample right away
+
+    def untrack(self, key: int) -> dict | None:
+        """Stop sampling `key`; returns its peaks (peak_cpu, peak_rss, peak_read_bps, peak_write_bps)."""
+        with self._lock:
+            run = self._runs.pop(key, None)
+        return run["peaks"] if run and run["last"] is not None else None
+
+    def samples(self, key: int) -> list[tuple]:
+        with self._lock:
+            run = self._runs.get(key)
+            return list(run["samples"]) if run else []
+
+    def latest(self, key: int) -> tuple | None:
+        with self._lock:
+            run = self._runs.get(key)
+            return run["samples"][-1] if run and run["samples"] else None
+
+    def peaks(self, key: int) -> dict | None:
+        with self._lock:
+            run = self._runs.get(key)
+            return dict(run["peaks"]) if run else None
+
+    def set_interval(self, seconds: float):
+        self.interval = max(0.1, seconds)
+        self._wake.set()
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+
+    def _loop(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            with self._lock:
+                roots = {key: run["pid"] for key, run in self._runs.items()}
+            if not roots:
+                continue
+            try:
+                with METRICS.timer("resource.sample"):
+                    totals = self._reader.totals(roots.values())
+            except Exception:
+                continue
+            now = time.monotonic()
+            with self._lock:
+                for key, pid in roots.items():
+                    run = self._runs.get(key)
+                    if run is None or pid not in totals:
+                        continue
+                    cpu_s, rss, read, write = totals[pid]
+                    last, run["last"] = run["last"], (now, cpu_s, read, write)
+                    if last is None:   # rates need two readings; memory doesn't
+                        run["peaks"]["peak_rss"] = max(run["peaks"]["peak_rss"], rss)
+                        continue
+                    dt = max(now - last[0], 1e-6)
+                    sample = (time.time(), max(0.0, (cpu_s - last[1]) / dt * 100), rss,
+                              max(0.0, (read - last[2]) / dt), max(0.0, (write - last[3]) / dt))
+                    run["samples"].append(sample)
+                    peaks = run["peaks"]
+                    for name, value in zip(("peak_cpu", "peak_rss", "peak_read_bps", "peak_write_bps"), sample[1:]):
+                        if value > peaks[name]:
+                            peaks[name] = value
+
+# ====================== MOD RECORDS ======================
+_intern = sys.intern
+
+class ModRecord:
+    """One mod as held in memory: a slotted record in MOD_COLUMNS order.
+
+    Fields read as attributes (r.name) or like a sqlite3.Row (r["name"],
+    keys()), so DB rows and records are interchangeable for callers.
+    Low-cardinality strings are interned so thousands of mods share one
+    "Ready"/category/version object. Measure with benchmarks/bench_mod_memory.py.
+    """
+    __slots__ = MOD_TABLE_FIELDS + ("run_count", "run_successes", "median_duration", "p95_duration",
+                                    "blend_version", "blend_compression")
+
+    def __init__(self, values):
+        (self.id, self.name, self.cover_path, self.bat_path, status, self.last_run, version, category,
+         self.blend_path, self.work_path, self.last_exit_code, self.last_duration, self.run_count,
+         self.run_successes, self.median_duration, self.p95_duration, blend_version, blend_compression) = values
+        self.status, self.version, self.category = _intern(status), _intern(version), _intern(category)
+        self.blend_version = blend_version and _intern(blend_version)
+        self.blend_compression = blend_compression and _intern(blend_compression)
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__slots__
+
+    def __iter__(self):
+        return (getattr(self, k) for k in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, ModRecord) and tuple(self) == tuple(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ModRecord(id={self.id!r}, name={self.name!r})"
+
+def _record_factory(_cursor, values) -> ModRecord:
+    return ModRecord(values)
+
+def name_key(name: str) -> str:
+    """Mod name as compared for lookups: case-folded, whitespace collapsed."""
+    return " ".join((name or "").casefold().split())
+
+class ModStore:
+    """The loaded mods in load order, indexed by id and by normalized name.
+
+    get()/position() are O(1); patch() swaps in a fresh copy of one mod
+    without rebuilding anything. Names are not unique: ids_named() returns
+    every mod that shares one.
+    """
+    def __init__(self, records=()):
+        self.load(records)
+
+    def load(self, records):
+        self.records: list[ModRecord] = list(records)
+        self._pos = {r.id: i for i, r in enumerate(self.records)}
+        self._names: dict[str, list[int]] = {}
+        for r in self.records:
+            self._names.setdefault(name_key(r.name), []).append(r.id)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def get(self, mod_id: int) -> ModRecord | None:
+        i = self._pos.get(mod_id)
+        return None if i is None else self.records[i]
+
+    def position(self, mod_id: int) -> int:
+        return self._pos.get(mod_id, -1)
+
+    def ids_named(self, name: str) -> list[int]:
+        return list(self._names.get(name_key(name), ()))
+
+    def patch(self, record: ModRecord) -> int:
+        """Replace the loaded copy of record's mod; returns its position, -1 if it isn't loaded."""
+        i = self._pos.get(record.id)
+        if i is None:
+            return -1
+        old_key, new_key = name_key(self.records[i].name), name_key(record.name)
+        if old_key != new_key:
+            ids = self._names[old_key]
+            ids.remove(record.id)
+            if not ids:
+                del self._names[old_key]
+            self._names.setdefault(new_key, []).append(record.id)
+        self.records[i] = record
+        return i
+
+# ====================== SEARCH ======================
+class ModSearchIndex:
+    """In-memory search over the loaded mods, same fields as mods_fts.
+
+    Every whitespace-separated term must appear (case-insensitive substring)
+    in one of name/version/category/bat_path/blend_path. filter() narrows the
+    previous result instead of rescanning when the new query extends the
+    last one (typing), so each keystroke only touches rows that still
+    matched. Results keep the load order (name ASC).
+    """
+    def __init__(self, rows=()):
+        self.load(rows)
+
+    def load(self, rows):
+        self.store = ModStore(rows)
+        self.rows = self.store.records
+        # one haystack per row; "\n" keeps terms from matching across fields
+        self._hay = [self._haystack(r) for r in self.rows]
+        self._cats = [r.category or "" for r in self.rows]
+        self._last_key = None
+        self._last_hits: list[int] = []
+
+    @staticmethod
+    def _haystack(r) -> str:
+        return "\n".join((r[c] or "") for c in FTS_COLUMNS).lower()
+
+    def update_row(self, row) -> bool:
+        """Replace the loaded copy of one mod in place (O(1)); False if it isn't loaded."""
+        i = self.store.patch(row)
+        if i < 0:
+            return False
+        hay, cat = self._haystack(row), row.category or ""
+        if hay != self._hay[i] or cat != self._cats[i]:
+            self._hay[i], self._cats[i] = hay, cat
+            self._last_key = None   # cached hits may no longer hold
+        return True
+
+    def apply(self, records, deleted_ids=()) -> bool:
+        """Fold fresh copies of changed mods (new ones included) and deleted ids into the index.
+
+        Edits that keep a mod's name are patched in place; inserts, deletes
+        and renames rebuild the index in (name, id) order. Returns True when
+        the set or order of rows changed.
+        """
+        records = list(records)
+        deleted = {i for i in deleted_ids if self.store.get(i) is not None}
+        structural = bool(deleted) or any(
+            (old := self.store.get(r.id)) is None or old.name != r.name for r in records)
+        if not structural:
+            for r in records:
+                self.update_row(r)
+            return False
+        fresh = {r.id: r for r in records}
+        rows = [fresh.pop(r.id, r) for r in self.rows if r.id not in deleted]
+        rows += fresh.values()
+        rows.sort(key=lambda r: (r.name, r.id))
+        self.load(rows)
+        return True
+
+    def filter(self, query: str = "", category: str | None = None) -> list:
+        q = " ".join(query.lower().split())
+        terms = q.split()
+        cat = None if not category or category.lower() == "__all__" else category
+        last = self._last_key
+        hay = self._hay
+        if last is not None and last[1] == cat and q.startswith(last[0]):
+            hits = self._last_hits
+            if q != last[0]:
+                for t in terms:
+                    hits = [i for i in hits if t in hay[i]]
+        else:
+            if cat is None:
+                hits = range(len(hay))
+            else:
+                cats = self._cats
+                hits = [i for i in range(len(hay)) if cats[i] == cat]
+            for t in terms:
+                hits = [i for i in hits if t in hay[i]]
+            hits = list(hits)
+        self._last_key, self._last_hits = (q, cat), hits
+        rows = self.rows
+        return [rows[i] for i in hits]